@@ -67,6 +67,17 @@ GRID_HEIGHT = BOARD_SIZE_Y * CELL_SIZE
 BOARD_OFFSET_X = 50  # Décalage par rapport au bord gauche
 BOARD_OFFSET_Y = 50  # Décalage par rapport au bord supérieur
 
+# --- Camera ---
+# Zone d'affichage du plateau : tout le plateau par défaut, bornée par l'écran et le panneau
+VIEWPORT_WIDTH = min(GRID_WIDTH, SCREEN_WIDTH - BOARD_OFFSET_X - INFO_PANEL_WIDTH - 10)
+VIEWPORT_HEIGHT = min(GRID_HEIGHT, SCREEN_HEIGHT - BOARD_OFFSET_Y - 10)
+CAMERA_ZOOM_MIN = 0.05  # Un plateau de plusieurs centaines de cases tient à l'écran
+CAMERA_ZOOM_MAX = 4.0
+CAMERA_ZOOM_STEP = 1.25  # Facteur par cran de molette / touche +-
+CAMERA_PAN_STEP = 0.25  # Fraction de la zone d'affichage par appui sur une touche de défilement
+LOD_GRID_MIN_CELL = 6  # En dessous de cette taille de case (pixels), pas de lignes de grille
+LOD_DETAIL_MIN_CELL = 10  # En dessous, systèmes en aplats sans contour ni marqueur
+
 # --- Systems ---
 SYSTEM_SIZE = 2  # Les systèmes occupent 2x2 cellules
 MIN_SYSTEM_DISTANCE = 4  # Distance minimale (en cellules, Chebyshev) entre centres de systèmes
@@ -76,12 +87,36 @@ NUM_PLANET_SYSTEMS = 4
 # --- Player & Movement ---
 MAX_TOTEMS_PER_PLAYER = 9
 MOVEMENT_POINTS_PER_TURN = 4
+MAX_PLAYERS = 7  # Un joueur par couleur d'origine
 
 # --- Factions & Totems ---
 FACTION_NAMES = ["A", "B", "C", "D", "E", "F"]
 
 # --- Game Rules ---
 MAX_TURNS = 40  # Fin du jeu après ce nombre de tours
+OBSERVER_REVEAL_SECONDS = 2  # Durée de la révélation temporaire de l'action Observer
+TURN_TIME_LIMIT = None  # Secondes par tour avant fin de tour automatique (None : pas de limite)
+FOG_OF_WAR = False  # Chaque joueur ne voit révélés que les systèmes qu'il a lui-même révélés ou observés
+
+# --- Route Planner ---
+PLANNER_WORK_BUDGET = 20000  # Transitions examinées au plus par itinéraire (quelques ms, une fraction d'image)
+PLANNER_MAX_SYSTEMS = 12  # Systèmes utiles retenus par le planificateur (les plus proches du vaisseau)
+
+# --- Main Loop ---
+FPS = 30  # Fréquence maximale d'images
+IDLE_MAIN_LOOP = True  # Bloque sur les événements au lieu de tourner à FPS constant
+PROFILER_ENABLED = False  # Chronométrage permanent ; sinon seulement pendant l'overlay (F3) ou une capture (F12)
+PROFILER_WINDOW = 300  # Nombre d'images conservées pour les percentiles glissants
+
+# --- Game Server ---
+SERVER_HOST = "127.0.0.1"
+SERVER_PORT = 8765
+SERVER_MAX_GAMES = 10000  # Parties hébergées simultanément au maximum
+SERVER_GAME_QUEUE = 64  # Commandes en attente par partie avant de faire patienter les clients
+SERVER_MAX_INFLIGHT = 8  # Requêtes sans réponse par client avant d'arrêter de le lire
+SERVER_SEND_QUEUE = 256  # Messages en attente d'envoi au-delà desquels un client lent est déconnecté
+SERVER_SHUTDOWN_TIMEOUT = 5.0  # Secondes laissées aux parties pour traiter leurs commandes à l'arrêt
+SYNC_KEYFRAME_TURNS = 5  # Image clé de synchronisation (clients en cours de partie) tous les N tours
 
 # --- Game States ---
 STATE_RUNNING = "RUNNING"
@@ -89,3 +124,8 @@ STATE_GAME_OVER = "GAME_OVER"
 STATE_PLAYER_TURN = "PLAYER_TURN"
 STATE_WAITING_INPUT = "WAITING_INPUT"
 STATE_MOVING = "MOVING"
+
+# --- Player Status ---
+PLAYER_ACTIVE = "ACTIVE"
+PLAYER_ABANDONED = "ABANDONED"
+PLAYER_ELIMINATED = "ELIMINATED"
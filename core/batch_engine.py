@@ -0,0 +1,333 @@
+# core/batch_engine.py
+"""
+Moteur de règles vectorisé : K parties stockées en tableaux NumPy
+(structure de tableaux) et avancées d'une action chacune par appel à step().
+
+Les règles reproduisent celles de core.game_state.Game (déplacement pas à pas,
+Récolter, Déposer, Influencer, fin de tour, fin de partie) ; l'action Observer,
+purement visuelle et temporisée, n'est pas modélisée.
+
+Encodage :
+  - couleurs et factions par leur indice dans SYSTEM_COLORS et FACTION_NAMES ;
+  - un totem est codé faction * NUM_COLORS + couleur (-1 pour une case vide) ;
+  - la pile de totems d'une faction dans un rack est une file circulaire
+    (le totem récolté est le plus ancien, un dépôt s'ajoute à la fin),
+    ce qui reproduit exactement les files par faction de core.rack.Rack ;
+  - les cartes d'un rack forment un anneau (card_top), comme Rack.faction_cards.
+"""
+import numpy as np
+
+from config import (FACTIONS, FACTION_NAMES, SYSTEM_COLORS, MAX_TOTEMS_PER_PLAYER,
+                    MOVEMENT_POINTS_PER_TURN, MAX_TURNS, STATE_GAME_OVER)
+from core.policies import DIRECTIONS
+
+NUM_COLORS = len(SYSTEM_COLORS)
+NUM_FACTIONS = len(FACTION_NAMES)
+COLOR_INDEX = {color: i for i, color in enumerate(SYSTEM_COLORS)}
+FACTION_INDEX = {faction_id: i for i, faction_id in enumerate(FACTION_NAMES)}
+FACTION_VALUES = np.array([FACTIONS[f]["valeur"] for f in FACTION_NAMES], dtype=np.int32)
+DIRECTION_DELTAS = np.array(DIRECTIONS, dtype=np.int16)
+
+# Capacité d'une file (rack, faction) : tous les totems d'une faction tiennent dans un rack
+QUEUE_SIZE = 3 * NUM_COLORS
+
+# --- Codes d'action pour step() ---
+ACTION_NONE = 0
+ACTION_MOVE = 1  # arg : indice de direction dans DIRECTIONS
+ACTION_HARVEST = 2
+ACTION_DEPOSIT = 3  # arg : indice du totem dans l'inventaire
+ACTION_INFLUENCE = 4
+ACTION_END_TURN = 5
+
+
+class BatchEngine:
+    """K parties solo avancées simultanément par opérations vectorisées."""
+
+    def __init__(self, num_games, size_x, size_y, num_systems, num_cards):
+        k = num_games
+        self.num_games = k
+        self.size_x = size_x
+        self.size_y = size_y
+        # Vaisseau et état du tour
+        self.ship_pos = np.zeros((k, 2), dtype=np.int16)
+        self.movement_points = np.zeros(k, dtype=np.int8)
+        self.movement_used = np.zeros(k, dtype=bool)
+        self.recolter_used = np.zeros(k, dtype=bool)
+        self.deposer_used = np.zeros(k, dtype=bool)
+        self.influencer_used = np.zeros(k, dtype=bool)
+        self.turn_count = np.zeros(k, dtype=np.int16)
+        self.base_score = np.zeros(k, dtype=np.int32)
+        self.game_over = np.zeros(k, dtype=bool)
+        self.won = np.zeros(k, dtype=bool)
+        self.origin_color = np.zeros(k, dtype=np.int8)
+        # Plateau : indice du système par case (-1 si vide)
+        self.occupancy = np.full((k, size_x, size_y), -1, dtype=np.int16)
+        self.system_color = np.zeros((k, num_systems), dtype=np.int8)
+        self.system_capital = np.zeros((k, num_systems), dtype=bool)
+        self.revealed = np.zeros((k, num_systems), dtype=bool)
+        # Racks : files de totems par (couleur du rack, faction) et compteurs par couleur de totem
+        self.rack_queue = np.full((k, NUM_COLORS, NUM_FACTIONS, QUEUE_SIZE), -1, dtype=np.int8)
+        self.rack_head = np.zeros((k, NUM_COLORS, NUM_FACTIONS), dtype=np.int16)
+        self.rack_len = np.zeros((k, NUM_COLORS, NUM_FACTIONS), dtype=np.int16)
+        self.rack_counts = np.zeros((k, NUM_COLORS, NUM_FACTIONS, NUM_COLORS), dtype=np.int16)
+        # Cartes Relation-Faction : pile tournante par rack
+        self.cards = np.zeros((k, NUM_COLORS, num_cards), dtype=np.int8)
+        self.card_top = np.zeros((k, NUM_COLORS), dtype=np.int16)
+        self.card_count = np.zeros((k, NUM_COLORS), dtype=np.int16)
+        # Inventaire du joueur (ordre conservé) et compteurs (faction, couleur)
+        self.inventory = np.full((k, MAX_TOTEMS_PER_PLAYER), -1, dtype=np.int8)
+        self.inventory_len = np.zeros(k, dtype=np.int16)
+        self.player_counts = np.zeros((k, NUM_FACTIONS, NUM_COLORS), dtype=np.int16)
+
+    @classmethod
+    def from_games(cls, games):
+        """Construit le lot à partir de parties objet solo déjà initialisées (setup_game)."""
+        if any(game.num_players != 1 for game in games):
+            raise ValueError("BatchEngine only supports single-player games.")
+        first = games[0].game_board
+        num_systems = max(len(g.game_board.systems) for g in games)
+        num_cards = max(len(rack.faction_cards) for g in games for rack in g.system_racks.values())
+        engine = cls(len(games), first.size_x, first.size_y, num_systems, max(1, num_cards))
+        for k, game in enumerate(games):
+            engine._load_game(k, game)
+        return engine
+
+    def _load_game(self, k, game):
+        board = game.game_board
+        player = game.get_player()
+        for index, system in enumerate(board.systems):
+            self.system_color[k, index] = COLOR_INDEX[system.couleur]
+            self.system_capital[k, index] = system.est_capitale
+            self.revealed[k, index] = system.revealed
+        for x, y in board.get_all_system_positions():
+            self.occupancy[k, x, y] = board.systems.index(board.get_system_at((x, y)))
+        for color, rack in game.system_racks.items():
+            r = COLOR_INDEX[color]
+            for totem in rack.totems:
+                self._rack_push(k, r, FACTION_INDEX[totem.faction_id], COLOR_INDEX[totem.couleur])
+            for i, card in enumerate(rack.faction_cards):
+                self.cards[k, r, i] = FACTION_INDEX[card.faction_id]
+            self.card_count[k, r] = len(rack.faction_cards)
+        for totem in player.totems:
+            f, c = FACTION_INDEX[totem.faction_id], COLOR_INDEX[totem.couleur]
+            self.inventory[k, self.inventory_len[k]] = f * NUM_COLORS + c
+            self.inventory_len[k] += 1
+            self.player_counts[k, f, c] += 1
+        self.ship_pos[k] = player.vaisseau.position
+        self.movement_points[k] = player.vaisseau.movement_points_remaining
+        self.movement_used[k] = game.movement_used
+        self.recolter_used[k] = game.action_recolter_used
+        self.deposer_used[k] = game.action_deposer_used
+        self.influencer_used[k] = game.action_influencer_used
+        self.turn_count[k] = game.turn_count
+        self.base_score[k] = player.score
+        self.game_over[k] = game.game_state == STATE_GAME_OVER
+        self.won[k] = game.winner is not None
+        self.origin_color[k] = COLOR_INDEX[player.origin_system_color]
+
+    def _rack_push(self, k, r, f, c):
+        self.rack_queue[k, r, f, (self.rack_head[k, r, f] + self.rack_len[k, r, f]) % QUEUE_SIZE] = c
+        self.rack_len[k, r, f] += 1
+        self.rack_counts[k, r, f, c] += 1
+
+    # --- Requêtes vectorisées ---
+
+    def systems_at(self, idx, pos):
+        """Indice du système couvrant pos pour les parties idx (-1 si hors système ou hors plateau)."""
+        x, y = pos[:, 0], pos[:, 1]
+        inside = (x >= 0) & (x < self.size_x) & (y >= 0) & (y < self.size_y)
+        found = self.occupancy[idx, np.clip(x, 0, self.size_x - 1), np.clip(y, 0, self.size_y - 1)]
+        return np.where(inside, found, -1)
+
+    def top_factions(self, idx, racks):
+        """Faction de la carte visible des racks donnés."""
+        return self.cards[idx, racks, self.card_top[idx, racks]]
+
+    def bonus_scores(self):
+        """Équivalent vectorisé de Player.calculate_score()."""
+        counts = self.player_counts
+        totems = (counts.sum(axis=2) * FACTION_VALUES).sum(axis=1)
+        color_groups = (counts.sum(axis=1) >= 3).sum(axis=1)
+        faction_groups = (counts.sum(axis=2) >= 3).sum(axis=1)
+        return totems + 1000 * color_groups + 10.0 * faction_groups
+
+    def victory_conditions(self):
+        """Équivalent vectorisé de Player.check_victory_conditions()."""
+        present = self.player_counts > 0
+        all_factions = present.any(axis=2).all(axis=1)
+        all_colors = present.any(axis=1).all(axis=1)
+        color_three_factions = (present.sum(axis=1) >= 3).any(axis=1)
+        faction_three_colors = (present.sum(axis=2) >= 3).any(axis=1)
+        return all_factions | all_colors | color_three_factions | faction_three_colors
+
+    # --- Actions ---
+
+    def step(self, actions, args=None):
+        """
+        Applique une action par partie (codes ACTION_*) et renvoie le tableau
+        des succès. Les parties terminées ignorent leur action.
+        """
+        actions = np.asarray(actions)
+        args = np.zeros(self.num_games, dtype=np.int16) if args is None else np.asarray(args)
+        success = np.zeros(self.num_games, dtype=bool)
+        active = ~self.game_over
+        for code, handler, uses_arg in ((ACTION_MOVE, self._move, True),
+                                        (ACTION_HARVEST, self._harvest, False),
+                                        (ACTION_DEPOSIT, self._deposit, True),
+                                        (ACTION_INFLUENCE, self._influence, False),
+                                        (ACTION_END_TURN, self._end_turn, False)):
+            idx = np.flatnonzero(active & (actions == code))
+            if idx.size:
+                success[idx] = handler(idx, args[idx]) if uses_arg else handler(idx)
+        return success
+
+    def _current_systems(self, idx):
+        """Système sous le vaisseau, s'il est révélé (-1 sinon)."""
+        systems = self.systems_at(idx, self.ship_pos[idx])
+        revealed = self.revealed[idx, np.maximum(systems, 0)]
+        return np.where((systems >= 0) & revealed, systems, -1)
+
+    def _move(self, idx, directions):
+        pos = self.ship_pos[idx]
+        target = pos + DIRECTION_DELTAS[directions]
+        current = self.systems_at(idx, pos)
+        target_system = self.systems_at(idx, target)
+        inside = ((target[:, 0] >= 0) & (target[:, 0] < self.size_x) &
+                  (target[:, 1] >= 0) & (target[:, 1] < self.size_y))
+        ok = (~self.movement_used[idx] & ~((current >= 0) & (target_system == current)) &
+              (self.movement_points[idx] >= 1) & inside)
+        moved = idx[ok]
+        self.ship_pos[moved] = target[ok]
+        self.movement_points[moved] -= 1
+        entered = ok & (target_system >= 0)
+        stopped = idx[entered]
+        self.movement_points[stopped] = 0
+        self.revealed[stopped, target_system[entered]] = True
+        self.movement_used[stopped] = True
+        return ok
+
+    def _harvest(self, idx):
+        systems = self._current_systems(idx)
+        racks = self.system_color[idx, np.maximum(systems, 0)].astype(np.intp)
+        factions = self.top_factions(idx, racks).astype(np.intp)
+        ok = ((~self.recolter_used[idx]) & (systems >= 0) & (self.card_count[idx, racks] > 0) &
+              (self.rack_len[idx, racks, factions] > 0) &
+              (self.inventory_len[idx] < MAX_TOTEMS_PER_PLAYER))
+        g, r, f = idx[ok], racks[ok], factions[ok]
+        head = self.rack_head[g, r, f]
+        colors = self.rack_queue[g, r, f, head].astype(np.intp)
+        self.rack_head[g, r, f] = (head + 1) % QUEUE_SIZE
+        self.rack_len[g, r, f] -= 1
+        self.rack_counts[g, r, f, colors] -= 1
+        self.inventory[g, self.inventory_len[g]] = f * NUM_COLORS + colors
+        self.inventory_len[g] += 1
+        self.player_counts[g, f, colors] += 1
+        self.recolter_used[g] = True
+        return ok
+
+    def _deposit(self, idx, slots):
+        systems = self._current_systems(idx)
+        ok = (~self.deposer_used[idx]) & (systems >= 0) & (slots >= 0) & (slots < self.inventory_len[idx])
+        g, s = idx[ok], slots[ok].astype(np.intp)
+        racks = self.system_color[g, systems[ok]].astype(np.intp)
+        codes = self.inventory[g, s].astype(np.intp)
+        f, c = codes // NUM_COLORS, codes % NUM_COLORS
+        tail = (self.rack_head[g, racks, f] + self.rack_len[g, racks, f]) % QUEUE_SIZE
+        self.rack_queue[g, racks, f, tail] = c
+        self.rack_len[g, racks, f] += 1
+        self.rack_counts[g, racks, f, c] += 1
+        # Retrait du totem en conservant l'ordre de l'inventaire ; les totems étant
+        # des poids-mouches, Player.remove_totem retire la première occurrence identique
+        inventory = self.inventory[g]
+        s = np.argmax(inventory == codes[:, None], axis=1)
+        shifted = np.concatenate([inventory[:, 1:], np.full((len(g), 1), -1, dtype=np.int8)], axis=1)
+        after = np.arange(MAX_TOTEMS_PER_PLAYER) >= s[:, None]
+        self.inventory[g] = np.where(after, shifted, inventory)
+        self.inventory_len[g] -= 1
+        self.player_counts[g, f, c] -= 1
+        self.deposer_used[g] = True
+        return ok
+
+    def _influence(self, idx):
+        systems = self._current_systems(idx)
+        safe = np.maximum(systems, 0)
+        racks = self.system_color[idx, safe].astype(np.intp)
+        counts = self.card_count[idx, racks]
+        ok = (~self.influencer_used[idx]) & (systems >= 0) & self.system_capital[idx, safe] & (counts > 1)
+        g, r = idx[ok], racks[ok]
+        self.card_top[g, r] = (self.card_top[g, r] + 1) % counts[ok]
+        self.influencer_used[g] = True
+        return ok
+
+    def _end_turn(self, idx):
+        self.base_score[idx] = np.maximum(0, self.base_score[idx] - 200)
+        self.turn_count[idx] += 1
+        self.movement_points[idx] = MOVEMENT_POINTS_PER_TURN
+        for flags in (self.movement_used, self.recolter_used, self.deposer_used, self.influencer_used):
+            flags[idx] = False
+        timeout = self.turn_count[idx] > MAX_TURNS
+        systems = self.systems_at(idx, self.ship_pos[idx])
+        safe = np.maximum(systems, 0)
+        on_origin = ((systems >= 0) & self.system_capital[idx, safe] &
+                     (self.system_color[idx, safe] == self.origin_color[idx]))
+        victory = ~timeout & on_origin & self.victory_conditions()[idx]
+        self.game_over[idx] = timeout | victory
+        self.won[idx] = victory
+        return np.ones(len(idx), dtype=bool)
+
+    # --- Inspection ---
+
+    def game_summary(self, k):
+        """État normalisé de la partie k, comparable à summarize_game()."""
+        racks = {}
+        for r in range(NUM_COLORS):
+            queues = {}
+            for f in range(NUM_FACTIONS):
+                head, length = self.rack_head[k, r, f], self.rack_len[k, r, f]
+                if length:
+                    queues[f] = [int(self.rack_queue[k, r, f, (head + i) % QUEUE_SIZE]) for i in range(length)]
+            count = self.card_count[k, r]
+            top = self.card_top[k, r]
+            cards = [int(self.cards[k, r, (top + i) % count]) for i in range(count)] if count else []
+            racks[r] = (queues, cards)
+        inventory = [(int(code) // NUM_COLORS, int(code) % NUM_COLORS)
+                     for code in self.inventory[k, :self.inventory_len[k]]]
+        return {
+            "ship": tuple(int(v) for v in self.ship_pos[k]),
+            "movement_points": int(self.movement_points[k]),
+            "flags": (bool(self.movement_used[k]), bool(self.recolter_used[k]),
+                      bool(self.deposer_used[k]), bool(self.influencer_used[k])),
+            "revealed": [bool(v) for v in self.revealed[k]],
+            "racks": racks,
+            "inventory": inventory,
+            "turn": int(self.turn_count[k]),
+            "score": (int(self.base_score[k]), float(self.bonus_scores()[k])),
+            "victory": bool(self.victory_conditions()[k]),
+            "game_over": bool(self.game_over[k]),
+            "won": bool(self.won[k]),
+        }
+
+
+def summarize_game(game):
+    """État normalisé d'une partie objet, au format de BatchEngine.game_summary()."""
+    player = game.get_player()
+    racks = {}
+    for color, rack in game.system_racks.items():
+        queues = {}
+        for totem in rack.totems:
+            queues.setdefault(FACTION_INDEX[totem.faction_id], []).append(COLOR_INDEX[totem.couleur])
+        racks[COLOR_INDEX[color]] = (queues, [FACTION_INDEX[c.faction_id] for c in rack.faction_cards])
+    return {
+        "ship": tuple(player.vaisseau.position),
+        "movement_points": player.vaisseau.movement_points_remaining,
+        "flags": (game.movement_used, game.action_recolter_used,
+                  game.action_deposer_used, game.action_influencer_used),
+        "revealed": [system.revealed for system in game.game_board.systems],
+        "racks": racks,
+        "inventory": [(FACTION_INDEX[t.faction_id], COLOR_INDEX[t.couleur]) for t in player.totems],
+        "turn": game.turn_count,
+        "score": (player.score, float(player.calculate_score())),
+        "victory": player.check_victory_conditions(),
+        "game_over": game.game_state == STATE_GAME_OVER,
+        "won": game.winner is not None,
+    }
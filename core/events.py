@@ -0,0 +1,269 @@
+# core/events.py
+"""
+Flux d'événements typés émis par le moteur de jeu.
+
+Le moteur n'écrit plus sur la console : il publie des événements sur un
+EventBus auquel on abonne des consommateurs (console, tampon circulaire,
+fichier JSON Lines). Sans abonné, emit() retourne immédiatement sans même
+construire l'événement, si bien que le coût est quasi nul en simulation.
+
+Convention : les valeurs sont passées brutes à emit(), jamais mises en forme
+par l'appelant. Les messages (Notice, ActionRejected) prennent un modèle
+str.format et ses arguments, mis en forme à la construction de l'événement,
+donc seulement s'il y a des abonnés.
+"""
+import collections
+import json
+import sys
+
+from config import COLOR_NAME_MAP, MAX_TURNS
+
+
+class GameEvent:
+    """Classe de base : champs déclarés dans __slots__, texte console via describe()."""
+
+    __slots__ = ()
+    kind = "event"
+
+    def __init__(self, *values):
+        for name, value in zip(self.__slots__, values):
+            setattr(self, name, value)
+
+    def describe(self):
+        return self.kind
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class SystemsPlaced(GameEvent):
+    __slots__ = ('placed', 'total')
+    kind = "systems_placed"
+
+    def describe(self):
+        return f"Successfully placed {self.placed} out of {self.total} systems."
+
+
+class ShipMoved(GameEvent):
+    __slots__ = ('position', 'points_left', 'entered_system')
+    kind = "moved"
+
+    def describe(self):
+        text = f"Moved to {self.position}. Points left: {self.points_left}"
+        if self.entered_system:
+            text += f"\nEntered system at {self.position}. Movement ends."
+        return text
+
+
+class SystemRevealed(GameEvent):
+    __slots__ = ('position', 'couleur', 'est_capitale', 'temporary')
+    kind = "revealed"
+
+    def describe(self):
+        if self.temporary:
+            return f"Observer: Système temporairement révélé à {self.position}."
+        return (f"System at {self.position} revealed: Color {self.couleur}, "
+                f"Type: {'Capitale' if self.est_capitale else 'Planete'}")
+
+
+class SystemHidden(GameEvent):
+    __slots__ = ('position',)
+    kind = "hidden"
+
+    def describe(self):
+        return f"Observer: Masquage du système à {self.position}."
+
+
+class FactionCardRevealed(GameEvent):
+    __slots__ = ('rack_color', 'faction_id')
+    kind = "card_revealed"
+
+    def describe(self):
+        if self.faction_id is None:
+            return f"  Rack {self.rack_color}: No faction cards to reveal."
+        return f"  Rack {self.rack_color}: Top Faction Card revealed -> {self.faction_id}"
+
+
+class TotemHarvested(GameEvent):
+    __slots__ = ('totem', 'rack_color')
+    kind = "harvested"
+
+    def describe(self):
+        return f"Action Récolter successful: Player took {self.totem} from rack {self.rack_color}"
+
+
+class TotemDeposited(GameEvent):
+    __slots__ = ('totem', 'rack_color')
+    kind = "deposited"
+
+    def describe(self):
+        return f"Action Déposer successful: Player deposited {self.totem} into rack {self.rack_color}"
+
+
+class RackInfluenced(GameEvent):
+    __slots__ = ('rack_color', 'faction_id')
+    kind = "influenced"
+
+    def describe(self):
+        return f"Action Influencer successful: New top faction for {self.rack_color}: {self.faction_id}"
+
+
+class TurnStarted(GameEvent):
+    """player_id vaut None en partie solo."""
+    __slots__ = ('turn', 'player_id')
+    kind = "turn_started"
+
+    def describe(self):
+        if self.player_id is None:
+            return f"\n--- Turn {self.turn}/{MAX_TURNS} ---"
+        return f"\n--- Turn {self.turn}/{MAX_TURNS} - Player {self.player_id} ---"
+
+
+class TurnEnded(GameEvent):
+    __slots__ = ('penalty', 'score')
+    kind = "turn_ended"
+
+    def describe(self):
+        return f"Pénalité de fin de tour : -{self.penalty} points. Score actuel : {self.score}"
+
+
+class PlayerLeft(GameEvent):
+    """Joueur retiré de l'ordre de jeu (status : PLAYER_ABANDONED ou PLAYER_ELIMINATED)."""
+    __slots__ = ('player_id', 'status')
+    kind = "player_left"
+
+    def describe(self):
+        return f"Player {self.player_id} leaves the game ({self.status.lower()})."
+
+
+class GameOver(GameEvent):
+    """
+    reason : "victory", "turn_limit" ou "abandon" (tous les autres joueurs ont abandonné).
+    other_scores : ((player_id, score), ...) des autres joueurs en partie multijoueur.
+    """
+    __slots__ = ('victory', 'player_id', 'score', 'turns', 'reason', 'other_scores')
+    kind = "game_over"
+
+    def describe(self):
+        if self.victory:
+            headline = "\n!!! VICTORY CONDITION MET !!! Player reached Origin System with winning totems!"
+        elif self.reason == "abandon":
+            headline = "\n!!! GAME OVER !!! All other players abandoned!"
+        else:
+            headline = f"\n!!! GAME OVER !!! Turn limit ({MAX_TURNS}) reached!"
+        lines = [f"{headline}\n\n--- Final Score ---",
+                 f"Player {self.player_id}: {self.score} points in {self.turns} turns."]
+        lines.extend(f"Player {player_id}: {score} points." for player_id, score in self.other_scores)
+        return "\n".join(lines)
+
+
+class ActionRejected(GameEvent):
+    """Action refusée ; reason est le message affiché au joueur (modèle mis en forme avec args)."""
+    __slots__ = ('action', 'reason')
+    kind = "rejected"
+
+    def __init__(self, action, reason, *args):
+        self.action = action
+        self.reason = reason.format(*args) if args else reason
+
+    def describe(self):
+        return self.reason
+
+
+class Notice(GameEvent):
+    """Message informatif sans donnée structurée (mise en place, mode Observer...) ; modèle et args."""
+    __slots__ = ('text',)
+    kind = "notice"
+
+    def __init__(self, text, *args):
+        self.text = text.format(*args) if args else text
+
+    def describe(self):
+        return self.text
+
+
+class EventBus:
+    """Diffuse les événements aux abonnés ; ne fait rien s'il n'y en a aucun."""
+
+    def __init__(self):
+        self.subscribers = []
+
+    def subscribe(self, subscriber):
+        """Abonne un appelable subscriber(event) et le renvoie."""
+        self.subscribers.append(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        self.subscribers.remove(subscriber)
+
+    def emit(self, event_type, *values):
+        """Construit event_type(*values) et le diffuse, seulement s'il y a des abonnés."""
+        if not self.subscribers:
+            return
+        event = event_type(*values)
+        for subscriber in self.subscribers:
+            subscriber(event)
+
+
+# --- Abonnés ---
+
+class ConsoleSubscriber:
+    """Affiche chaque événement comme le faisaient les anciens print."""
+
+    def __init__(self, stream=None):
+        self.stream = stream
+
+    def __call__(self, event):
+        print(event.describe(), file=self.stream or sys.stdout)
+
+
+class RingBufferSubscriber:
+    """Conserve les derniers événements en mémoire (capacité bornée)."""
+
+    def __init__(self, capacity=1024):
+        self.events = collections.deque(maxlen=capacity)
+
+    def __call__(self, event):
+        self.events.append(event)
+
+
+def _jsonable(value):
+    # Seules les couleurs connues sont nommées : une coordonnée (x, y, z) reste une liste
+    if (isinstance(value, tuple) and len(value) == 3 and all(isinstance(v, int) for v in value)
+            and value in COLOR_NAME_MAP):
+        return COLOR_NAME_MAP[value]
+    if isinstance(value, (tuple, list)):
+        return [_jsonable(v) for v in value]
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return repr(value)
+
+
+def event_record(event):
+    """Dictionnaire sérialisable en JSON d'un événement (couleurs nommées)."""
+    record = {"event": event.kind}
+    record.update({name: _jsonable(value) for name, value in event.as_dict().items()})
+    return record
+
+
+class FileSubscriber:
+    """Écrit un événement JSON par ligne dans un fichier (ou un flux ouvert)."""
+
+    def __init__(self, path_or_stream):
+        if hasattr(path_or_stream, "write"):
+            self.stream = path_or_stream
+            self._owns_stream = False
+        else:
+            self.stream = open(path_or_stream, "a", encoding="utf-8")
+            self._owns_stream = True
+
+    def __call__(self, event):
+        self.stream.write(json.dumps(event_record(event), ensure_ascii=False) + "\n")
+
+    def close(self):
+        if self._owns_stream:
+            self.stream.close()
@@ -2,23 +2,54 @@
 """
 Manages the game board, systems, and their placement and drawing.
 """
+import math
 import pygame
 import random
-from config import (CELL_SIZE, SYSTEM_SIZE,
+from core.events import EventBus, SystemsPlaced, SystemRevealed
+from core.pathfinding import SystemBitboard
+from config import (SYSTEM_SIZE, MOVEMENT_POINTS_PER_TURN,
                     MIN_SYSTEM_DISTANCE, WHITE, GRAY, DARK_GRAY,
-                    BOARD_OFFSET_X, BOARD_OFFSET_Y, YELLOW, BLACK, RED)
+                    YELLOW, BLACK, RED)
+
+
+class PlacementError(RuntimeError):
+    """Levée quand des systèmes ne peuvent pas être placés sur le plateau."""
+
+    def __init__(self, unplaced, placed_count):
+        self.unplaced = unplaced  # Systèmes restés sans position
+        self.placed_count = placed_count
+        super().__init__(
+            f"Could not place {len(unplaced)} out of {placed_count + len(unplaced)} systems "
+            f"(board too small for MIN_SYSTEM_DISTANCE={MIN_SYSTEM_DISTANCE}).")
 
 
 class GameBoard:
     """Represents the game board grid and the systems placed on it."""
 
-    def __init__(self, size_x, size_y):
-        # La grille peut être utilisée pour des calculs futurs (pathfinding, collisions)
+    def __init__(self, size_x, size_y, headless=False):
+        # Index d'occupation : chaque case couverte par un système pointe vers lui
         self.grid = [[None for _ in range(size_y)] for _ in range(size_x)]
+        self.occupied_cells = set()  # Ensemble des cases couvertes, tenu à jour avec la grille
+        # Seaux de MIN_SYSTEM_DISTANCE cases de côté pour la règle de distance :
+        # un voisin trop proche se trouve forcément dans l'un des 3x3 seaux voisins.
+        self.system_buckets = {}
+        self.layout_version = 0  # Incrémenté à chaque changement de disposition (caches de chemins)
+        self.journal = None  # UndoJournal de la partie, si elle en utilise un
+        self.events = EventBus()  # Remplacé par le bus de la partie
         self.systems = []  # Liste des objets SystemePlanetaire
+        # Visibilité en bitset : le bit i de revealed_mask vaut 1 si systems[i] est révélé.
+        # Les masques se combinent mot à mot (&, |, ^) : vue d'un joueur, systèmes cachés, ...
+        self.revealed_mask = 0
+        self.capitals = {}  # Couleur -> système Capitale de la couleur
+        self.planets = {}  # Couleur -> systèmes Planète de la couleur
+        self.color_masks = {}  # Couleur -> bits de tous les systèmes de la couleur
+        self.capitals_mask = 0  # Bits des systèmes Capitale
+        self._travel_turns = None  # Matrice des tours entre systèmes (voir travel_turns)
+        self._travel_turns_version = None
         self.size_x = size_x
         self.size_y = size_y
-        self.font = pygame.font.Font(None, 16)  # Pour dessiner des textes (optionnel)
+        # Pour dessiner des textes (optionnel) ; aucune police en mode headless
+        self.font = None if headless else pygame.font.Font(None, 16)
 
     def place_system(self, systeme, position):
         """
@@ -27,12 +58,77 @@ class GameBoard:
         """
         if self.is_position_valid(position):
             systeme.position = position
+            systeme.index = len(self.systems)
+            systeme.board = self
             self.systems.append(systeme)
-            # Marquer la cellule en haut à gauche dans la grille (optionnel)
-            self.grid[position[0]][position[1]] = systeme
+            bit = 1 << systeme.index
+            couleur = systeme.couleur
+            self.color_masks[couleur] = self.color_masks.get(couleur, 0) | bit
+            if systeme.est_capitale:
+                self.capitals[couleur] = systeme
+                self.capitals_mask |= bit
+            else:
+                self.planets.setdefault(couleur, []).append(systeme)
+            if systeme.revealed:
+                self.revealed_mask |= bit
+            # Marquer toutes les cases couvertes par le système dans l'index
+            sx, sy = position
+            for x in range(sx, min(sx + SYSTEM_SIZE, self.size_x)):
+                for y in range(sy, min(sy + SYSTEM_SIZE, self.size_y)):
+                    self.grid[x][y] = systeme
+                    self.occupied_cells.add((x, y))
+            bucket = (sx // MIN_SYSTEM_DISTANCE, sy // MIN_SYSTEM_DISTANCE)
+            self.system_buckets.setdefault(bucket, []).append(position)
+            self.layout_version += 1
             return True
         return False
 
+    def clear_systems(self):
+        """Retire tous les systèmes du plateau et vide l'index d'occupation."""
+        for x, y in self.occupied_cells:
+            self.grid[x][y] = None
+        self.occupied_cells.clear()
+        self.system_buckets = {}
+        for system in self.systems:
+            system.board = system.index = None
+        self.systems = []
+        self.revealed_mask = 0
+        self.capitals = {}
+        self.planets = {}
+        self.color_masks = {}
+        self.capitals_mask = 0
+        self.layout_version += 1
+
+    @property
+    def all_mask(self):
+        """Bits de tous les systèmes placés."""
+        return (1 << len(self.systems)) - 1
+
+    def hidden_mask(self):
+        """Bits des systèmes encore cachés."""
+        return self.all_mask & ~self.revealed_mask
+
+    def systems_in(self, mask):
+        """Systèmes dont le bit vaut 1 dans mask, par index croissant (un tour par bit à 1)."""
+        systems = self.systems
+        selected = []
+        while mask:
+            low = mask & -mask
+            selected.append(systems[low.bit_length() - 1])
+            mask ^= low
+        return selected
+
+    def is_color_revealed(self, couleur, view=None):
+        """
+        Vrai si la Capitale de la couleur est révélée, en O(1). view : masque de
+        visibilité d'un joueur (brouillard de guerre), revealed_mask par défaut.
+        """
+        capital = self.capitals.get(couleur)
+        if capital is None:
+            return False
+        mask = self.revealed_mask if view is None else view
+        return bool(mask >> capital.index & 1)
+
     def is_position_valid(self, position):
         """Vérifie que la position est dans les limites du plateau."""
         x, y = position
@@ -41,102 +137,183 @@ class GameBoard:
     def get_system_at(self, position):
         """
         Renvoie le système occupant la case donnée, si présent.
-        Puisque les systèmes sont de 2x2, on vérifie s'ils couvrent la case.
+        Lecture directe dans l'index d'occupation (O(1)).
         """
-        for system in self.systems:
-            if system.position:
-                sx, sy = system.position
-                if sx <= position[0] < sx + SYSTEM_SIZE and \
-                        sy <= position[1] < sy + SYSTEM_SIZE:
-                    return system
+        x, y = position
+        if 0 <= x < self.size_x and 0 <= y < self.size_y:
+            return self.grid[x][y]
         return None
 
     def get_all_system_positions(self):
-        """Renvoie l'ensemble des cellules occupées par les systèmes."""
-        occupied = set()
-        for system in self.systems:
-            if system.position:
-                sx, sy = system.position
-                for dx in range(SYSTEM_SIZE):
-                    for dy in range(SYSTEM_SIZE):
-                        occupied.add((sx + dx, sy + dy))
-        return occupied
+        """
+        Renvoie l'ensemble des cellules occupées par les systèmes.
+        L'ensemble est maintenu par l'index : ne pas le modifier.
+        """
+        return self.occupied_cells
 
     def check_distance_rule(self, potential_pos):
         """
         Vérifie que le placement d'un système à potential_pos respecte la
         règle de distance minimale (distance Chebyshev entre centres >= MIN_SYSTEM_DISTANCE).
+        Tous les systèmes ayant la même taille, la distance entre centres est celle
+        entre coins supérieurs gauches ; seuls les 3x3 seaux voisins sont consultés.
         """
-        center_x1 = potential_pos[0] + SYSTEM_SIZE / 2.0
-        center_y1 = potential_pos[1] + SYSTEM_SIZE / 2.0
-
-        for existing_system in self.systems:
-            if existing_system.position:
-                ex, ey = existing_system.position
-                center_x2 = ex + SYSTEM_SIZE / 2.0
-                center_y2 = ey + SYSTEM_SIZE / 2.0
-                distance = max(abs(center_x1 - center_x2), abs(center_y1 - center_y2))
-                if distance < MIN_SYSTEM_DISTANCE:
-                    return False
+        px, py = potential_pos
+        bx, by = px // MIN_SYSTEM_DISTANCE, py // MIN_SYSTEM_DISTANCE
+        for nx in range(bx - 1, bx + 2):
+            for ny in range(by - 1, by + 2):
+                for ex, ey in self.system_buckets.get((nx, ny), ()):
+                    if max(abs(px - ex), abs(py - ey)) < MIN_SYSTEM_DISTANCE:
+                        return False
         return True
 
-    def place_initial_systems(self, capital_systems, planet_systems):
+    def place_initial_systems(self, capital_systems, planet_systems, rng=None):
         """
         Place les systèmes Capitale et Planète de manière aléatoire en respectant
         les règles de placement (distance et marges).
+
+        Les positions candidates sont mélangées puis parcourues une seule fois :
+        une position refusée le reste pour tous les systèmes suivants, chaque test
+        est en O(1) grâce aux seaux, et le coût total est linéaire en nombre de cases.
+        Lève PlacementError si tous les systèmes n'ont pas pu être placés.
+        rng : générateur aléatoire à utiliser (module random par défaut).
         """
+        rng = rng or random
         systems_to_place = capital_systems + planet_systems
-        random.shuffle(systems_to_place)
-        self.systems = []  # Réinitialiser la liste
+        rng.shuffle(systems_to_place)
+        self.clear_systems()  # Réinitialiser la liste et l'index
 
-        possible_positions = []
-        for x in range(2, self.size_x - SYSTEM_SIZE):
-            for y in range(2, self.size_y - SYSTEM_SIZE):
-                possible_positions.append((x, y))
-        random.shuffle(possible_positions)
+        possible_positions = [(x, y)
+                              for x in range(2, self.size_x - SYSTEM_SIZE)
+                              for y in range(2, self.size_y - SYSTEM_SIZE)]
+        rng.shuffle(possible_positions)
 
         placed_count = 0
+        candidates = iter(possible_positions)
         for system in systems_to_place:
-            placed = False
-            current_possible = possible_positions[:]  # Copie temporaire
-            while current_possible and not placed:
-                position = current_possible.pop(0)
-                if self.check_distance_rule(position):
-                    self.place_system(system, position)
-                    placed = True
-                    placed_count += 1
-                    if position in possible_positions:
-                        possible_positions.remove(position)
-            if not placed:
-                print(f"Warning: Could not place system {system}.")
-
-        print(f"Successfully placed {placed_count} out of {len(systems_to_place)} systems.")
+            position = next((pos for pos in candidates if self.check_distance_rule(pos)), None)
+            if position is None:
+                raise PlacementError(systems_to_place[placed_count:], placed_count)
+            self.place_system(system, position)
+            placed_count += 1
+
+        self.events.emit(SystemsPlaced, placed_count, len(systems_to_place))
+
+    def travel_turns(self):
+        """
+        Matrice turns[i][j] : nombre minimal de tours pour entrer dans systems[j] en
+        partant de systems[i] au tour suivant un arrêt, escales forcées dans d'autres
+        systèmes comprises (le mouvement s'arrête à l'entrée d'un système) ; math.inf
+        si j est inaccessible. Calculée par un BFS en bitboard par système puis
+        Floyd-Warshall (Game.setup_game la précalcule après place_initial_systems),
+        en cache jusqu'au prochain changement de disposition.
+        La case de sortie est la meilleure du système de départ : l'estimation peut
+        être optimiste d'un pas.
+        """
+        if self._travel_turns_version != self.layout_version:
+            self._travel_turns = self._compute_travel_turns()
+            self._travel_turns_version = self.layout_version
+        return self._travel_turns
+
+    def _compute_travel_turns(self):
+        count = len(self.systems)
+        bitboard = SystemBitboard(self)
+        turns = []
+        for system in self.systems:
+            sx, sy = system.position
+            cells = [(x, y) for x in range(sx, min(sx + SYSTEM_SIZE, self.size_x))
+                     for y in range(sy, min(sy + SYSTEM_SIZE, self.size_y))]
+            steps = bitboard.steps_from(cells, system)
+            row = [math.inf if step is None else -(-step // MOVEMENT_POINTS_PER_TURN) for step in steps]
+            row[system.index] = 0
+            turns.append(row)
+        for via in range(count):
+            via_row = turns[via]
+            for row in turns:
+                to_via = row[via]
+                if to_via == math.inf:
+                    continue
+                for target in range(count):
+                    if to_via + via_row[target] < row[target]:
+                        row[target] = to_via + via_row[target]
+        return turns
 
     def reveal_system(self, position):
         """Révèle un système à la position donnée."""
         system = self.get_system_at(position)
         if system and not system.revealed:
+            if self.journal:
+                self.journal.record_attr(system, 'revealed')
             system.revealed = True
-            print(
-                f"System at {system.position} revealed: Color {system.couleur}, Type: {'Capitale' if system.est_capitale else 'Planete'}")
+            self.events.emit(SystemRevealed, system.position, system.couleur, system.est_capitale, False)
             return system
         return None
 
-    def draw(self, surface):
-        """Dessine les lignes de la grille et tous les systèmes placés."""
-        # Dessiner la grille
-        for x in range(self.size_x + 1):
-            start_pos = (BOARD_OFFSET_X + x * CELL_SIZE, BOARD_OFFSET_Y)
-            end_pos = (BOARD_OFFSET_X + x * CELL_SIZE, BOARD_OFFSET_Y + self.size_y * CELL_SIZE)
-            pygame.draw.line(surface, GRAY, start_pos, end_pos)
-        for y in range(self.size_y + 1):
-            start_pos = (BOARD_OFFSET_X, BOARD_OFFSET_Y + y * CELL_SIZE)
-            end_pos = (BOARD_OFFSET_X + self.size_x * CELL_SIZE, BOARD_OFFSET_Y + y * CELL_SIZE)
-            pygame.draw.line(surface, GRAY, start_pos, end_pos)
-
-        # Dessiner les systèmes
-        for system in self.systems:
-            system.draw(surface, self.font)
+    def draw_grid(self, surface, camera):
+        """Dessine les lignes de la grille visibles (aucune quand les cases sont trop petites)."""
+        if not camera.show_grid:
+            return
+        x0, y0, x1, y1 = camera.visible_range()
+        view = camera.viewport
+        # Lignes bornées à la vue (bordure droite et basse comprises)
+        left, top = (max(corner, edge) for corner, edge in zip(camera.to_screen(x0, y0), view.topleft))
+        right, bottom = (min(corner, edge) for corner, edge in zip(camera.to_screen(x1, y1), view.bottomright))
+        for x in range(x0, x1 + 1):
+            screen_x = camera.to_screen(x, y0)[0]
+            if view.left <= screen_x <= view.right:
+                pygame.draw.line(surface, GRAY, (screen_x, top), (screen_x, bottom))
+        for y in range(y0, y1 + 1):
+            screen_y = camera.to_screen(x0, y)[1]
+            if view.top <= screen_y <= view.bottom:
+                pygame.draw.line(surface, GRAY, (left, screen_y), (right, screen_y))
+
+    def systems_in_view(self, camera):
+        """
+        Systèmes au moins en partie visibles. Quand la vue ne couvre qu'une partie du
+        plateau, seuls les seaux de system_buckets qui la recoupent sont parcourus.
+        """
+        x0, y0, x1, y1 = camera.visible_range()
+        # Un système déborde de SYSTEM_SIZE - 1 cases à droite et en bas de sa position
+        x0 = max(0, x0 - SYSTEM_SIZE + 1)
+        y0 = max(0, y0 - SYSTEM_SIZE + 1)
+        bx0, by0 = x0 // MIN_SYSTEM_DISTANCE, y0 // MIN_SYSTEM_DISTANCE
+        bx1, by1 = (x1 - 1) // MIN_SYSTEM_DISTANCE, (y1 - 1) // MIN_SYSTEM_DISTANCE
+        if (bx1 - bx0 + 1) * (by1 - by0 + 1) >= len(self.systems):
+            return [system for system in self.systems
+                    if x0 <= system.position[0] < x1 and y0 <= system.position[1] < y1]
+        visible = []
+        for bx in range(bx0, bx1 + 1):
+            for by in range(by0, by1 + 1):
+                for position in self.system_buckets.get((bx, by), ()):
+                    if x0 <= position[0] < x1 and y0 <= position[1] < y1:
+                        visible.append(self.grid[position[0]][position[1]])
+        return visible
+
+    def draw_systems(self, surface, camera, view=None):
+        """
+        Dessine les systèmes visibles. view : masque des systèmes dessinés révélés
+        (vue d'un joueur sous brouillard de guerre), revealed_mask par défaut.
+        """
+        view = self.revealed_mask if view is None else view
+        systems = self.systems_in_view(camera)
+        if not camera.detailed:
+            # Petit zoom : un aplat par système (cf. SystemePlanetaire.draw), sans appel par système
+            fill = surface.fill
+            rects = camera.rects([system.position for system in systems], (SYSTEM_SIZE, SYSTEM_SIZE))
+            for system, rect in zip(systems, rects):
+                fill(system.couleur if view >> system.index & 1 else GRAY, rect)
+            return
+        for system in systems:
+            system.draw(surface, self.font, camera, view >> system.index & 1)
+
+    def draw(self, surface, camera, view=None):
+        """Dessine les lignes de la grille et les systèmes visibles."""
+        self.draw_grid(surface, camera)
+        self.draw_systems(surface, camera, view)
+
+    def cell_rect(self, position, camera):
+        """Rectangle écran d'une case de la grille."""
+        return camera.rect(position)
 
 
 # --- System Classes ---
@@ -148,19 +325,49 @@ class SystemePlanetaire:
         self.position = None  # Position en haut à gauche sur la grille
         self.couleur = couleur
         self.size = (SYSTEM_SIZE, SYSTEM_SIZE)
-        self.revealed = False
+        self.index = None  # Rang dans GameBoard.systems (bit de visibilité), une fois placé
+        self.board = None  # Plateau dont le bitset de visibilité est tenu à jour
+        self._revealed = False
         self.est_capitale = False  # Par défaut, pas une capitale
 
-    def draw(self, surface, font):
-        """Dessine le système."""
-        if self.position:
-            px = BOARD_OFFSET_X + self.position[0] * CELL_SIZE
-            py = BOARD_OFFSET_Y + self.position[1] * CELL_SIZE
-            width = self.size[0] * CELL_SIZE
-            height = self.size[1] * CELL_SIZE
-            rect = pygame.Rect(px, py, width, height)
+    @property
+    def revealed(self):
+        return self._revealed
+
+    @revealed.setter
+    def revealed(self, value):
+        """Met aussi à jour le bit du système dans GameBoard.revealed_mask."""
+        self._revealed = value = bool(value)
+        if self.board is not None:
+            if value:
+                self.board.revealed_mask |= 1 << self.index
+            else:
+                self.board.revealed_mask &= ~(1 << self.index)
 
-            if self.revealed:
+    def covers(self, position):
+        """Vrai si la case position fait partie du système."""
+        x, y = position
+        sx, sy = self.position
+        return sx <= x < sx + self.size[0] and sy <= y < sy + self.size[1]
+
+    def get_rect(self, camera):
+        """
+        Rectangle écran couvert par le dessin du système, marqueur
+        d'origine compris (il déborde de 2 pixels avec un trait de 3).
+        """
+        return camera.rect(self.position, self.size).inflate(6, 6)
+
+    def draw(self, surface, font, camera, revealed=None):
+        """
+        Dessine le système (simple aplat de couleur aux petits niveaux de zoom).
+        revealed : état affiché, self.revealed par défaut (brouillard de guerre).
+        """
+        revealed = self.revealed if revealed is None else revealed
+        if self.position:
+            rect = camera.rect(self.position, self.size)
+            if not camera.detailed:
+                pygame.draw.rect(surface, self.couleur if revealed else GRAY, rect)
+            elif revealed:
                 pygame.draw.rect(surface, self.couleur, rect)
                 pygame.draw.rect(surface, WHITE, rect, 1)
             else:
@@ -176,20 +383,20 @@ class SystemePlanetaireCapitale(SystemePlanetaire):
         self.est_capitale = True
         self.is_player_origin = False  # Sera marqué si c'est le système d'origine du joueur
 
-    def draw(self, surface, font):
+    def draw(self, surface, font, camera, revealed=None):
         """Dessine le système Capitale avec un marqueur spécial si c'est l'origine du joueur."""
-        super().draw(surface, font)
-        if self.position and self.revealed:
-            px = BOARD_OFFSET_X + self.position[0] * CELL_SIZE
-            py = BOARD_OFFSET_Y + self.position[1] * CELL_SIZE
-            center_x = px + SYSTEM_SIZE * CELL_SIZE // 2
-            center_y = py + SYSTEM_SIZE * CELL_SIZE // 2
+        revealed = self.revealed if revealed is None else revealed
+        super().draw(surface, font, camera, revealed)
+        if self.position and revealed and camera.detailed:
+            rect = camera.rect(self.position, self.size)
+            center = (rect.x + rect.width // 2, rect.y + rect.height // 2)
+            radius = int(camera.cell_size) // 3
             # Marqueur de base : une étoile jaune
-            pygame.draw.circle(surface, YELLOW, (center_x, center_y), CELL_SIZE // 3)
-            pygame.draw.circle(surface, BLACK, (center_x, center_y), CELL_SIZE // 3, 1)
+            pygame.draw.circle(surface, YELLOW, center, radius)
+            pygame.draw.circle(surface, BLACK, center, radius, 1)
             # Si c'est le système d'origine du joueur, ajouter un signe distinctif (ex. double encadrement rouge)
             if getattr(self, 'is_player_origin', False):
-                outline_rect = pygame.Rect(px - 2, py - 2, SYSTEM_SIZE * CELL_SIZE + 4, SYSTEM_SIZE * CELL_SIZE + 4)
+                outline_rect = rect.inflate(4, 4)
                 pygame.draw.rect(surface, RED, outline_rect, 3)
 
 
@@ -200,6 +407,6 @@ class SystemePlanetairePlanete(SystemePlanetaire):
         super().__init__(couleur)
         self.est_capitale = False
 
-    def draw(self, surface, font):
+    def draw(self, surface, font, camera, revealed=None):
         """Dessine un système Planète."""
-        super().draw(surface, font)
+        super().draw(surface, font, camera, revealed)
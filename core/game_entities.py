@@ -4,24 +4,41 @@ Manages the game board, systems, and their placement and drawing.
 """
 import pygame
 import random
+from core.events import ShipMoved
 from core.game_board import GameBoard, SystemePlanetaireCapitale, SystemePlanetairePlanete
 
-from config import (CELL_SIZE, MOVEMENT_POINTS_PER_TURN,
+from config import (MOVEMENT_POINTS_PER_TURN,
                     WHITE, FACTIONS,
-                    BOARD_OFFSET_X, BOARD_OFFSET_Y, COLOR_NAME_MAP)
+                    COLOR_NAME_MAP)
 
 
 class Totem:
-    """Représente un totem appartenant à une faction et couleur spécifiques."""
-
-    def __init__(self, faction_id, couleur):
-        if faction_id not in FACTIONS:
-            raise ValueError(f"Invalid faction ID: {faction_id}")
-        self.faction_id = faction_id  # e.g., "A", "B"
-        self.couleur = couleur  # Couleur du système d'où il provient
-        self.valeur = FACTIONS[faction_id]["valeur"]
-        self.nom = FACTIONS[faction_id]["nom"]
-        self.logo = FACTIONS[faction_id]["logo"]
+    """
+    Représente un totem appartenant à une faction et couleur spécifiques.
+    Les totems sont des poids-mouches immuables : il n'existe qu'une instance
+    par couple (faction, couleur), partagée par tous les racks et toutes les parties.
+    """
+
+    __slots__ = ('faction_id', 'couleur', 'valeur', 'nom', 'logo')
+    _interned = {}
+
+    def __new__(cls, faction_id, couleur):
+        totem = cls._interned.get((faction_id, couleur))
+        if totem is None:
+            if faction_id not in FACTIONS:
+                raise ValueError(f"Invalid faction ID: {faction_id}")
+            totem = super().__new__(cls)
+            totem.faction_id = faction_id  # e.g., "A", "B"
+            totem.couleur = couleur  # Couleur du système d'où il provient
+            totem.valeur = FACTIONS[faction_id]["valeur"]
+            totem.nom = FACTIONS[faction_id]["nom"]
+            totem.logo = FACTIONS[faction_id]["logo"]
+            cls._interned[(faction_id, couleur)] = totem
+        return totem
+
+    def __reduce__(self):
+        # Copie et pickle renvoient l'instance partagée
+        return Totem, (self.faction_id, self.couleur)
 
     def __repr__(self):
             c_repr = COLOR_NAME_MAP.get(self.couleur, str(self.couleur))
@@ -31,19 +48,22 @@ class Totem:
 class FactionCard:
     """Représente une carte 'Relation-Faction'."""
 
+    __slots__ = ('faction_id', 'system_color')
+
     def __init__(self, faction_id, system_color):
         self.faction_id = faction_id
         self.system_color = system_color
 
     def __repr__(self):
-        color_name = [k for k, v in globals().items() if v == self.system_color]
-        c_repr = color_name[0] if color_name else str(self.system_color)
+        c_repr = COLOR_NAME_MAP.get(self.system_color, str(self.system_color))
         return f"Card({self.faction_id}, {c_repr})"
 
 
 class Vaisseau:
     """Représente le vaisseau du joueur."""
 
+    __slots__ = ('position', 'couleur', 'movement_points_remaining')
+
     def __init__(self, position, couleur):
         self.position = position  # Coordonnées en grille
         self.couleur = couleur
@@ -59,23 +79,36 @@ class Vaisseau:
         et vérifie l'entrée dans un système.
         Retourne True si le mouvement doit s'arrêter.
         """
+        journal = game_board.journal
+        if journal:
+            journal.record_attr(self, 'position')
+            journal.record_attr(self, 'movement_points_remaining')
         self.position = new_pos
         self.movement_points_remaining -= cost
-        print(f"Moved to {self.position}. Points left: {self.movement_points_remaining}")
         system = game_board.get_system_at(self.position)
+        game_board.events.emit(ShipMoved, self.position, self.movement_points_remaining, system is not None)
         if system:
-            print(f"Entered system at {self.position}. Movement ends.")
             self.movement_points_remaining = 0
             game_board.reveal_system(self.position)
             # Révélation simultanée de la Carte Relation-Faction sera gérée par Game.
             return True
         return False
 
-    def draw(self, surface):
+    @staticmethod
+    def _shape(position, camera):
+        """Centre et rayon à l'écran ; le vaisseau reste visible (rayon 2) à petit zoom."""
+        cell = camera.rect(position)
+        return (cell.x + cell.width // 2, cell.y + cell.height // 2), max(2, cell.width // 2 - 2)
+
+    def get_rect(self, camera, position=None):
+        """Rectangle écran couvert par le vaisseau (à position si donnée, ex. la case quittée)."""
+        (px, py), radius = self._shape(self.position if position is None else position, camera)
+        return pygame.Rect(px - radius, py - radius, 2 * radius + 1, 2 * radius + 1)
+
+    def draw(self, surface, camera):
         """Dessine le vaisseau sur le plateau."""
-        px = BOARD_OFFSET_X + self.position[0] * CELL_SIZE + CELL_SIZE // 2
-        py = BOARD_OFFSET_Y + self.position[1] * CELL_SIZE + CELL_SIZE // 2
-        radius = CELL_SIZE // 2 - 2
-        pygame.draw.circle(surface, self.couleur, (px, py), radius)
-        pygame.draw.circle(surface, WHITE, (px, py), radius, 1)
+        center, radius = self._shape(self.position, camera)
+        pygame.draw.circle(surface, self.couleur, center, radius)
+        if radius > 2:
+            pygame.draw.circle(surface, WHITE, center, radius, 1)
 
@@ -1,216 +1,413 @@
 
 import pygame
+import itertools
 import random
-import collections  # Pour BFS
-import time  # Pour le timing non bloquant de l'observer
-from config import (STATE_GAME_OVER,BOARD_SIZE_X, BOARD_SIZE_Y, CELL_SIZE, FACTION_NAMES, WHITE,NUM_PLANET_SYSTEMS,MAX_TURNS, GREEN, GRAY,MOVEMENT_POINTS_PER_TURN,MAX_TOTEMS_PER_PLAYER,
-                    BOARD_OFFSET_X, BOARD_OFFSET_Y, BLACK, RED,SYSTEM_COLORS,STATE_RUNNING,SYSTEM_FACTION_DATA,STATE_PLAYER_TURN,GRID_WIDTH)
+from config import (STATE_GAME_OVER,BOARD_SIZE_X, BOARD_SIZE_Y, FACTION_NAMES, WHITE,NUM_PLANET_SYSTEMS,MAX_TURNS, GREEN, GRAY,MOVEMENT_POINTS_PER_TURN,MAX_TOTEMS_PER_PLAYER,
+                    BLACK, RED,SYSTEM_COLORS,STATE_RUNNING,SYSTEM_FACTION_DATA,STATE_PLAYER_TURN,
+                    OBSERVER_REVEAL_SECONDS, TURN_TIME_LIMIT, FOG_OF_WAR, MAX_PLAYERS, PLAYER_ACTIVE, PLAYER_ABANDONED, PLAYER_ELIMINATED)
+from core.events import (EventBus, ActionRejected, Notice, FactionCardRevealed, SystemRevealed, SystemHidden,
+                         TotemHarvested, TotemDeposited, RackInfluenced, TurnStarted, TurnEnded, GameOver,
+                         PlayerLeft)
 from core.game_board import GameBoard, SystemePlanetaireCapitale, SystemePlanetairePlanete
+from core.pathfinding import PathFinder
+from core.planner import RoutePlanner
+from core.rack import Rack
+from core.timers import TimerScheduler
+from core.turns import TurnScheduler
+from core.undo import UndoJournal
+from ui.camera import Camera
+from ui.text_cache import TextCache
 from utils import get_color_name
 from .game_entities import (Totem, FactionCard,Vaisseau )
 
 
-# --- Helper Function ---
-def screen_to_grid(screen_pos):
-    """Convertit les coordonnées pixels en coordonnées de grille."""
-    x, y = screen_pos
-    grid_x = (x - BOARD_OFFSET_X) // CELL_SIZE
-    grid_y = (y - BOARD_OFFSET_Y) // CELL_SIZE
-    if 0 <= grid_x < BOARD_SIZE_X and 0 <= grid_y < BOARD_SIZE_Y:
-        return grid_x, grid_y
-    return None
+def _current_player_attr(name):
+    """Attribut de Game délégué au joueur courant (état de son tour, système d'origine)."""
+    def getter(self):
+        return getattr(self.get_player(), name)
+
+    def setter(self, value):
+        setattr(self.get_player(), name, value)
+    return property(getter, setter)
+
+
+class TotemTally:
+    """
+    Agrégats des totems d'un inventaire, tenus à jour à chaque ajout/retrait :
+    compteurs par faction, par couleur et par (faction, couleur), et dérivés
+    permettant de lire le score et les quatre conditions de victoire en O(1).
+    """
+
+    def __init__(self):
+        self.faction_counts = dict.fromkeys(FACTION_NAMES, 0)
+        self.color_counts = dict.fromkeys(SYSTEM_COLORS, 0)
+        self.pair_counts = {}  # (faction_id, couleur) -> nombre
+        self.factions_per_color = dict.fromkeys(SYSTEM_COLORS, 0)  # factions distinctes par couleur
+        self.colors_per_faction = dict.fromkeys(FACTION_NAMES, 0)  # couleurs distinctes par faction
+        self.distinct_factions = 0
+        self.distinct_colors = 0
+        self.color_groups = 0  # couleurs avec au moins 3 totems
+        self.faction_groups = 0  # factions avec au moins 3 totems
+        self.colors_with_three_factions = 0
+        self.factions_with_three_colors = 0
+        self.total_value = 0
+
+    def apply(self, delta, totem):
+        """Ajoute (delta=1) ou retire (delta=-1) un totem des agrégats."""
+        faction_id, couleur = totem.faction_id, totem.couleur
+        self.total_value += delta * totem.valeur
+        # Un seuil est franchi quand l'ancienne ou la nouvelle valeur vaut exactement le seuil
+        added = delta > 0
+
+        count = self.faction_counts.get(faction_id, 0) + delta
+        self.faction_counts[faction_id] = count
+        if count == (1 if added else 0):
+            self.distinct_factions += delta
+        if count == (3 if added else 2):
+            self.faction_groups += delta
+
+        count = self.color_counts.get(couleur, 0) + delta
+        self.color_counts[couleur] = count
+        if count == (1 if added else 0):
+            self.distinct_colors += delta
+        if count == (3 if added else 2):
+            self.color_groups += delta
+
+        key = (faction_id, couleur)
+        count = self.pair_counts.get(key, 0) + delta
+        if count:
+            self.pair_counts[key] = count
+        else:
+            del self.pair_counts[key]
+        if count == (1 if added else 0):
+            kinds = self.factions_per_color.get(couleur, 0) + delta
+            self.factions_per_color[couleur] = kinds
+            if kinds == (3 if added else 2):
+                self.colors_with_three_factions += delta
+            kinds = self.colors_per_faction.get(faction_id, 0) + delta
+            self.colors_per_faction[faction_id] = kinds
+            if kinds == (3 if added else 2):
+                self.factions_with_three_colors += delta
+
+    def undo_apply(self, delta, totem):
+        """Inverse de apply(), utilisée par le journal d'annulation."""
+        self.apply(-delta, totem)
+
+    def bonus(self):
+        """Bonus de groupes : 1000 par couleur et 10.0 par faction ayant 3 totems ou plus."""
+        return 1000 * self.color_groups + (10.0 * self.faction_groups if self.faction_groups else 0)
+
+    def has_all_factions(self):
+        return self.distinct_factions == len(FACTION_NAMES)
+
+    def has_all_colors(self):
+        return self.distinct_colors == len(SYSTEM_COLORS)
+
+    def has_color_with_three_factions(self):
+        return self.colors_with_three_factions > 0
+
+    def has_faction_with_three_colors(self):
+        return self.factions_with_three_colors > 0
 
 
 class Player:
-    """Représente le joueur (mode solo)."""
+    """Représente un joueur : vaisseau, inventaire, score et état de son tour."""
 
-    def __init__(self, player_id, couleur):
-        self.id = player_id
+    # Drapeaux du tour en cours, réinitialisés par Game.start_turn()
+    TURN_STATE_FIELDS = ('action_recolter_used', 'action_deposer_used', 'action_influencer_used',
+                         'action_observer_used', 'movement_used', 'observer_mode')
+
+    def __init__(self, player_id, couleur, journal=None, events=None):
+        self.id = player_id  # Siège du joueur dans Game.players
         self.couleur = couleur  # Couleur du vaisseau et du joueur
         self.origin_system_color = couleur  # Système d'origine (correspond à la couleur)
+        self.origin_system_pos = None
+        self.seen_mask = 0  # Bits des systèmes que le joueur a lui-même révélés ou observés (brouillard de guerre)
         self.vaisseau = None
         self.totems = []  # Liste des totems collectés
+        self.tally = TotemTally()  # Agrégats tenus à jour par add_totem/remove_totem
         self.score = 5000
+        self.status = PLAYER_ACTIVE
+        self.journal = journal  # UndoJournal de la partie (optionnel)
+        self.events = events if events is not None else EventBus()
+
+        # Flags pour actions par tour
+        self.action_recolter_used = False
+        self.action_deposer_used = False
+        self.action_influencer_used = False
+        self.action_observer_used = False
+        self.movement_used = False
+        self.observer_mode = False  # Attente du clic de sélection Observer
+
+    def _update_tally(self, delta, totem):
+        if self.journal:
+            self.journal.record_inverse(TotemTally.undo_apply, self.tally, delta, totem)
+        self.tally.apply(delta, totem)
+
+    def _writable_totems(self):
+        """Liste des totems modifiable, copiée à l'écriture si un fork est ouvert."""
+        if self.journal:
+            return self.journal.writable_attr(self, 'totems')
+        return self.totems
 
     def add_totem(self, totem):
         """Ajoute un totem à l'inventaire du joueur s'il y a de la place."""
         if len(self.totems) < MAX_TOTEMS_PER_PLAYER:
-            self.totems.append(totem)
-            print(f"Player collected {totem}")
+            self._writable_totems().append(totem)
+            self._update_tally(1, totem)
             return True
         else:
-            print("Inventory full.")
+            self.events.emit(ActionRejected, "recolter", "Inventory full.")
             return False
 
     def remove_totem(self, totem_to_remove):
         """Enlève un totem spécifique de l'inventaire du joueur."""
         if totem_to_remove in self.totems:
-            self.totems.remove(totem_to_remove)
-            print(f"Player deposited {totem_to_remove}")
+            self._writable_totems().remove(totem_to_remove)
+            self._update_tally(-1, totem_to_remove)
             return True
         else:
-            print("Totem not found in inventory.")
+            self.events.emit(ActionRejected, "deposer", "Totem not found in inventory.")
             return False
 
     def calculate_score(self):
         """Calcule les points des totems + bonus, sans réinitialiser le score global."""
-        score_totems = sum(t.valeur for t in self.totems)
-
-        color_counts = {}
-        faction_counts = {}
-        for t in self.totems:
-            color_counts[t.couleur] = color_counts.get(t.couleur, 0) + 1
-            faction_counts[t.faction_id] = faction_counts.get(t.faction_id, 0) + 1
-
-        bonus = 0
-        bonus += sum(1000 for c in color_counts.values() if c >= 3)
-        bonus += sum(10.0 for f in faction_counts.values() if f >= 3)
-
-        return score_totems + bonus
+        return self.tally.total_value + self.tally.bonus()
 
     def check_victory_conditions(self):
         """
         Vérifie si l'une des conditions de victoire est remplie.
         Retourne True si l'une des conditions est satisfaite.
         """
-        if not self.totems:
-            return False
+        tally = self.tally
         # Condition 1: Au moins un totem de chaque faction (A-F)
-        collected_factions = {t.faction_id for t in self.totems}
-        if len(collected_factions) == len(FACTION_NAMES):
-            return True
         # Condition 2: Au moins un totem de chaque couleur (7 couleurs)
-        collected_colors = {t.couleur for t in self.totems}
-        if len(collected_colors) == len(SYSTEM_COLORS):
-            return True
         # Condition 3: 3 totems de la même couleur, mais de 3 factions différentes
-        color_groups = {}
-        for totem in self.totems:
-            color_groups.setdefault(totem.couleur, []).append(totem.faction_id)
-        for factions in color_groups.values():
-            if len(factions) >= 3 and len(set(factions)) >= 3:
-                return True
         # Condition 4: 3 totems de la même faction, mais de 3 couleurs différentes
-        faction_groups = {}
-        for totem in self.totems:
-            faction_groups.setdefault(totem.faction_id, []).append(totem.couleur)
-        for colors in faction_groups.values():
-            if len(colors) >= 3 and len(set(colors)) >= 3:
-                return True
-        return False
+        return (tally.has_all_factions() or tally.has_all_colors() or
+                tally.has_color_with_three_factions() or tally.has_faction_with_three_colors())
+
+
+def _cancel_timer(timer, _key, _value):
+    """Inverse d'une programmation d'échéance, pour le journal d'annulation."""
+    timer.cancel()
 
 
 class Game:
     """Gère l'état global du jeu, les tours et les interactions."""
 
-    def __init__(self, num_players=1):
-        self.num_players = 1  # Mode solo
-        self.game_board = GameBoard(BOARD_SIZE_X, BOARD_SIZE_Y)
+    # Attributs réinitialisés ou modifiés par start_turn()/check_game_over()
+    # (l'état propre au joueur est dans Player.TURN_STATE_FIELDS)
+    TURN_STATE_FIELDS = ('turn_count', 'observer_system', 'observer_start_time',
+                         'game_state', 'winner', '_turn_timer_token')
+
+    # État du tour du joueur courant
+    action_recolter_used = _current_player_attr('action_recolter_used')
+    action_deposer_used = _current_player_attr('action_deposer_used')
+    action_influencer_used = _current_player_attr('action_influencer_used')
+    action_observer_used = _current_player_attr('action_observer_used')
+    movement_used = _current_player_attr('movement_used')
+    observer_mode = _current_player_attr('observer_mode')
+    player_origin_system_pos = _current_player_attr('origin_system_pos')
+
+    def __init__(self, num_players=1, headless=False, rng=None, racks=None, seed=None, clock=None,
+                 turn_time_limit=TURN_TIME_LIMIT, fog_of_war=FOG_OF_WAR):
+        if not 1 <= num_players <= MAX_PLAYERS:
+            raise ValueError(f"num_players must be between 1 and {MAX_PLAYERS}.")
+        self.num_players = num_players
+        self.headless = headless  # Sans polices ni surfaces : moteur de règles seul
+        # Générateur aléatoire propre à la partie (reproductible si fourni avec une graine)
+        self.seed = seed
+        if rng is None:
+            rng = random.Random(seed) if seed is not None else random.Random()
+        self.rng = rng
+        self.action_log = None  # ActionLog (core.replay) alimenté par les actions réussies
+        self.game_board = GameBoard(BOARD_SIZE_X, BOARD_SIZE_Y, headless=headless)
+        self.pathfinder = PathFinder(self.game_board)
+        self.planner = RoutePlanner(self)  # Itinéraires vers la victoire (indice du panneau, bots)
+        self.camera = Camera((BOARD_SIZE_X, BOARD_SIZE_Y))  # Vue du plateau (défilement, zoom, sélection)
+        # Journal d'annulation pour fork()/undo()
+        self.journal = UndoJournal()
+        self.game_board.journal = self.journal
+        # Flux d'événements partagé par le plateau, le joueur et le vaisseau
+        self.events = EventBus()
+        self.game_board.events = self.events
         self.players = []
+        # Ordre de jeu des joueurs actifs ; le joueur courant est players[scheduler.current]
+        self.scheduler = TurnScheduler(num_players, journal=self.journal)
         self.game_state = STATE_RUNNING
         self.winner = None
-        self.turn_count = 0
-
-        # Flags pour actions par tour
-        self.action_recolter_used = False
-        self.action_deposer_used = False
-        self.action_influencer_used = False
-        self.action_observer_used = False
-        self.movement_used = False
-
-        # Mode Observer non bloquant
-        self.observer_mode = False
+        self.turn_count = 0  # Numéro du tour de table en cours
+        # Brouillard de guerre : chaque joueur ne voit révélés que les systèmes de son seen_mask
+        self.fog_of_war = fog_of_war
+
+        # Effets temporisés (core.timers) ; clock : RealClock par défaut, SimulatedClock en headless accéléré
+        self.timers = TimerScheduler(clock)
+        self.turn_time_limit = turn_time_limit  # Secondes par tour avant fin de tour automatique (None : illimité)
+        # Jetons des échéances en cours : une échéance dont le jeton n'est plus le courant est ignorée
+        # (tour terminé, révélation finie, ou branche annulée par undo())
+        self._timer_tokens = itertools.count(1)
+        self._turn_timer_token = None
+        self._observer_timer_token = None
+
+        # Révélation Observer non bloquante en cours (instant de début sur l'horloge de self.timers)
         self.observer_system = None
         self.observer_start_time = None
 
-        # Racks pour totems et cartes faction
+        # Racks (core.rack.Rack) pour totems et cartes faction (fournis tels quels au rechargement d'un instantané)
         self.system_racks = {}
-        self._initialize_racks()
-
-        self.font = pygame.font.Font(None, 24)
-        self.font_small = pygame.font.Font(None, 18)
-        self.player_origin_system_pos = None
+        if racks is None:
+            self._initialize_racks()
+        else:
+            self.system_racks = racks
+        for rack in self.system_racks.values():
+            rack.journal = self.journal
+
+        if headless:
+            self.font = None
+            self.font_small = None
+            self.font_game_over = None
+            self.font_final_score = None
+        else:
+            self.font = pygame.font.Font(None, 24)
+            self.font_small = pygame.font.Font(None, 18)
+            self.font_game_over = pygame.font.Font(None, 50)
+            self.font_final_score = pygame.font.Font(None, 40)
+        # Surfaces de texte en cache et panneau d'information pré-rendu
+        self.text_cache = TextCache()
+        if not headless:
+            self.text_cache.preload_glyphs(self.font_small, FACTION_NAMES, SYSTEM_COLORS)
+        self._panel_surface = None
+        self._panel_key = None
 
     def _initialize_racks(self):
         """Initialise les racks pour chaque couleur avec totems et cartes faction."""
-        self.system_racks = {color: {'totems': [], 'faction_cards': []} for color in SYSTEM_COLORS}
+        self.system_racks = {color: Rack(color) for color in SYSTEM_COLORS}
         for color, faction_data in SYSTEM_FACTION_DATA.items():
-            for faction_id in faction_data.keys():
-                for _ in range(3):
-                    self.system_racks[color]['totems'].append(Totem(faction_id, color))
-            for faction_id, count in faction_data.items():
-                for _ in range(count):
-                    self.system_racks[color]['faction_cards'].append(FactionCard(faction_id, color))
-            random.shuffle(self.system_racks[color]['faction_cards'])
+            totems = [Totem(faction_id, color) for faction_id in faction_data.keys() for _ in range(3)]
+            faction_cards = [FactionCard(faction_id, color)
+                             for faction_id, count in faction_data.items() for _ in range(count)]
+            self.rng.shuffle(faction_cards)
+            self.system_racks[color] = Rack(color, totems, faction_cards)
 
     def setup_game(self):
-        """Initialise le plateau, le joueur et le positionnement de départ."""
-        print("Setting up game (Single Player)...")
-        # Choix aléatoire de la couleur du joueur parmi SYSTEM_COLORS
-        player_color = random.choice(SYSTEM_COLORS)
-        # Création des systèmes Capitale et marquage du système d'origine
+        """Initialise le plateau, les joueurs et le positionnement de départ."""
+        if self.num_players == 1:
+            self.events.emit(Notice, "Setting up game (Single Player)...")
+        else:
+            self.events.emit(Notice, "Setting up game ({} players)...", self.num_players)
+        # Couleurs des joueurs tirées sans remise parmi SYSTEM_COLORS
+        player_colors = self.rng.sample(SYSTEM_COLORS, self.num_players)
+        # Création des systèmes Capitale et marquage des systèmes d'origine
         capital_systems = []
         for color in SYSTEM_COLORS:
             sys = SystemePlanetaireCapitale(color)
-            if color == player_color:
+            if color in player_colors:
                 sys.is_player_origin = True
-                print(f"Marked {color} as player origin.")
+                self.events.emit(Notice, "Marked {} as player origin.", color)
             capital_systems.append(sys)
-        planet_systems = [SystemePlanetairePlanete(random.choice(SYSTEM_COLORS)) for _ in range(NUM_PLANET_SYSTEMS)]
+        planet_systems = [SystemePlanetairePlanete(self.rng.choice(SYSTEM_COLORS)) for _ in range(NUM_PLANET_SYSTEMS)]
         # Placement des systèmes sur le plateau
-        self.game_board.place_initial_systems(capital_systems, planet_systems)
-        for sys in self.game_board.systems:
-            if getattr(sys, 'is_player_origin', False):
-                self.player_origin_system_pos = sys.position
-                print(f"Player origin system located at {self.player_origin_system_pos}")
-                break
-        # Création du joueur
-        self.players = [Player(0, player_color)]
-        # Placement initial du vaisseau sur un système choisi aléatoirement
+        self.game_board.place_initial_systems(capital_systems, planet_systems, rng=self.rng)
+        self.game_board.travel_turns()  # Matrice des tours entre systèmes pour le planificateur
+        # Création des joueurs (le siège est l'identifiant)
+        self.players = [Player(seat, color, journal=self.journal, events=self.events)
+                        for seat, color in enumerate(player_colors)]
+        for player in self.players:
+            player.origin_system_pos = self.game_board.capitals[player.couleur].position
+            self.events.emit(Notice, "Player origin system located at {}", player.origin_system_pos)
+        # Placement initial de chaque vaisseau sur un système distinct choisi aléatoirement
         available_systems = self.game_board.systems[:]
-        random.shuffle(available_systems)
-        if not available_systems:
+        self.rng.shuffle(available_systems)
+        if len(available_systems) < self.num_players:
             raise RuntimeError("Not enough systems placed to assign starting position.")
-        player = self.get_player()
-        start_system = available_systems.pop(0)
-        start_pos = start_system.position
-        player.vaisseau = Vaisseau(start_pos, player.couleur)
-        print(f"Player ({player.couleur}) starts at system {start_system.position} (Color: {start_system.couleur})")
-        self.game_board.reveal_system(start_pos)
-        self._reveal_faction_card(start_system.couleur)
+        for player in self.players:
+            start_system = available_systems.pop(0)
+            start_pos = start_system.position
+            player.vaisseau = Vaisseau(start_pos, player.couleur)
+            self.events.emit(Notice, "Player ({}) starts at system {} (Color: {})",
+                             player.couleur, start_system.position, start_system.couleur)
+            self.game_board.reveal_system(start_pos)
+            self._discover(player, start_system)
+            self._reveal_faction_card(start_system.couleur)
         self.start_turn()
-        print(f"\nGame setup complete. Turn {self.turn_count}.")
+        self.events.emit(Notice, "\nGame setup complete. Turn {}.", self.turn_count)
 
     def _reveal_faction_card(self, system_color):
         """Révèle la carte Relation-Faction du rack correspondant à la couleur donnée."""
         rack = self.system_racks.get(system_color)
-        if rack and rack['faction_cards']:
-            card = rack['faction_cards'][0]
-            print(f"  Rack {system_color}: Top Faction Card revealed -> {card.faction_id}")
+        if rack and rack.faction_cards:
+            self.events.emit(FactionCardRevealed, system_color, rack.top_faction)
         else:
-            print(f"  Rack {system_color}: No faction cards to reveal.")
+            self.events.emit(FactionCardRevealed, system_color, None)
+
+    def _log_action(self, kind, *args):
+        if self.action_log is not None:
+            self.action_log.record(self, kind, *args)
 
     def get_player(self):
-        """Retourne l'objet joueur (mode solo)."""
-        return self.players[0]
+        """Retourne le joueur dont c'est le tour."""
+        return self.players[self.scheduler.current]
+
+    def active_players(self):
+        """Joueurs encore en jeu, dans l'ordre des sièges."""
+        return [player for player in self.players if player.status == PLAYER_ACTIVE]
+
+    def fork(self):
+        """
+        Ouvre un point de sauvegarde : les actions jouées ensuite (déplacements,
+        Récolter, Déposer, Influencer, Observer et sa fin, fin de tour) pourront être
+        annulées par undo(), échéances programmées comprises.
+        Les points de sauvegarde s'imbriquent ; renvoie la profondeur atteinte.
+        """
+        return self.journal.fork()
+
+    def undo(self):
+        """Revient à l'état du dernier fork(), en O(nombre de modifications)."""
+        self.journal.undo()
 
-    def start_turn(self):
-        """Prépare le début du tour en réinitialisant les états."""
-        self.turn_count += 1
+    def start_turn(self, new_round=True, ended_player=None):
+        """
+        Prépare le tour du joueur courant en réinitialisant ses états.
+        new_round : un nouveau tour de table commence (le compteur de tours avance).
+        ended_player : joueur dont le tour vient de finir, seul candidat à la victoire.
+        """
         player = self.get_player()
+        if self.journal.active:
+            for name in self.TURN_STATE_FIELDS:
+                self.journal.record_attr(self, name)
+            for name in Player.TURN_STATE_FIELDS:
+                self.journal.record_attr(player, name)
+            self.journal.record_attr(player.vaisseau, 'movement_points_remaining')
+        if new_round:
+            self.turn_count += 1
         player.vaisseau.reset_movement_points()
-        self.action_recolter_used = False
-        self.action_deposer_used = False
-        self.action_influencer_used = False
-        self.action_observer_used = False
-        self.movement_used = False
-        self.observer_mode = False
+        player.action_recolter_used = False
+        player.action_deposer_used = False
+        player.action_influencer_used = False
+        player.action_observer_used = False
+        player.movement_used = False
+        player.observer_mode = False
         self.observer_system = None
         self.observer_start_time = None
         self.game_state = STATE_PLAYER_TURN
-        print(f"\n--- Turn {self.turn_count}/{MAX_TURNS} ---")
-        if self.check_game_over():
+        self.events.emit(TurnStarted, self.turn_count, None if self.num_players == 1 else player.id)
+        if self.check_game_over(ended_player):
             return
+        self.start_turn_timer()
+
+    def start_turn_timer(self):
+        """Programme la fin automatique du tour courant si une limite de temps est fixée."""
+        if self.turn_time_limit:
+            self._turn_timer_token = next(self._timer_tokens)
+            timer = self.timers.schedule(self.turn_time_limit, self._turn_timeout, self._turn_timer_token)
+            self.journal.record_inverse(_cancel_timer, timer, None, None)
+
+    def _turn_timeout(self, token):
+        """Limite de temps du tour atteinte : le tour se termine comme sur ESPACE."""
+        if token == self._turn_timer_token and self.game_state == STATE_PLAYER_TURN:
+            self.events.emit(Notice, "Temps écoulé : fin du tour.")
+            self.end_turn()
 
     def end_turn(self):
         """Fin du tour du joueur : pénalité de score et passage au tour suivant."""
@@ -218,48 +415,69 @@ class Game:
             return
         player = self.get_player()
 
+        self._log_action("end_turn")
         # Appliquer la pénalité
+        self.journal.record_attr(player, 'score')
         player.score = max(0, player.score - 200)
-        print(f"Pénalité de fin de tour : -200 points. Score actuel : {player.score}")
+        self.events.emit(TurnEnded, 200, player.score)
 
-        self.start_turn()
+        self._next_turn(player)
+
+    def _next_turn(self, ended_player):
+        """Passe la main au prochain joueur actif (O(1) grâce à l'ordonnanceur)."""
+        _, new_round = self.scheduler.advance()
+        self.start_turn(new_round, ended_player)
+
+    def remove_player(self, player, status):
+        """
+        Retire un joueur de l'ordre de jeu (PLAYER_ABANDONED ou PLAYER_ELIMINATED).
+        La partie s'arrête quand il ne reste qu'un joueur (ou aucun en solo) ;
+        si c'était le joueur courant, la main passe au suivant.
+        """
+        if player.status != PLAYER_ACTIVE or self.game_state == STATE_GAME_OVER:
+            return False
+        self._log_action("leave", player.id, status)
+        was_current = player is self.get_player()
+        self.journal.record_attr(player, 'status')
+        player.status = status
+        self.scheduler.remove(player.id)
+        self.events.emit(PlayerLeft, player.id, status)
+        remaining = self.scheduler.active_count
+        if remaining == 0:
+            self._end_game(False, "forfeit", None)
+        elif remaining == 1 and self.num_players > 1:
+            # Tous les autres joueurs ont abandonné : le dernier en jeu l'emporte
+            survivor = self.players[self.scheduler.next[player.id]]
+            self._end_game(False, "abandon", survivor)
+        elif was_current:
+            self._next_turn(None)
+        return True
+
+    def abandon(self, player=None):
+        """Abandon du joueur donné (le joueur courant par défaut)."""
+        return self.remove_player(player or self.get_player(), PLAYER_ABANDONED)
+
+    def eliminate(self, player):
+        """Élimination d'un joueur par les règles ou l'hôte de la partie."""
+        return self.remove_player(player, PLAYER_ELIMINATED)
 
     def find_path(self, start_pos, end_pos, max_dist):
         """
-        Recherche un chemin entre start_pos et end_pos en utilisant BFS.
+        Recherche un chemin entre start_pos et end_pos à partir du champ de distance
+        (BFS mis en cache) de start_pos.
         Refuse les déplacements qui restent à l'intérieur des 4 cases d'un même système.
         """
         # Vérifier si start et end appartiennent au même système
         start_system = self.game_board.get_system_at(start_pos)
         end_system = self.game_board.get_system_at(end_pos)
         if start_system and end_system and start_system == end_system:
-            print("Déplacement interne au même système interdit. Ignoré.")
+            self.events.emit(ActionRejected, "move", "Déplacement interne au même système interdit. Ignoré.")
             return None
 
         if start_pos == end_pos:
             return [start_pos]
 
-        q = collections.deque([(start_pos, [start_pos])])
-        visited = {start_pos}
-        while q:
-            (current_pos, path) = q.popleft()
-            current_dist = len(path) - 1
-            if current_dist >= max_dist:
-                continue
-            for dx in [-1, 0, 1]:
-                for dy in [-1, 0, 1]:
-                    if dx == 0 and dy == 0:
-                        continue
-                    next_pos = (current_pos[0] + dx, current_pos[1] + dy)
-                    # Refuser le déplacement interne si next_pos appartient au même système que start_pos
-                    if start_system and self.game_board.get_system_at(next_pos) == start_system:
-                        continue
-                    if next_pos == end_pos:
-                        return path + [next_pos]
-                    if self.game_board.is_position_valid(next_pos) and next_pos not in visited:
-                        visited.add(next_pos)
-                        q.append((next_pos, path + [next_pos]))
-        return None
+        return self.pathfinder.find_path(start_pos, end_pos, max_dist)
 
     def handle_mouse_click(self, mouse_pos):
         """
@@ -269,37 +487,47 @@ class Game:
         if self.observer_mode:
             self.observer_select_system(mouse_pos)
         else:
-            print("Déplacement par souris désactivé.")
+            self.events.emit(Notice, "Déplacement par souris désactivé.")
 
     def observer_select_system(self, mouse_pos):
         """
         Mode Observer : sélection unique d’un système caché,
         affiché temporairement (2 sec), une seule fois par tour.
         """
-        if self.action_observer_used:
-            print("Observer: Action déjà utilisée ce tour.")
-            return
-        if self.observer_system is not None:
-            print("Observer: Observation en cours.")
-            return
-
-        target_grid_pos = screen_to_grid(mouse_pos)
+        target_grid_pos = self.camera.screen_to_grid(mouse_pos)
         if target_grid_pos is None:
-            print("Observer: Clic hors du plateau.")
+            self.events.emit(ActionRejected, "observer", "Observer: Clic hors du plateau.")
             return
+        self.play_observer(target_grid_pos)
 
+    def play_observer(self, target_grid_pos):
+        """Action Observer du joueur courant sur une case du plateau, une fois par tour."""
+        if self.action_observer_used:
+            self.events.emit(ActionRejected, "observer", "Observer: Action déjà utilisée ce tour.")
+            return False
+        if self.observer_system is not None:
+            self.events.emit(ActionRejected, "observer", "Observer: Observation en cours.")
+            return False
+        self.observe_system(target_grid_pos)
+        return self.observer_system is not None
+
+    def observe_system(self, target_grid_pos):
+        """Révèle temporairement le système caché à la case donnée (action Observer)."""
         system = self.game_board.get_system_at(target_grid_pos)
         if not system or system.revealed:
-            print("Observer: Système invalide ou déjà révélé.")
+            self.events.emit(ActionRejected, "observer", "Observer: Système invalide ou déjà révélé.")
             return
 
         # Révélation temporaire
+        self._log_action("observer", target_grid_pos[0], target_grid_pos[1])
+        self._record_observer_state(system)
         system.revealed = True
+        self._discover(self.get_player(), system)
         self.observer_system = system
-        self.observer_start_time = time.time()
+        self.start_observer_timer(OBSERVER_REVEAL_SECONDS)
         self.action_observer_used = True  # Verrouille l'action pour le tour
         self.observer_mode = False  # Sort du mode observer immédiatement
-        print(f"Observer: Système temporairement révélé à {target_grid_pos}.")
+        self.events.emit(SystemRevealed, target_grid_pos, system.couleur, system.est_capitale, True)
 
     def handle_input(self, event):
         """
@@ -308,8 +536,6 @@ class Game:
         """
         if self.game_state != STATE_PLAYER_TURN:
             return
-        player = self.get_player()
-        ship = player.vaisseau
         if event.type == pygame.MOUSEBUTTONDOWN:
             # Désactivation de la gestion du clic pour le déplacement
             if event.button == 1:
@@ -330,76 +556,117 @@ class Game:
                 pygame.K_KP9: (1, -1),
             }
             if event.key in movement_keys:
-                dx, dy = movement_keys[event.key]
-                if not self.movement_used:
-                    cost = 1
-                    target_pos = (ship.position[0] + dx, ship.position[1] + dy)
-                    # Vérifier que le déplacement ne reste pas dans le même système
-                    if self.game_board.get_system_at(ship.position) and \
-                            self.game_board.get_system_at(target_pos) == self.game_board.get_system_at(ship.position):
-                        print("Déplacement interne au même système interdit. Ignoré.")
-                    elif ship.movement_points_remaining >= cost and self.game_board.is_position_valid(target_pos):
-                        stop_early = ship.move_step(target_pos, cost, self.game_board)
-                        if stop_early:
-                            system = self.game_board.get_system_at(ship.position)
-                            if system:
-                                self._reveal_faction_card(system.couleur)
-                            self.movement_used = True
-                    else:
-                        print("Invalid step (boundary or insufficient points).")
-                else:
-                    print("Already moved this turn.")
+                self.move_ship(*movement_keys[event.key])
             elif event.key == pygame.K_r:
-                if not self.action_recolter_used and self.action_recolter(player):
-                    self.action_recolter_used = True
-                else:
-                    print("Action Récolter déjà utilisée ce tour.")
+                self.play_recolter()
             elif event.key == pygame.K_d:
-                if player.totems:
-                    if not self.action_deposer_used and self.action_deposer(player, player.totems[0]):
-                        self.action_deposer_used = True
-                    else:
-                        print("Action Déposer déjà utilisée ce tour.")
-                else:
-                    print("No totems to deposit.")
+                self.play_deposer()
             elif event.key == pygame.K_i:
-                if not self.action_influencer_used and self.action_influencer(player):
-                    self.action_influencer_used = True
-                else:
-                    print("Action Influencer déjà utilisée ce tour.")
+                self.play_influencer()
             elif event.key == pygame.K_o:
                 # Observer ne peut être exécuté qu'une seule fois par tour.
                 if self.action_observer_used:
-                    print("Action Observer déjà utilisée ce tour.")
+                    self.events.emit(ActionRejected, "observer", "Action Observer déjà utilisée ce tour.")
                 else:
-                    hidden_systems = [s for s in self.game_board.systems if not s.revealed]
-                    if not hidden_systems:
-                        print("Observer: Aucun système caché disponible.")
+                    if not self.game_board.hidden_mask():
+                        self.events.emit(ActionRejected, "observer", "Observer: Aucun système caché disponible.")
                     else:
-                        print("Mode Observer activé : Cliquez sur un système caché.")
+                        self.events.emit(Notice, "Mode Observer activé : Cliquez sur un système caché.")
                         self.observer_mode = True
             elif event.key == pygame.K_SPACE:
                 self.end_turn()
 
+    def move_ship(self, dx, dy):
+        """
+        Déplace le vaisseau d'une case dans la direction (dx, dy).
+        Retourne True si le pas a été effectué.
+        """
+        player = self.get_player()
+        ship = player.vaisseau
+        if self.movement_used:
+            self.events.emit(ActionRejected, "move", "Already moved this turn.")
+            return False
+        if max(abs(dx), abs(dy)) != 1:
+            self.events.emit(ActionRejected, "move", "Invalid step (one cell in one of 8 directions).")
+            return False
+        cost = 1
+        target_pos = (ship.position[0] + dx, ship.position[1] + dy)
+        # Vérifier que le déplacement ne reste pas dans le même système
+        current_system = self.game_board.get_system_at(ship.position)
+        if current_system and self.game_board.get_system_at(target_pos) == current_system:
+            self.events.emit(ActionRejected, "move", "Déplacement interne au même système interdit. Ignoré.")
+            return False
+        if ship.movement_points_remaining < cost or not self.game_board.is_position_valid(target_pos):
+            self.events.emit(ActionRejected, "move", "Invalid step (boundary or insufficient points).")
+            return False
+        self._log_action("move", dx, dy)
+        stop_early = ship.move_step(target_pos, cost, self.game_board)
+        if stop_early:
+            system = self.game_board.get_system_at(ship.position)
+            if system:
+                self._discover(player, system)
+                self._reveal_faction_card(system.couleur)
+            self.journal.record_attr(self, 'movement_used')
+            self.movement_used = True
+        return True
+
+    def play_recolter(self):
+        """Action Récolter du joueur courant, limitée à une fois par tour."""
+        if not self.action_recolter_used and self.action_recolter(self.get_player()):
+            self._log_action("recolter")
+            self.journal.record_attr(self, 'action_recolter_used')
+            self.action_recolter_used = True
+            return True
+        self.events.emit(ActionRejected, "recolter", "Action Récolter déjà utilisée ce tour.")
+        return False
+
+    def play_deposer(self, totem=None):
+        """Action Déposer du joueur courant (premier totem par défaut), une fois par tour."""
+        player = self.get_player()
+        if not player.totems:
+            self.events.emit(ActionRejected, "deposer", "No totems to deposit.")
+            return False
+        if totem is None:
+            totem = player.totems[0]
+        if not self.action_deposer_used and self.action_deposer(player, totem):
+            self._log_action("deposer", totem.faction_id, SYSTEM_COLORS.index(totem.couleur))
+            self.journal.record_attr(self, 'action_deposer_used')
+            self.action_deposer_used = True
+            return True
+        self.events.emit(ActionRejected, "deposer", "Action Déposer déjà utilisée ce tour.")
+        return False
+
+    def play_influencer(self):
+        """Action Influencer du joueur courant, limitée à une fois par tour."""
+        if not self.action_influencer_used and self.action_influencer(self.get_player()):
+            self._log_action("influencer")
+            self.journal.record_attr(self, 'action_influencer_used')
+            self.action_influencer_used = True
+            return True
+        self.events.emit(ActionRejected, "influencer", "Action Influencer déjà utilisée ce tour.")
+        return False
+
     def action_recolter(self, player):
         """Permet au joueur de récolter un totem sur le système courant."""
         ship_pos = player.vaisseau.position
         system = self.game_board.get_system_at(ship_pos)
         if not system or not system.revealed:
-            print("Action Récolter: Not on a revealed system.")
+            self.events.emit(ActionRejected, "recolter", "Action Récolter: Not on a revealed system.")
             return False
         rack = self.system_racks.get(system.couleur)
-        if not rack or not rack['faction_cards']:
-            print(f"Action Récolter: No faction cards in rack for color {system.couleur}.")
+        if not rack or not rack.faction_cards:
+            self.events.emit(ActionRejected, "recolter",
+                             "Action Récolter: No faction cards in rack for color {}.", system.couleur)
             return False
-        current_faction_id = rack['faction_cards'][0].faction_id
-        totem_to_collect = next((t for t in rack['totems'] if t.faction_id == current_faction_id), None)
+        current_faction_id = rack.top_faction
+        totem_to_collect = rack.peek(current_faction_id)
         if not totem_to_collect:
-            print(f"Action Récolter: No totems of faction {current_faction_id} available in rack {system.couleur}.")
+            self.events.emit(ActionRejected, "recolter", "Action Récolter: No totems of faction {} available in rack {}.",
+                             current_faction_id, system.couleur)
             return False
         if player.add_totem(totem_to_collect):
-            rack['totems'].remove(totem_to_collect)
-            print(f"Action Récolter successful: Player took {totem_to_collect} from rack {system.couleur}")
+            rack.take(current_faction_id)
+            self.events.emit(TotemHarvested, totem_to_collect, system.couleur)
             return True
         return False
 
@@ -408,14 +675,14 @@ class Game:
         ship_pos = player.vaisseau.position
         system = self.game_board.get_system_at(ship_pos)
         if not system or not system.revealed:
-            print("Action Déposer: Not on a revealed system.")
+            self.events.emit(ActionRejected, "deposer", "Action Déposer: Not on a revealed system.")
             return False
         rack = self.system_racks.get(system.couleur)
         if rack is None:
             return False
         if player.remove_totem(totem_to_deposit):
-            rack['totems'].append(totem_to_deposit)
-            print(f"Action Déposer successful: Player deposited {totem_to_deposit} into rack {system.couleur}")
+            rack.put(totem_to_deposit)
+            self.events.emit(TotemDeposited, totem_to_deposit, system.couleur)
             return True
         return False
 
@@ -424,68 +691,146 @@ class Game:
         ship_pos = player.vaisseau.position
         system = self.game_board.get_system_at(ship_pos)
         if not system or not system.revealed or not system.est_capitale:
-            print("Action Influencer: Not on a revealed Capital system.")
+            self.events.emit(ActionRejected, "influencer", "Action Influencer: Not on a revealed Capital system.")
             return False
         rack = self.system_racks.get(system.couleur)
-        if not rack or len(rack['faction_cards']) <= 1:
-            print(f"Action Influencer: Not enough cards in rack {system.couleur} to cycle.")
+        if not rack or len(rack.faction_cards) <= 1:
+            self.events.emit(ActionRejected, "influencer",
+                             "Action Influencer: Not enough cards in rack {} to cycle.", system.couleur)
             return False
-        top_card = rack['faction_cards'].pop(0)
-        rack['faction_cards'].append(top_card)
-        new_top_faction = rack['faction_cards'][0].faction_id
-        print(f"Action Influencer successful: New top faction for {system.couleur}: {new_top_faction}")
+        new_top_faction = rack.cycle()
+        self.events.emit(RackInfluenced, system.couleur, new_top_faction)
         self._reveal_faction_card(system.couleur)
         return True
 
+    def _record_observer_state(self, system):
+        """Journalise la révélation Observer (système, drapeaux, jeton d'échéance) avant sa modification."""
+        journal = self.journal
+        if journal.active:
+            journal.record_attr(system, 'revealed')
+            for name in ('observer_system', 'observer_start_time', '_observer_timer_token',
+                         'action_observer_used', 'observer_mode'):
+                journal.record_attr(self, name)
+
+    def start_observer_timer(self, remaining):
+        """Programme la fin de la révélation Observer en cours dans remaining secondes."""
+        now = self.timers.clock.now()
+        self.observer_start_time = now - (OBSERVER_REVEAL_SECONDS - remaining)
+        self._observer_timer_token = next(self._timer_tokens)
+        timer = self.timers.schedule(remaining, self._observer_timeout, self._observer_timer_token)
+        # Branche annulée par undo() : son échéance est retirée de l'échéancier
+        self.journal.record_inverse(_cancel_timer, timer, None, None)
+
+    def _observer_timeout(self, token):
+        if token == self._observer_timer_token and self.observer_system is not None:
+            self.expire_observer()
+
+    def next_deadline(self):
+        """
+        Instant (horloge self.timers.clock) de la prochaine échéance gérée par update(),
+        ou None s'il n'y en a aucune (ex. fin de la révélation Observer, limite du tour).
+        """
+        return self.timers.next_deadline()
+
+    def time_until_deadline(self):
+        """Secondes avant la prochaine échéance (0 si elle est passée), ou None."""
+        deadline = self.timers.next_deadline()
+        return None if deadline is None else max(0.0, deadline - self.timers.clock.now())
+
     def update(self):
-        """Mise à jour du jeu, y compris la gestion du retour en mode caché de l'observer."""
-        if self.observer_system and self.observer_start_time:
-            if time.time() - self.observer_start_time >= 2:
-                self.observer_system.revealed = False
-                print(f"Observer: Masquage du système à {self.observer_system.position}.")
-                self.observer_system = None
-                self.observer_start_time = None
+        """Mise à jour du jeu : exécute les effets temporisés arrivés à échéance."""
+        self.timers.run_due()
 
-    def draw_ui(self, surface):
-        """Dessine l'interface utilisateur avec infos détaillées pour le joueur et les systèmes révélés."""
+    def expire_observer(self):
+        """Fin de la révélation Observer : le système observé redevient caché."""
+        if self.observer_system is None:
+            return
+        self._log_action("observer_expired")
+        self._record_observer_state(self.observer_system)
+        self.observer_system.revealed = False
+        self.events.emit(SystemHidden, self.observer_system.position)
+        self.observer_system = None
+        self.observer_start_time = None
+        self._observer_timer_token = None
+
+    def _discover(self, player, system):
+        """Ajoute le système au seen_mask du joueur (il l'a révélé ou observé)."""
+        bit = 1 << system.index
+        if not player.seen_mask & bit:
+            self.journal.record_attr(player, 'seen_mask')
+            player.seen_mask |= bit
+
+    def view_mask(self, player=None):
+        """
+        Systèmes affichés révélés pour le joueur (le joueur courant par défaut) : tous
+        les systèmes révélés, ou sous brouillard de guerre ceux qu'il a lui-même vus.
+        """
+        if not self.fog_of_war:
+            return self.game_board.revealed_mask
+        return self.game_board.revealed_mask & (player or self.get_player()).seen_mask
+
+    def _panel_state(self):
+        """Valeurs affichées dans le panneau d'information ; sert de clé de mise en page."""
         player = self.get_player()
         ship = player.vaisseau
+        view = self.view_mask(player)
+        racks = []
+        for color in SYSTEM_COLORS:
+            if self.game_board.is_color_revealed(color, view):
+                rack = self.system_racks.get(color)
+                top_faction = rack.top_faction if rack else None
+                # Résumé en cache dans le rack : même objet tant que le rack ne change pas
+                racks.append((top_faction or "N/A", rack.summary() if rack else ()))
+            else:
+                racks.append(None)
+        route = self.planner.plan(player)
+        hint = (route.turns, route.next_system.position) if route else None
+        return (self.turn_count, player.id if self.num_players > 1 else None,
+                ship.position, ship.movement_points_remaining, player.score,
+                player.calculate_score(), tuple(player.totems), player.couleur,
+                player.check_victory_conditions(), hint, tuple(racks),
+                self.action_recolter_used, self.action_deposer_used, self.action_influencer_used,
+                self.action_observer_used or self.observer_mode, self.movement_used)
+
+    def _layout_panel(self, surface, state):
+        """Met en page le panneau d'information sur surface (origine en haut à gauche)."""
+        (turn_count, player_id, position, movement_points, base, bonus, totems, player_color, victory_met,
+         hint, racks, recolter_used, deposer_used, influencer_used, observer_used, movement_used) = state
+        text = self.text_cache.render
         y_offset = 10
-        x_offset = GRID_WIDTH + BOARD_OFFSET_X + 10  # Panneau d'information
+        x_offset = 0
 
         # Informations du joueur
-        turn_text = self.font.render(f"Turn: {self.turn_count}/{MAX_TURNS}", True, WHITE)
-        surface.blit(turn_text, (x_offset, y_offset))
+        turn_text = f"Turn: {turn_count}/{MAX_TURNS}"
+        if player_id is not None:
+            turn_text += f" - Joueur {player_id + 1}/{self.num_players}"
+        surface.blit(text(self.font, turn_text, WHITE), (x_offset, y_offset))
         y_offset += 30
 
-        coord_text = self.font.render(f"Position: ({ship.position[0]}, {ship.position[1]})", True, WHITE)
-        surface.blit(coord_text, (x_offset, y_offset))
+        surface.blit(text(self.font, f"Position: ({position[0]}, {position[1]})", WHITE), (x_offset, y_offset))
         y_offset += 20
 
-        move_text = self.font.render(f"Move Pts: {ship.movement_points_remaining}/{MOVEMENT_POINTS_PER_TURN}", True,
-                                     WHITE)
-        surface.blit(move_text, (x_offset, y_offset))
+        surface.blit(text(self.font, f"Move Pts: {movement_points}/{MOVEMENT_POINTS_PER_TURN}", WHITE),
+                     (x_offset, y_offset))
         y_offset += 20
 
-        base = player.score
-        bonus = player.calculate_score()
         total_score = base + bonus
-        score_text = self.font.render(f"Score: {total_score} (Base: {base}, Bonus: {bonus})", True, WHITE)
-        surface.blit(score_text, (x_offset, y_offset))
+        surface.blit(text(self.font, f"Score: {total_score} (Base: {base}, Bonus: {bonus})", WHITE),
+                     (x_offset, y_offset))
         y_offset += 30
 
         # Affichage des totems collectés
-        totem_title = self.font.render(f"Totems ({len(player.totems)}/{MAX_TOTEMS_PER_PLAYER}):", True, WHITE)
-        surface.blit(totem_title, (x_offset, y_offset))
+        surface.blit(text(self.font, f"Totems ({len(totems)}/{MAX_TOTEMS_PER_PLAYER}):", WHITE),
+                     (x_offset, y_offset))
         y_offset += 20
-        for i, totem in enumerate(player.totems):
+        for i, totem in enumerate(totems):
             # Utilisation de la fonction get_color_name pour obtenir le nom de la couleur
             c_repr = get_color_name(totem.couleur)
             totem_repr = f" - {totem.faction_id} ({c_repr})"
             try:
-                totem_surf = self.font_small.render(totem_repr, True, totem.couleur)
+                totem_surf = text(self.font_small, totem_repr, totem.couleur)
             except TypeError:
-                totem_surf = self.font_small.render(totem_repr, True, WHITE)
+                totem_surf = text(self.font_small, totem_repr, WHITE)
             surface.blit(totem_surf, (x_offset + 5, y_offset))
             y_offset += 16
             # Limiter l'affichage si nécessaire (ici on n'affiche que les 9 premiers)
@@ -493,66 +838,60 @@ class Game:
         y_offset += 10
 
         # Affichage des informations personnelles du joueur
-        player_info = self.font_small.render(f"Votre Couleur: {get_color_name(player.couleur)}", True, player.couleur)
-        surface.blit(player_info, (x_offset, y_offset))
+        surface.blit(text(self.font_small, f"Votre Couleur: {get_color_name(player_color)}", player_color),
+                     (x_offset, y_offset))
         y_offset += 16
 
-        victory_met = player.check_victory_conditions()
         victory_text = "Conditions Remplies: OUI" if victory_met else "Conditions Remplies: NON"
-        victory_info = self.font_small.render(victory_text, True, GREEN if victory_met else RED)
-        surface.blit(victory_info, (x_offset, y_offset))
+        surface.blit(text(self.font_small, victory_text, GREEN if victory_met else RED), (x_offset, y_offset))
+        y_offset += 16
+
+        # Indice du planificateur : tours restants jusqu'à la victoire et prochain système à rejoindre
+        if hint is not None:
+            turns, (target_x, target_y) = hint
+            hint_text = f"Itinéraire: {turns} tours -> ({target_x}, {target_y})"
+        else:
+            hint_text = "Itinéraire: inconnu"
+        surface.blit(text(self.font_small, hint_text, WHITE if hint else GRAY), (x_offset, y_offset))
         y_offset += 30
 
         # Informations sur les systèmes révélés pour chaque couleur
-        header = self.font_small.render("Systèmes:", True, WHITE)
-        surface.blit(header, (x_offset, y_offset))
+        surface.blit(text(self.font_small, "Systèmes:", WHITE), (x_offset, y_offset))
         y_offset += 16
-        for color in SYSTEM_COLORS:
+        for color, rack_state in zip(SYSTEM_COLORS, racks):
             color_name = get_color_name(color)
-            revealed = any(system.est_capitale and system.couleur == color and system.revealed
-                           for system in self.game_board.systems)
-
-            if revealed:
-                rack = self.system_racks.get(color)
-                faction_cards = rack['faction_cards'] if rack else []
-                totems = rack['totems'] if rack else []
-
-                top_faction = faction_cards[0].faction_id if faction_cards else "N/A"
-
+            if rack_state is not None:
+                top_faction, rack_summary = rack_state
                 # Rendu du préfixe : "YELLOW : A -"
-                prefix_text = f"{color_name}: {top_faction} - "
-                prefix_surf = self.font_small.render(prefix_text, True, WHITE)
+                prefix_surf = text(self.font_small, f"{color_name}: {top_faction} - ", WHITE)
                 surface.blit(prefix_surf, (x_offset + 5, y_offset))
 
-                # Affichage de chaque lettre avec la couleur du système
+                # Affichage de chaque lettre avec la couleur du système (glyphes pré-rendus)
                 letter_x = x_offset + 5 + prefix_surf.get_width()
-                for t in totems:
-                    faction_letter = self.font_small.render(t.faction_id, True, t.couleur)
-                    surface.blit(faction_letter, (letter_x, y_offset))
-                    letter_x += faction_letter.get_width() + 1
+                for faction_id, couleur, count in rack_summary:
+                    faction_letter = text(self.font_small, faction_id, couleur)
+                    for _ in range(count):
+                        surface.blit(faction_letter, (letter_x, y_offset))
+                        letter_x += faction_letter.get_width() + 1
             else:
-                info_text = f"{color_name}: non-révélé"
-                info_surf = self.font_small.render(info_text, True, WHITE)
-                surface.blit(info_surf, (x_offset + 5, y_offset))
+                surface.blit(text(self.font_small, f"{color_name}: non-révélé", WHITE), (x_offset + 5, y_offset))
 
             y_offset += 16
 
         # Statut des actions utilisées ce tour
         y_start_actions = y_offset
-        action_title = self.font_small.render("Actions (Utilisées):", True, WHITE)
-        surface.blit(action_title, (x_offset, y_offset))
+        surface.blit(text(self.font_small, "Actions (Utilisées):", WHITE), (x_offset, y_offset))
         y_offset += 16
         actions_status = [
-            ("R: Recolter", self.action_recolter_used),
-            ("D: Deposer", self.action_deposer_used),
-            ("I: Influencer", self.action_influencer_used),
-            ("O: Observer", self.action_observer_used or self.observer_mode),
-            ("Move", self.movement_used),
+            ("R: Recolter", recolter_used),
+            ("D: Deposer", deposer_used),
+            ("I: Influencer", influencer_used),
+            ("O: Observer", observer_used),
+            ("Move", movement_used),
         ]
-        for text, used in actions_status:
+        for label, used in actions_status:
             status_color = GRAY if used else WHITE
-            status_surf = self.font_small.render(text, True, status_color)
-            surface.blit(status_surf, (x_offset + 5, y_offset))
+            surface.blit(text(self.font_small, label, status_color), (x_offset + 5, y_offset))
             y_offset += 16
 
         y_offset = y_start_actions
@@ -561,21 +900,34 @@ class Game:
             "Contrôles:",
             " Clavier: Déplacement",
             " R/D/I/O: Actions",
-            " ESPACE: Fin Tour"
+            " ESPACE: Fin Tour",
+            " Molette/+-: Zoom",
+            " Maj+Flèches: Vue",
         ]
         for line in help_text:
-            help_surf = self.font_small.render(line, True, GRAY)
-            surface.blit(help_surf, (x_offset_help, y_offset))
+            surface.blit(text(self.font_small, line, GRAY), (x_offset_help, y_offset))
             y_offset += 16
 
+    def draw_ui(self, surface):
+        """
+        Dessine l'interface utilisateur avec infos détaillées pour le joueur et les systèmes révélés.
+        Le panneau n'est remis en page que si les valeurs affichées ont changé.
+        """
+        x_offset = self.camera.viewport.right + 10  # Panneau d'information
+        state = self._panel_state()
+        size = (max(0, surface.get_width() - x_offset), surface.get_height())
+        if self._panel_surface is None or self._panel_surface.get_size() != size or self._panel_key != state:
+            self._panel_surface = pygame.Surface(size)
+            self._layout_panel(self._panel_surface, state)
+            self._panel_key = state
+        surface.blit(self._panel_surface, (x_offset, 0))
+
         if self.game_state == STATE_GAME_OVER:
-            go_font = pygame.font.Font(None, 50)
-            go_text_1 = go_font.render("GAME OVER", True, RED)
-            score_font = pygame.font.Font(None, 40)
+            player = self.get_player()
+            go_text_1 = self.text_cache.render(self.font_game_over, "GAME OVER", RED)
             final_score = player.calculate_score() + player.score
-            go_text_2 = score_font.render(f"Score Final: {final_score}", True, WHITE)
-            center_x = BOARD_OFFSET_X + (BOARD_SIZE_X * CELL_SIZE) // 2
-            center_y = BOARD_OFFSET_Y + (BOARD_SIZE_Y * CELL_SIZE) // 2
+            go_text_2 = self.text_cache.render(self.font_final_score, f"Score Final: {final_score}", WHITE)
+            center_x, center_y = self.camera.viewport.center
             rect1 = go_text_1.get_rect(center=(center_x, center_y - 20))
             rect2 = go_text_2.get_rect(center=(center_x, center_y + 20))
             bg_rect = rect1.union(rect2).inflate(40, 40)
@@ -585,39 +937,47 @@ class Game:
             surface.blit(go_text_2, rect2)
 
     def draw(self, surface):
-        """Dessine l'ensemble de l'état du jeu."""
-        self.game_board.draw(surface)
-        player = self.get_player()
-        if player.vaisseau:
-            player.vaisseau.draw(surface)
+        """Dessine l'ensemble de l'état du jeu (le plateau à travers la caméra)."""
+        clip = surface.get_clip()
+        surface.set_clip(self.camera.clip_rect)
+        self.game_board.draw(surface, self.camera, self.view_mask())
+        for player in self.active_players():
+            if player.vaisseau:
+                player.vaisseau.draw(surface, self.camera)
+        surface.set_clip(clip)
         self.draw_ui(surface)
 
-    def check_game_over(self):
+    def check_game_over(self, player=None):
         """
-        Vérifie les conditions de fin de partie.
+        Vérifie les conditions de fin de partie, en O(1) quel que soit le nombre de joueurs.
         Fin automatique si le tour maximal est dépassé
-        ou si le joueur est sur son système d'origine et remplit une condition de victoire.
+        ou si le joueur (par défaut le joueur courant) est sur son système d'origine
+        et remplit une condition de victoire.
         """
         if self.turn_count > MAX_TURNS:
             if self.game_state != STATE_GAME_OVER:
-                self.game_state = STATE_GAME_OVER
-                print(f"\n!!! GAME OVER !!! Turn limit ({MAX_TURNS}) reached!")
-                self._calculate_final_scores()
+                self._end_game(False, "turn_limit", None)
             return True
-        player = self.get_player()
-        ship_pos = player.vaisseau.position
-        system = self.game_board.get_system_at(ship_pos)
-        if system and system.est_capitale and system.couleur == player.origin_system_color:
+        player = player or self.get_player()
+        if player.status != PLAYER_ACTIVE:
+            return False
+        origin = self.game_board.capitals.get(player.origin_system_color)
+        if origin is not None and origin.covers(player.vaisseau.position):
             if player.check_victory_conditions():
-                self.game_state = STATE_GAME_OVER
-                print(f"\n!!! VICTORY CONDITION MET !!! Player reached Origin System with winning totems!")
-                self._calculate_final_scores()
+                self._end_game(True, "victory", player)
                 return True
         return False
 
-    def _calculate_final_scores(self):
-        """Calcule et affiche le score final du joueur."""
-        print("\n--- Final Score ---")
-        player = self.get_player()
+    def _end_game(self, victory, reason, winner):
+        self.journal.record_attr(self, 'game_state')
+        self.journal.record_attr(self, 'winner')
+        self.game_state = STATE_GAME_OVER
+        self.winner = winner
+        self._calculate_final_scores(victory, reason, winner)
+
+    def _calculate_final_scores(self, victory, reason="turn_limit", player=None):
+        """Calcule et publie le score final du vainqueur (ou du joueur courant) et des autres joueurs."""
+        player = player or self.get_player()
         score = player.calculate_score()
-        print(f"Player {player.id}: {score} points in {self.turn_count - 1} turns.")
+        others = tuple((other.id, other.calculate_score()) for other in self.players if other is not player)
+        self.events.emit(GameOver, victory, player.id, score, self.turn_count - 1, reason, others)
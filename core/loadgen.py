@@ -0,0 +1,278 @@
+# core/loadgen.py
+"""
+Client asyncio du serveur de parties (core.server) et générateur de charge.
+
+run_load() ouvre de nombreuses parties en parallèle sur un serveur local, une
+connexion par siège, et joue des actions aléatoires reproductibles jusqu'à la
+fin de chaque partie. Le rapport donne le nombre de parties hébergées (dont le
+pic simultané), le débit d'actions et la latence aller-retour.
+"""
+import asyncio
+import base64
+import itertools
+import json
+import random
+import time
+
+from config import FACTION_NAMES, SYSTEM_COLORS, SERVER_HOST, STATE_GAME_OVER
+from core.policies import DIRECTIONS
+from core.server import MAX_LINE
+from core.sync import DeltaApplier, SyncError
+
+# Mélange d'actions joué par les clients de charge : (poids, action)
+ACTION_MIX = (
+    (55, "move"),
+    (12, "recolter"),
+    (8, "influencer"),
+    (3, "deposer"),
+    (22, "end_turn"),
+)
+
+
+class ServerError(Exception):
+    """Réponse d'erreur du serveur à une requête."""
+
+
+class GameClient:
+    """Connexion à un serveur de parties : requêtes numérotées et messages poussés."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.status = {}  # Dernier état de partie reçu (tour, siège courant, état, ...)
+        self.pushes = []  # Messages poussés reçus, dans l'ordre
+        self.replica = None  # DeltaApplier tenu à jour en synchronisation par deltas
+        self._resync = None
+        self.bytes_received = 0
+        self._ids = itertools.count(1)
+        self._pending = {}
+        self._changed = asyncio.Event()
+        self._read_task = asyncio.create_task(self._read_loop())
+
+    @classmethod
+    async def connect(cls, host=SERVER_HOST, port=None, path=None):
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path, limit=MAX_LINE)
+        else:
+            reader, writer = await asyncio.open_connection(host, port, limit=MAX_LINE)
+        return cls(reader, writer)
+
+    async def _read_loop(self):
+        try:
+            async for line in self.reader:
+                self.bytes_received += len(line)
+                message = json.loads(line)
+                if "state" in message:
+                    self.status = message
+                    self._changed.set()
+                self._sync(message)
+                if "push" in message:
+                    self.pushes.append(message)
+                else:
+                    future = self._pending.pop(message["id"], None)
+                    if future is not None and not future.done():
+                        future.set_result(message)
+        except ConnectionError:
+            pass
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("Connection closed by server."))
+            self._pending.clear()
+            self._changed.set()
+
+    def _sync(self, message):
+        """
+        Met à jour la réplique à partir d'une image clé ou d'un paquet de deltas reçu ;
+        les messages de deltas ne portent pas l'état de la partie, lu alors sur la réplique.
+        """
+        if message.get("keyframe") is not None:
+            keyframe = (message["sequence"], base64.b64decode(message["keyframe"]))
+            self.replica = DeltaApplier(keyframe, [base64.b64decode(packet) for packet in message["backlog"]])
+        elif message.get("delta") is not None and self.replica is not None:
+            try:
+                self.replica.apply(base64.b64decode(message["delta"]))
+            except SyncError:
+                # Paquet perdu : on repart de la prochaine image clé demandée au serveur
+                self.replica = None
+                self._resync = asyncio.create_task(self.request("keyframe"))
+                return
+            game = self.replica.game
+            self.status = {**self.status, "turn": game.turn_count, "current": game.scheduler.current,
+                           "state": game.game_state, "winner": game.winner.id if game.winner is not None else None}
+            self._changed.set()
+
+    @property
+    def connected(self):
+        return not self._read_task.done()
+
+    async def request(self, op, **fields):
+        """Envoie une requête et renvoie sa réponse ; lève ServerError si elle est refusée."""
+        if not self.connected:
+            raise ConnectionError("Not connected.")
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        self.writer.write((json.dumps({"id": request_id, "op": op, **fields}) + "\n").encode("utf-8"))
+        await self.writer.drain()
+        reply = await future
+        if not reply["ok"]:
+            raise ServerError(reply["error"])
+        return reply
+
+    async def act(self, *action):
+        return await self.request("act", action=list(action))
+
+    async def wait_status(self):
+        """Attend le prochain changement d'état (réponse, message poussé ou fermeture)."""
+        self._changed.clear()
+        await self._changed.wait()
+
+    async def close(self):
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except (ConnectionError, OSError):
+            pass
+        await self._read_task
+
+
+def random_action(rng):
+    """Action tirée selon ACTION_MIX (les refus du moteur font partie de la charge)."""
+    kind = rng.choices([kind for _, kind in ACTION_MIX], [weight for weight, _ in ACTION_MIX])[0]
+    if kind == "move":
+        return (kind,) + rng.choice(DIRECTIONS)
+    if kind == "deposer":
+        return (kind, rng.choice(FACTION_NAMES), rng.randrange(len(SYSTEM_COLORS)))
+    return (kind,)
+
+
+class LoadReport:
+    """Compteurs d'un run_load()."""
+
+    def __init__(self):
+        self.games = 0
+        self.games_finished = 0
+        self.peak_games = 0
+        self.actions = 0
+        self.rejected = 0
+        self.errors = 0
+        self.latencies = []
+        self.bytes_received = 0  # Octets reçus par tous les clients (joueurs et spectateurs)
+        self.elapsed = 0.0
+        self._active = 0
+
+    def game_started(self):
+        self.games += 1
+        self._active += 1
+        self.peak_games = max(self.peak_games, self._active)
+
+    def game_ended(self, finished):
+        self._active -= 1
+        self.games_finished += finished
+
+    def summary(self):
+        latencies = sorted(self.latencies)
+
+        def percentile(fraction):
+            return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))] * 1000 if latencies else None
+
+        return {
+            "games": self.games,
+            "games_finished": self.games_finished,
+            "peak_games": self.peak_games,
+            "actions": self.actions,
+            "rejected": self.rejected,
+            "errors": self.errors,
+            "elapsed": self.elapsed,
+            "actions_per_sec": self.actions / self.elapsed if self.elapsed else 0.0,
+            "bytes_per_action": self.bytes_received / self.actions if self.actions else 0.0,
+            "latency_p50_ms": percentile(0.5),
+            "latency_p99_ms": percentile(0.99),
+        }
+
+    def describe(self):
+        s = self.summary()
+        text = (f"Hosted {s['games']} games ({s['games_finished']} finished, peak {s['peak_games']} concurrent) "
+                f"in {s['elapsed']:.2f}s\n"
+                f"{s['actions']} actions ({s['actions_per_sec']:.0f} actions/sec, {s['rejected']} rejected by rules, "
+                f"{s['errors']} protocol errors)\n"
+                f"{s['bytes_per_action']:.0f} bytes received per action")
+        if self.latencies:
+            text += f"\nRound-trip latency p50 {s['latency_p50_ms']:.2f} ms, p99 {s['latency_p99_ms']:.2f} ms"
+        return text
+
+
+async def _play_seat(client, seat, rng, report):
+    """Joue pour un siège jusqu'à la fin de la partie."""
+    while client.connected and client.status.get("state") != STATE_GAME_OVER:
+        status = client.status
+        if not status.get("started") or status.get("current") != seat:
+            await client.wait_status()
+            continue
+        start = time.perf_counter()
+        try:
+            reply = await client.act(*random_action(rng))
+        except ServerError:
+            report.errors += 1
+            continue
+        report.latencies.append(time.perf_counter() - start)
+        report.actions += 1
+        report.rejected += not reply["accepted"]
+
+
+async def _watch(client):
+    """Spectateur : attend la fin de la partie."""
+    while client.connected and client.status.get("state") != STATE_GAME_OVER:
+        await client.wait_status()
+
+
+async def _play_game(connect, players, seed, report, sync="events", spectators=0):
+    clients = [await connect()]
+    watchers = []
+    started = False
+    try:
+        created = await clients[0].request("create", players=players, seed=seed, sync=sync)
+        for _ in range(spectators):
+            watcher = await connect()
+            watchers.append(watcher)
+            await watcher.request("spectate", game=created["game"])
+        for _ in range(players - 1):
+            client = await connect()
+            clients.append(client)
+            await client.request("join", game=created["game"], sync=sync)
+        report.game_started()
+        started = True
+        rng = random.Random(seed)
+        await asyncio.gather(*(_play_seat(client, seat, random.Random(rng.getrandbits(64)), report)
+                               for seat, client in enumerate(clients)),
+                             *(_watch(watcher) for watcher in watchers))
+    finally:
+        if started:
+            report.game_ended(clients[0].status.get("state") == STATE_GAME_OVER)
+        for client in clients + watchers:
+            report.bytes_received += client.bytes_received
+            await client.close()
+
+
+async def run_load(games, players=1, concurrency=None, seed=0, host=SERVER_HOST, port=None, path=None,
+                   sync="events", spectators=0):
+    """
+    Joue games parties de players sièges contre le serveur, concurrency à la fois
+    (toutes par défaut). La partie n° i utilise la graine seed + i. sync : "events"
+    ou "deltas" pour les joueurs ; spectators : spectateurs par partie. Renvoie un LoadReport.
+    """
+    report = LoadReport()
+    limit = asyncio.Semaphore(concurrency or games)
+
+    async def connect():
+        return await GameClient.connect(host, port, path)
+
+    async def one_game(index):
+        async with limit:
+            await _play_game(connect, players, seed + index, report, sync, spectators)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one_game(index) for index in range(games)))
+    report.elapsed = time.perf_counter() - start
+    return report
@@ -0,0 +1,119 @@
+# core/montecarlo.py
+"""
+Pilote Monte Carlo : répartit des parties indépendantes et reproductibles
+sur tous les cœurs via un pool de processus, et agrège les statistiques
+(taux de victoire, tours jusqu'à la victoire, score final) par couleur d'origine.
+"""
+import collections
+import math
+import multiprocessing
+
+from core.simulation import play_seeded_game
+
+
+def _run_chunk(task):
+    """Worker : joue les parties [start, stop) de la série et renvoie des tuples compacts."""
+    policy_name, seed, start, stop, num_players = task
+    results = [play_seeded_game(policy_name, seed, index, num_players=num_players)
+               for index in range(start, stop)]
+    return [(r["origin"], r["won"], r["turns"], r["score"]) for r in results]
+
+
+def iter_results(num_games, policy_name="greedy", seed=0, workers=None, chunk_size=256, num_players=1):
+    """
+    Génère les résultats (origin, won, turns, score) au fil de l'eau, par paquets
+    de chunk_size parties. L'ordre d'arrivée dépend de l'ordonnancement, mais chaque
+    partie ne dépend que de (seed, index) : l'ensemble est reproductible.
+    Avec num_players > 1, les résultats sont ceux du joueur du siège 0.
+    workers : nombre de processus (None : tous les cœurs, 1 : dans ce processus).
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be at least 1 (or None for all cores).")
+    tasks = [(policy_name, seed, start, min(start + chunk_size, num_games), num_players)
+             for start in range(0, num_games, chunk_size)]
+    if workers == 1:
+        for task in tasks:
+            yield from _run_chunk(task)
+        return
+    with multiprocessing.Pool(workers) as pool:
+        for chunk in pool.imap_unordered(_run_chunk, tasks):
+            yield from chunk
+
+
+def _percentile(counter, total, fraction):
+    """Percentile (au rang le plus proche) d'une distribution stockée en Counter."""
+    if total == 0:
+        return None
+    rank = max(1, math.ceil(fraction * total))
+    seen = 0
+    for value in sorted(counter):
+        seen += counter[value]
+        if seen >= rank:
+            return value
+    return None
+
+
+class OriginStats:
+    """Distributions accumulées pour une couleur d'origine."""
+
+    def __init__(self):
+        self.games = 0
+        self.wins = 0
+        self.turns_to_victory = collections.Counter()
+        self.scores = collections.Counter()
+        self.score_sum = 0.0
+        self.score_sq_sum = 0.0
+
+    def add(self, won, turns, score):
+        self.games += 1
+        if won:
+            self.wins += 1
+            self.turns_to_victory[turns] += 1
+        self.scores[score] += 1
+        self.score_sum += score
+        self.score_sq_sum += score * score
+
+    def summary(self):
+        mean = self.score_sum / self.games if self.games else 0.0
+        variance = self.score_sq_sum / self.games - mean * mean if self.games else 0.0
+        return {
+            "games": self.games,
+            "win_rate": self.wins / self.games if self.games else 0.0,
+            "turns_p50": _percentile(self.turns_to_victory, self.wins, 0.5),
+            "turns_p90": _percentile(self.turns_to_victory, self.wins, 0.9),
+            "turns_mean": (sum(t * n for t, n in self.turns_to_victory.items()) / self.wins
+                           if self.wins else None),
+            "score_mean": mean,
+            "score_std": math.sqrt(max(0.0, variance)),
+            "score_p10": _percentile(self.scores, self.games, 0.1),
+            "score_p50": _percentile(self.scores, self.games, 0.5),
+            "score_p90": _percentile(self.scores, self.games, 0.9),
+        }
+
+
+class MonteCarloStats:
+    """Agrège les résultats de parties par couleur d'origine."""
+
+    def __init__(self):
+        self.by_origin = collections.defaultdict(OriginStats)
+        self.overall = OriginStats()
+
+    def add(self, origin, won, turns, score):
+        self.by_origin[origin].add(won, turns, score)
+        self.overall.add(won, turns, score)
+
+    def summary(self):
+        return {
+            "overall": self.overall.summary(),
+            "by_origin": {origin: stats.summary() for origin, stats in sorted(self.by_origin.items())},
+        }
+
+
+def run_monte_carlo(num_games, policy_name="greedy", seed=0, workers=None, chunk_size=256, num_players=1):
+    """Joue num_games parties en parallèle et renvoie les statistiques agrégées."""
+    stats = MonteCarloStats()
+    for result in iter_results(num_games, policy_name, seed, workers, chunk_size, num_players):
+        stats.add(*result)
+    return stats
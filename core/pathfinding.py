@@ -0,0 +1,239 @@
+# core/pathfinding.py
+"""
+Champs de distance réutilisables pour la recherche de chemins sur le plateau.
+
+Un DistanceField est calculé une fois par case de départ (BFS en 8-connexité,
+les cases du système de départ autres que la case elle-même étant interdites)
+et garde la distance et le parent de chaque case dans des tableaux plats.
+Les chemins sont ensuite reconstruits en remontant les parents.
+SystemStepField fait de même en s'arrêtant à l'entrée des systèmes (règle de
+mouvement) ; SystemBitboard en donne les seules distances, mot à mot sur un
+bitboard, pour la matrice des tours entre systèmes et le planificateur.
+"""
+import collections
+from array import array
+
+
+class DistanceField:
+    """Distances et parents BFS depuis une case de départ."""
+
+    def __init__(self, game_board, start):
+        size_x, size_y = game_board.size_x, game_board.size_y
+        self.start = start
+        self.size_x = size_x
+        self.size_y = size_y
+        self.distance = array('i', [-1]) * (size_x * size_y)
+        self.parent = array('i', [-1]) * (size_x * size_y)
+        if game_board.is_position_valid(start):
+            self._explore(game_board)
+
+    def _explore(self, game_board):
+        size_x, size_y = self.size_x, self.size_y
+        grid = game_board.grid
+        distance, parent = self.distance, self.parent
+        start_system = game_board.get_system_at(self.start)
+        origin = self.start[0] * size_y + self.start[1]
+        distance[origin] = 0
+        # Parcours par niveaux : même ordre d'expansion qu'une file FIFO
+        frontier = [origin]
+        level = 0
+        while frontier:
+            level += 1
+            next_frontier = []
+            for index in frontier:
+                x, y = divmod(index, size_y)
+                for dx in (-1, 0, 1):
+                    nx = x + dx
+                    if not 0 <= nx < size_x:
+                        continue
+                    column = grid[nx]
+                    for dy in (-1, 0, 1):
+                        ny = y + dy
+                        if (dx == 0 and dy == 0) or not 0 <= ny < size_y:
+                            continue
+                        neighbour = nx * size_y + ny
+                        if distance[neighbour] != -1:
+                            continue
+                        # Déplacement interne au système de départ interdit
+                        if start_system is not None and column[ny] is start_system:
+                            continue
+                        distance[neighbour] = level
+                        parent[neighbour] = index
+                        next_frontier.append(neighbour)
+            frontier = next_frontier
+
+    def distance_to(self, position):
+        """Nombre de pas jusqu'à position, ou None si inaccessible."""
+        x, y = position
+        if not (0 <= x < self.size_x and 0 <= y < self.size_y):
+            return None
+        dist = self.distance[x * self.size_y + y]
+        return dist if dist >= 0 else None
+
+    def path_to(self, position):
+        """Chemin [start, ..., position] le plus court, ou None si inaccessible."""
+        if self.distance_to(position) is None:
+            return None
+        path = []
+        index = position[0] * self.size_y + position[1]
+        while index != -1:
+            path.append(divmod(index, self.size_y))
+            index = self.parent[index]
+        path.reverse()
+        return path
+
+
+class SystemStepField(DistanceField):
+    """
+    Distances BFS depuis un ensemble de cases de départ, arrêtées à l'entrée des
+    systèmes : un vaisseau perd ses points de mouvement en entrant dans un système,
+    ses cases sont donc atteintes mais jamais traversées (les cases du système de
+    départ restent interdites). steps[i] est le nombre de pas pour entrer dans
+    game_board.systems[i] (None si inaccessible sans escale).
+    """
+
+    def __init__(self, game_board, starts):
+        self.starts = list(starts)
+        self.steps = [None] * len(game_board.systems)
+        super().__init__(game_board, self.starts[0])
+
+    def _explore(self, game_board):
+        size_x, size_y = self.size_x, self.size_y
+        grid = game_board.grid
+        distance, parent, steps = self.distance, self.parent, self.steps
+        start_system = game_board.get_system_at(self.start)
+        frontier = []
+        for x, y in self.starts:
+            distance[x * size_y + y] = 0
+            frontier.append(x * size_y + y)
+        level = 0
+        while frontier:
+            level += 1
+            next_frontier = []
+            for index in frontier:
+                x, y = divmod(index, size_y)
+                for dx in (-1, 0, 1):
+                    nx = x + dx
+                    if not 0 <= nx < size_x:
+                        continue
+                    column = grid[nx]
+                    for dy in (-1, 0, 1):
+                        ny = y + dy
+                        if (dx == 0 and dy == 0) or not 0 <= ny < size_y:
+                            continue
+                        neighbour = nx * size_y + ny
+                        if distance[neighbour] != -1:
+                            continue
+                        system = column[ny]
+                        if system is not None and system is start_system:
+                            continue
+                        distance[neighbour] = level
+                        parent[neighbour] = index
+                        if system is None:
+                            next_frontier.append(neighbour)
+                        elif steps[system.index] is None:
+                            steps[system.index] = level
+            frontier = next_frontier
+
+    def entry_cell(self, system):
+        """Case par laquelle le chemin le plus court entre dans system, ou None."""
+        best = None
+        for x in range(system.position[0], system.position[0] + system.size[0]):
+            for y in range(system.position[1], system.position[1] + system.size[1]):
+                dist = self.distance_to((x, y))
+                if dist is not None and (best is None or dist < best[0]):
+                    best = (dist, (x, y))
+        return best[1] if best else None
+
+
+class SystemBitboard:
+    """
+    Plateau en bitboard : un entier, une colonne de size_y + 1 bits par x (le bit de
+    garde empêche un décalage de passer d'une colonne à l'autre). Un niveau de BFS en
+    8-connexité se calcule sur tout le plateau par quelques décalages et masques.
+    """
+
+    def __init__(self, game_board):
+        self.height = height = game_board.size_y + 1
+        column = (1 << game_board.size_y) - 1
+        self.cells = sum(column << (x * height) for x in range(game_board.size_x))
+        self.system_masks = []  # Cases de chaque système, dans l'ordre de game_board.systems
+        occupied = 0
+        for system in game_board.systems:
+            sx, sy = system.position
+            mask = 0
+            for x in range(sx, min(sx + system.size[0], game_board.size_x)):
+                for y in range(sy, min(sy + system.size[1], game_board.size_y)):
+                    mask |= 1 << (x * height + y)
+            self.system_masks.append(mask)
+            occupied |= mask
+        self.free = self.cells & ~occupied  # Cases traversables sans s'arrêter
+
+    def steps_from(self, starts, start_system=None):
+        """
+        Pas pour entrer dans chaque système depuis les cases starts, en s'arrêtant à
+        l'entrée des systèmes (mêmes valeurs que SystemStepField.steps) ; les cases de
+        start_system, le système de départ, sont interdites.
+        """
+        height = self.height
+        allowed = self.cells
+        if start_system is not None:
+            allowed &= ~self.system_masks[start_system.index]
+        frontier = 0
+        for x, y in starts:
+            frontier |= 1 << (x * height + y)
+        reached = frontier
+        steps = [None] * len(self.system_masks)
+        pending = [(index, mask) for index, mask in enumerate(self.system_masks) if mask & allowed]
+        level = 0
+        while frontier and pending:
+            level += 1
+            spread = frontier | frontier << 1 | frontier >> 1
+            spread |= spread << height | spread >> height
+            new = spread & allowed & ~reached
+            reached |= new
+            waiting = []
+            for index, mask in pending:
+                if new & mask:
+                    steps[index] = level
+                else:
+                    waiting.append((index, mask))
+            pending = waiting
+            frontier = new & self.free  # Les systèmes atteints ne sont pas traversés
+        return steps
+
+
+class PathFinder:
+    """
+    Cache LRU de champs de distance par case de départ, invalidé dès que la
+    disposition du plateau change (GameBoard.layout_version).
+    """
+
+    def __init__(self, game_board, max_fields=256):
+        self.game_board = game_board
+        self.max_fields = max_fields
+        self._fields = collections.OrderedDict()
+        self._layout_version = game_board.layout_version
+
+    def field(self, start):
+        """Renvoie le champ de distance depuis start, calculé au besoin."""
+        if self._layout_version != self.game_board.layout_version:
+            self._fields.clear()
+            self._layout_version = self.game_board.layout_version
+        field = self._fields.get(start)
+        if field is None:
+            field = DistanceField(self.game_board, start)
+            self._fields[start] = field
+            if len(self._fields) > self.max_fields:
+                self._fields.popitem(last=False)
+        else:
+            self._fields.move_to_end(start)
+        return field
+
+    def find_path(self, start_pos, end_pos, max_dist):
+        """Chemin le plus court de start_pos à end_pos en au plus max_dist pas, ou None."""
+        field = self.field(start_pos)
+        dist = field.distance_to(end_pos)
+        if dist is None or dist > max_dist:
+            return None
+        return field.path_to(end_pos)
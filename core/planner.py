@@ -0,0 +1,313 @@
+# core/planner.py
+"""
+Planificateur d'itinéraires : la suite de visites de systèmes qui réunit le
+plus tôt un ensemble de totems gagnant puis ramène le vaisseau à son Système
+d'Origine (indice à l'écran, politique de jeu "planner").
+
+Modèle de coût :
+- une visite d'un système révélé pour le joueur rapporte le totem que donnerait
+  Récolter au moment du calcul (faction visible du rack, ou la suivante après
+  Influencer sur une Capitale quand la faction visible est épuisée) ;
+- une récolte par tour : d'un système au suivant, GameBoard.travel_turns()
+  (au moins un tour) ; depuis le vaisseau, SystemBitboard.steps_from et les
+  points de mouvement restants du tour ;
+- les conditions de victoire ne dépendent que des paires (faction, couleur)
+  possédées : un ensemble de totems est un masque de 42 bits et chaque
+  condition se teste par quelques & et popcounts.
+
+Recherche : programmation dynamique en masques de bits à la Held-Karp, sur les
+paires apportées par les systèmes utiles (deux systèmes de même paire donnent
+le même état) : cost[paires][dernier] = tour de la récolte du dernier système.
+Une route gloutonne fournit un premier majorant ; les états sont parcourus par
+nombre de visites croissant et élagués par deux minorants : le retour à
+l'origine depuis le dernier système (la matrice des tours respecte l'inégalité
+triangulaire) et le nombre de récoltes qui manquent encore (visits_needed).
+Le budget est un nombre de transitions examinées, calibré pour tenir dans une
+fraction d'image : le résultat ne dépend pas de la vitesse de la machine
+(simulations reproductibles). Budget épuisé, la meilleure route trouvée est
+renvoyée avec complete=False.
+"""
+import math
+
+from config import (FACTION_NAMES, MOVEMENT_POINTS_PER_TURN, PLANNER_MAX_SYSTEMS, PLANNER_WORK_BUDGET,
+                    SYSTEM_COLORS)
+from core.pathfinding import SystemBitboard
+
+_FACTION_INDEX = {faction: index for index, faction in enumerate(FACTION_NAMES)}
+_COLOR_INDEX = {color: index for index, color in enumerate(SYSTEM_COLORS)}
+# Bit d'une paire (faction, couleur) : index de faction * nombre de couleurs + index de couleur ;
+# chaque faction occupe une ligne de len(SYSTEM_COLORS) bits
+_ROW = (1 << len(SYSTEM_COLORS)) - 1
+_ROW_SHIFTS = [f * len(SYSTEM_COLORS) for f in range(len(FACTION_NAMES))]
+
+
+def pair_bit(totem):
+    """Bit de la paire (faction, couleur) du totem."""
+    return 1 << (_FACTION_INDEX[totem.faction_id] * len(SYSTEM_COLORS) + _COLOR_INDEX[totem.couleur])
+
+
+def is_winning(pairs):
+    """Vrai si les paires possédées remplissent une condition de victoire (cf. Player.check_victory_conditions)."""
+    return visits_needed(pairs) == 0
+
+
+def visits_needed(pairs):
+    """
+    Minorant du nombre de récoltes (une paire chacune) avant la victoire : le minimum,
+    sur les quatre conditions, des factions, couleurs ou paires manquantes. Les
+    couleurs présentes dans au moins 1, 2 et 3 lignes sont calculées mot à mot.
+    """
+    colors_1 = colors_2 = colors_3 = 0
+    missing_factions = len(_ROW_SHIFTS)
+    widest = 0  # Plus grand nombre de couleurs d'une même faction
+    for shift in _ROW_SHIFTS:
+        row = pairs >> shift & _ROW
+        if row:
+            missing_factions -= 1
+            colors_3 |= colors_2 & row
+            colors_2 |= colors_1 & row
+            colors_1 |= row
+            widest = max(widest, row.bit_count())
+    same_color = 0 if colors_3 else 1 if colors_2 else 2 if colors_1 else 3
+    return min(missing_factions, len(SYSTEM_COLORS) - colors_1.bit_count(), same_color, max(0, 3 - widest))
+
+
+def harvest_preview(rack, est_capitale):
+    """Totem que rapporterait une visite du système (Influencer compris sur une Capitale), ou None."""
+    if rack is None or not rack.faction_cards:
+        return None
+    totem = rack.peek(rack.top_faction)
+    if totem is None and est_capitale and len(rack.faction_cards) > 1:
+        totem = rack.peek(rack.faction_cards[1].faction_id)
+    return totem
+
+
+class Route:
+    """Itinéraire planifié pour un joueur."""
+
+    __slots__ = ('visits', 'destination', 'turns', 'complete')
+
+    def __init__(self, visits, destination, turns, complete):
+        self.visits = visits  # Systèmes où récolter, dans l'ordre
+        self.destination = destination  # Système d'Origine, où finir le tour de la victoire
+        self.turns = turns  # Tours à jouer, celui en cours compris, jusqu'à la victoire
+        self.complete = complete  # False si le budget a interrompu la recherche (route peut-être non minimale)
+
+    @property
+    def next_system(self):
+        """Prochain système où se rendre."""
+        return self.visits[0] if self.visits else self.destination
+
+
+class RoutePlanner:
+    """
+    Itinéraires des joueurs d'une partie, recalculés seulement quand leur
+    situation change (position, actions du tour, inventaire, racks, visibilité).
+    """
+
+    def __init__(self, game, work_budget=PLANNER_WORK_BUDGET, max_systems=PLANNER_MAX_SYSTEMS):
+        self.game = game
+        self.work_budget = work_budget  # Transitions examinées au plus par recherche
+        self.max_systems = max_systems  # Systèmes utiles retenus (les plus proches du vaisseau)
+        self._cache = {}  # Siège -> (clé de situation, Route ou None)
+        self._bitboard = None  # SystemBitboard de la disposition courante
+        self._steps = {}  # Case -> pas jusqu'à chaque système, pour la disposition courante
+        self._steps_version = None
+
+    def _key(self, player):
+        game = self.game
+        ship = player.vaisseau
+        return (game.game_board.layout_version, game.view_mask(player), ship.position,
+                ship.movement_points_remaining, player.movement_used, player.action_recolter_used,
+                tuple(player.totems), tuple(rack.version for rack in game.system_racks.values()))
+
+    def plan(self, player=None):
+        """
+        Route de moindre coût en tours pour le joueur (le joueur courant par défaut),
+        ou None si aucun ensemble gagnant n'est accessible avec les systèmes qu'il voit.
+        """
+        player = player or self.game.get_player()
+        key = self._key(player)
+        cached = self._cache.get(player.id)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        route = self._search(player)
+        self._cache[player.id] = (key, route)
+        return route
+
+    def _steps_from(self, position):
+        """Pas jusqu'à chaque système depuis position, en cache tant que la disposition ne change pas."""
+        board = self.game.game_board
+        if self._steps_version != board.layout_version:
+            self._bitboard = SystemBitboard(board)
+            self._steps = {}
+            self._steps_version = board.layout_version
+        elif len(self._steps) >= 64:
+            self._steps = {}
+        steps = self._steps.get(position)
+        if steps is None:
+            steps = self._bitboard.steps_from([position], board.get_system_at(position))
+            self._steps[position] = steps
+        return steps
+
+    def _search(self, player):
+        game = self.game
+        board = game.game_board
+        ship = player.vaisseau
+        origin = board.capitals.get(player.origin_system_color)
+        if origin is None:
+            return None
+        travel = board.travel_turns()
+        moves_left = 0 if player.movement_used else ship.movement_points_remaining
+        current = board.get_system_at(ship.position)
+
+        # Tour d'arrivée dans chaque système depuis le vaisseau (escales forcées comprises)
+        steps = self._steps_from(ship.position)
+        arrival = [math.inf if step is None else -(-max(0, step - moves_left) // MOVEMENT_POINTS_PER_TURN)
+                   for step in steps]
+        if current is not None:
+            arrival[current.index] = 0
+        for via, via_arrival in enumerate(arrival[:]):
+            if via_arrival != math.inf:
+                row = travel[via]
+                for target, turn in enumerate(row):
+                    if via_arrival + turn < arrival[target]:
+                        arrival[target] = via_arrival + turn
+        if arrival[origin.index] == math.inf:
+            return None
+
+        owned = 0
+        for totem in player.totems:
+            owned |= pair_bit(totem)
+        if is_winning(owned):
+            return Route([], origin, arrival[origin.index] + 1, True)
+
+        # Systèmes utiles : révélés pour le joueur, accessibles, et rapportant une paire nouvelle
+        candidates = []
+        for system in board.systems_in(game.view_mask(player)):
+            totem = harvest_preview(game.system_racks.get(system.couleur), system.est_capitale)
+            if totem is not None and not owned & pair_bit(totem) and arrival[system.index] != math.inf:
+                candidates.append((arrival[system.index], system.index, system, pair_bit(totem)))
+        candidates.sort(key=lambda candidate: candidate[:2])
+        candidates = candidates[:self.max_systems]
+        count = len(candidates)
+        if not count:
+            return None
+        systems = [candidate[2] for candidate in candidates]
+        gains = [candidate[3] for candidate in candidates]
+        legs = [[travel[a.index][b.index] for b in systems] for a in systems]
+        homeward = [travel[system.index][origin.index] for system in systems]
+        from_ship_arrival = [arrival[system.index] for system in systems]
+        first_harvest = 1 if player.action_recolter_used else 0
+        start = [max(turn, first_harvest) for turn in from_ship_arrival]
+        # Récolte immédiate dans le système du vaisseau : il peut encore repartir ce tour-ci
+        ship_index = None
+        for index, system in enumerate(systems):
+            if system is current and not first_harvest:
+                ship_index = index
+
+        def leg(from_ship, last, turn, target):
+            """Tour de la récolte dans target après celle de last au tour turn."""
+            next_turn = turn + legs[last][target]
+            if from_ship:
+                next_turn = min(next_turn, max(from_ship_arrival[target], turn + 1))
+            return next_turn
+
+        def finish(from_ship, last, turn):
+            """Tour d'arrivée à l'origine après la récolte dans last au tour turn."""
+            end = turn + homeward[last]
+            if from_ship:
+                end = min(end, max(turn, arrival[origin.index]))
+            return end
+
+        # Route gloutonne (système utile le plus proche d'abord) : premier majorant pour l'élagage
+        greedy, bound = [], math.inf
+        last, turn, pairs = None, None, owned
+        while not is_winning(pairs):
+            from_ship = len(greedy) == 1 and last == ship_index
+            options = [(start[target] if last is None else leg(from_ship, last, turn, target), target)
+                       for target in range(count) if gains[target] & ~pairs]
+            if not options:
+                break
+            turn, last = min(options)
+            pairs |= gains[last]
+            greedy.append(last)
+        if is_winning(pairs):
+            bound = finish(len(greedy) == 1 and last == ship_index, last, turn)
+
+        # État : paires possédées (une visite ne compte que par la paire qu'elle apporte) et
+        # dernier système visité. Seuls les états atteints sont parcourus, couche par couche.
+        cost = {}  # Paires -> tour de récolte par dernier système
+        parent = {}  # Paires -> système précédent par dernier système
+        layer = []
+        for index, turn in enumerate(start):
+            state = owned | gains[index]
+            row = cost.get(state)
+            if row is None:
+                row = cost[state] = [math.inf] * count
+                parent[state] = [None] * count
+                layer.append(state)
+            row[index] = turn
+
+        best = None  # (paires, dernier système) d'une route meilleure que la gloutonne
+        complete = True
+        work = 0
+        depth = 1
+        # Chaque visite coûte au moins un tour : les couches plus profondes ne font pas mieux
+        while layer and depth - 1 < bound and complete:
+            next_layer = []
+            for state in layer:
+                if work > self.work_budget:
+                    complete = False
+                    break
+                needed = visits_needed(state)
+                work += 1
+                for last, turn in enumerate(cost[state]):
+                    if turn >= bound:
+                        continue
+                    from_ship = depth == 1 and last == ship_index
+                    # Retour direct à l'origine : minorant de toute route prolongée (inégalité triangulaire)
+                    end = turn + homeward[last]
+                    if from_ship:
+                        end = min(end, max(turn, arrival[origin.index]))
+                    if not needed:
+                        if end < bound:
+                            best, bound = (state, last), end
+                        continue
+                    if max(end, turn + needed) >= bound:
+                        continue
+                    work += count
+                    leg_row = legs[last]
+                    # leg() en ligne : boucle la plus chaude de la recherche
+                    for target in range(count):
+                        gain = gains[target]
+                        if state & gain:  # Aucune paire nouvelle : visite inutile
+                            continue
+                        next_turn = turn + leg_row[target]
+                        if from_ship:
+                            next_turn = min(next_turn, max(from_ship_arrival[target], turn + 1))
+                        if next_turn + homeward[target] >= bound:
+                            continue
+                        next_state = state | gain
+                        next_row = cost.get(next_state)
+                        if next_row is None:
+                            next_row = cost[next_state] = [math.inf] * count
+                            parent[next_state] = [None] * count
+                            next_layer.append(next_state)
+                        if next_turn < next_row[target]:
+                            next_row[target] = next_turn
+                            parent[next_state][target] = last
+            layer = next_layer
+            depth += 1
+
+        if bound == math.inf:
+            return None
+        if best is None:
+            return Route([systems[index] for index in greedy], origin, bound + 1, complete)
+        state, last = best
+        visits = []
+        while last is not None:
+            visits.append(systems[last])
+            last, state = parent[state][last], state ^ gains[last]
+        visits.reverse()
+        return Route(visits, origin, bound + 1, complete)
@@ -0,0 +1,154 @@
+# core/policies.py
+"""
+Politiques de jeu automatiques utilisées par les simulations headless.
+Chaque politique joue un tour complet via les actions publiques de Game
+(move_ship, play_recolter, play_deposer, play_influencer) sans terminer le tour.
+"""
+import random
+
+from config import MOVEMENT_POINTS_PER_TURN, MAX_TOTEMS_PER_PLAYER, SYSTEM_SIZE
+from core.pathfinding import SystemStepField
+
+DIRECTIONS = [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if (dx, dy) != (0, 0)]
+
+
+def _sign(value):
+    return (value > 0) - (value < 0)
+
+
+class RandomPolicy:
+    """Déplacements aléatoires, puis tentative de chaque action disponible."""
+
+    def __init__(self, rng=None):
+        self.rng = rng or random.Random()
+
+    def play_turn(self, game):
+        directions = DIRECTIONS[:]
+        for _ in range(MOVEMENT_POINTS_PER_TURN):
+            if game.movement_used:
+                break
+            self.rng.shuffle(directions)
+            if not any(game.move_ship(dx, dy) for dx, dy in directions):
+                break
+        if self.rng.random() < 0.5:
+            game.play_influencer()
+        game.play_recolter()
+        if len(game.get_player().totems) >= MAX_TOTEMS_PER_PLAYER and self.rng.random() < 0.5:
+            game.play_deposer(self.rng.choice(game.get_player().totems))
+
+
+class GreedyPolicy:
+    """
+    Politique scriptée : visite le système non visité le plus proche, récolte
+    (en influençant si nécessaire), puis rentre au Système d'Origine dès qu'une
+    condition de victoire est remplie.
+    """
+
+    def __init__(self, rng=None):
+        self.rng = rng or random.Random()
+        self.visited = set()  # Positions des systèmes déjà exploités
+
+    def _choose_target(self, game):
+        player = game.get_player()
+        if player.check_victory_conditions():
+            return game.player_origin_system_pos
+        ship_pos = player.vaisseau.position
+        current = game.game_board.get_system_at(ship_pos)
+        best, best_dist = None, None
+        for system in game.game_board.systems:
+            if system is current or system.position in self.visited:
+                continue
+            dist = max(abs(system.position[0] - ship_pos[0]), abs(system.position[1] - ship_pos[1]))
+            if best_dist is None or dist < best_dist:
+                best, best_dist = system.position, dist
+        if best is None:
+            # Tous les systèmes ont été visités : on recommence un cycle
+            self.visited.clear()
+            return game.player_origin_system_pos
+        return best
+
+    def _move_towards(self, game, target):
+        ship = game.get_player().vaisseau
+        for _ in range(MOVEMENT_POINTS_PER_TURN):
+            if game.movement_used or ship.movement_points_remaining <= 0:
+                return
+            # Viser la case la plus proche du système cible (2x2)
+            tx = min(max(ship.position[0], target[0]), target[0] + SYSTEM_SIZE - 1)
+            ty = min(max(ship.position[1], target[1]), target[1] + SYSTEM_SIZE - 1)
+            if (tx, ty) == ship.position:
+                return
+            preferred = (_sign(tx - ship.position[0]), _sign(ty - ship.position[1]))
+            ordered = sorted(DIRECTIONS, key=lambda d: (d != preferred,
+                                                        max(abs(tx - ship.position[0] - d[0]),
+                                                            abs(ty - ship.position[1] - d[1]))))
+            if not any(game.move_ship(dx, dy) for dx, dy in ordered[:3]):
+                return
+
+    def play_turn(self, game):
+        player = game.get_player()
+        system = game.game_board.get_system_at(player.vaisseau.position)
+        if system is None or system.position in self.visited or player.check_victory_conditions():
+            self._move_towards(game, self._choose_target(game))
+            system = game.game_board.get_system_at(player.vaisseau.position)
+        if system is None or player.check_victory_conditions():
+            return
+        if len(player.totems) >= MAX_TOTEMS_PER_PLAYER:
+            game.play_deposer(min(player.totems, key=lambda t: t.valeur))
+        if not game.play_recolter() and game.play_influencer():
+            game.play_recolter()
+        self.visited.add(system.position)
+
+
+class PlannerPolicy(GreedyPolicy):
+    """
+    Suit l'itinéraire du planificateur (Game.planner) : rejoint le prochain système
+    de la route par un plus court chemin sans escale, y récolte, et rentre au
+    Système d'Origine une fois l'ensemble gagnant réuni. Tant qu'aucune route n'est
+    connue (systèmes utiles encore cachés), explore comme GreedyPolicy.
+    """
+
+    def _follow(self, game, target):
+        """Avance vers target pendant ce tour ; True si le vaisseau y est."""
+        board = game.game_board
+        ship = game.get_player().vaisseau
+        if board.get_system_at(ship.position) is target:
+            return True
+        field = SystemStepField(board, [ship.position])
+        entry = field.entry_cell(target)
+        if entry is None:
+            # Escale forcée dans un autre système : approche directe
+            self._move_towards(game, target.position)
+        else:
+            path = field.path_to(entry)
+            for (x, y), (nx, ny) in zip(path, path[1:]):
+                if game.movement_used or not game.move_ship(nx - x, ny - y):
+                    break
+        return board.get_system_at(ship.position) is target
+
+    def _harvest(self, game, player):
+        if len(player.totems) >= MAX_TOTEMS_PER_PLAYER:
+            game.play_deposer(min(player.totems, key=lambda t: t.valeur))
+        if not game.play_recolter() and game.play_influencer():
+            game.play_recolter()
+
+    def play_turn(self, game):
+        player = game.get_player()
+        route = game.planner.plan(player)
+        if route is None:
+            super().play_turn(game)
+            return
+        if route.visits and self._follow(game, route.next_system) and not game.action_recolter_used:
+            self._harvest(game, player)
+            route = game.planner.plan(player)  # Le vaisseau peut encore repartir ce tour-ci
+            if route is None:
+                return
+        if not game.movement_used:
+            if self._follow(game, route.next_system) and route.visits and not game.action_recolter_used:
+                self._harvest(game, player)
+
+
+POLICIES = {
+    "random": RandomPolicy,
+    "greedy": GreedyPolicy,
+    "planner": PlannerPolicy,
+}
@@ -0,0 +1,184 @@
+# core/profiler.py
+"""
+Profileur par image : chronomètre les phases de la boucle principale et les
+appels de règles instrumentés, garde des percentiles glissants et exporte
+les mesures au format Chrome trace-event (chrome://tracing, Perfetto).
+
+Désactivé, il ne coûte rien : section() renvoie un contexte vide et les appels
+instrumentés ne sont enveloppés que pendant qu'il est actif (set_enabled).
+"""
+import collections
+import json
+import time
+
+
+class _Section:
+    """Gestionnaire de contexte léger mesurant une phase nommée."""
+
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profiler.record(self.name, self.start, time.perf_counter_ns())
+        return False
+
+
+class _NullSection:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+NULL_SECTION = _NullSection()
+
+
+class FrameProfiler:
+    """Mesures par phase (fenêtre glissante) et journal d'événements pour Chrome trace."""
+
+    def __init__(self, window=300, max_trace_events=200000, enabled=True):
+        self.enabled = enabled
+        self.window = window
+        self.samples = collections.defaultdict(lambda: collections.deque(maxlen=self.window))
+        self.trace = collections.deque(maxlen=max_trace_events)  # (nom, début ns, fin ns)
+        self.frame_count = 0
+        self._origin = time.perf_counter_ns()
+        self._frame_start = None
+        self._targets = []  # (objet, nom de méthode, libellé) à chronométrer quand le profileur est actif
+        self._installed = False
+
+    def section(self, name):
+        """Contexte chronométrant la phase name (sans effet si le profileur est désactivé)."""
+        if not self.enabled:
+            return NULL_SECTION
+        return _Section(self, name)
+
+    def set_enabled(self, enabled):
+        """Active ou désactive le profileur ; les enveloppes des appels instrumentés suivent."""
+        self.enabled = enabled
+        if not enabled:
+            self._frame_start = None
+        if enabled and not self._installed:
+            for obj, method_name, label in self._targets:
+                self._install(obj, method_name, label)
+        elif not enabled and self._installed:
+            for obj, method_name, _ in self._targets:
+                # Supprimer l'attribut d'instance rend la méthode de classe visible à nouveau
+                delattr(obj, method_name)
+        self._installed = enabled and bool(self._targets)
+
+    def record(self, name, start_ns, end_ns):
+        self.samples[name].append((end_ns - start_ns) / 1e6)
+        self.trace.append((name, start_ns, end_ns))
+
+    def begin_frame(self):
+        if self.enabled:
+            self._frame_start = time.perf_counter_ns()
+
+    def end_frame(self):
+        if self.enabled and self._frame_start is not None:
+            self.record("frame", self._frame_start, time.perf_counter_ns())
+            self.frame_count += 1
+            self._frame_start = None
+
+    # --- Instrumentation des règles ---
+
+    def instrument(self, obj, method_name, label=None):
+        """
+        Chronomètre obj.method_name (sur l'instance seulement) tant que le profileur
+        est actif ; désactivé, la méthode d'origine est appelée sans intermédiaire.
+        """
+        self._targets.append((obj, method_name, label or method_name))
+        if self.enabled:
+            self._install(obj, method_name, label or method_name)
+            self._installed = True
+
+    def _install(self, obj, method_name, name):
+        original = getattr(obj, method_name)
+        record = self.record
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter_ns()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                record(name, start, time.perf_counter_ns())
+
+        setattr(obj, method_name, timed)
+
+    def instrument_game(self, game):
+        """Instrumente les appels de règles coûteux d'une partie."""
+        self.instrument(game, "find_path")
+        self.instrument(game, "check_game_over")
+        self.instrument(game.game_board, "get_system_at")
+
+    def uninstrument(self):
+        """Retire toutes les méthodes instrumentées."""
+        enabled = self.enabled
+        self.set_enabled(False)
+        self.enabled = enabled
+        self._targets.clear()
+
+    # --- Statistiques et export ---
+
+    def percentiles(self, name, points=(50, 95, 99)):
+        """Percentiles (en ms) de la fenêtre glissante de la phase name."""
+        values = sorted(self.samples.get(name, ()))
+        if not values:
+            return {p: None for p in points}
+        last = len(values) - 1
+        return {p: values[min(last, round(p / 100 * last))] for p in points}
+
+    def summary(self):
+        """{phase: (nombre d'échantillons, p50, p95, p99)} en millisecondes."""
+        result = {}
+        for name, values in self.samples.items():
+            p = self.percentiles(name)
+            result[name] = (len(values), p[50], p[95], p[99])
+        return result
+
+    def chrome_trace(self):
+        """Événements au format Chrome trace-event (phase 'X', microsecondes)."""
+        events = [{"name": name, "cat": "frame" if name == "frame" else "phase", "ph": "X",
+                   "ts": (start - self._origin) / 1000, "dur": (end - start) / 1000,
+                   "pid": 0, "tid": 0}
+                  for name, start, end in self.trace]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def dump_chrome_trace(self, path):
+        """Écrit la trace JSON dans path et renvoie le chemin."""
+        with open(path, "w", encoding="utf-8") as trace_file:
+            json.dump(self.chrome_trace(), trace_file)
+        return path
+
+    def draw_overlay(self, surface, font, text_cache, position, phases):
+        """
+        Dessine un tableau p50/p95/p99 des phases données et renvoie le rectangle
+        couvert (fond opaque de taille fixe, pour le rendu par rectangles sales).
+        """
+        import pygame
+        from config import BLACK, GRAY, WHITE
+
+        line_height = font.get_linesize()
+        rect = pygame.Rect(position, (360, line_height * (len(phases) + 1) + 8))
+        pygame.draw.rect(surface, BLACK, rect)
+        pygame.draw.rect(surface, GRAY, rect, 1)
+        x, y = rect.x + 6, rect.y + 4
+        surface.blit(text_cache.render(font, "phase            p50     p95     p99 (ms)", GRAY), (x, y))
+        for name in phases:
+            y += line_height
+            p = self.percentiles(name)
+            cells = " ".join(f"{v:7.2f}" if v is not None else "      -" for v in p.values())
+            surface.blit(text_cache.render(font, f"{name:<14} {cells}", WHITE), (x, y))
+        return rect
@@ -0,0 +1,118 @@
+# core/rack.py
+"""
+Rack d'une couleur de système : totems rangés par faction et cycle des cartes
+Relation-Faction.
+
+Chaque faction a sa file de totems (le totem récolté est le plus ancien, un
+dépôt s'ajoute à la fin), et les cartes forment un anneau dont la carte du
+dessus passe dessous à chaque Influencer : récolte, dépôt, influence et
+« combien de totems de la faction X » sont en O(1). C'est la structure que
+core.batch_engine reproduit en tableaux (rack_queue, cards/card_top).
+
+Les opérations sont journalisées par leur inverse dans l'UndoJournal de la
+partie (fork/undo), comme l'inventaire des joueurs.
+"""
+from collections import deque
+
+from config import FACTION_NAMES
+
+
+class Rack:
+    """Totems et cartes Relation-Faction d'une couleur de système."""
+
+    __slots__ = ('couleur', 'buckets', 'faction_cards', 'journal', 'version', '_total', '_summary')
+
+    def __init__(self, couleur, totems=(), faction_cards=(), journal=None):
+        self.couleur = couleur
+        self.buckets = {faction_id: deque() for faction_id in FACTION_NAMES}  # Faction -> totems, le plus ancien en tête
+        self.faction_cards = deque(faction_cards)  # Carte visible en tête
+        self.journal = journal  # UndoJournal de la partie (optionnel)
+        self.version = 0  # Incrémenté à chaque modification (caches de rendu)
+        self._total = 0
+        self._summary = None
+        for totem in totems:
+            self.buckets[totem.faction_id].append(totem)
+            self._total += 1
+
+    def __len__(self):
+        return self._total
+
+    @property
+    def totems(self):
+        """Totems du rack, faction par faction puis par ancienneté (ordre de l'instantané)."""
+        return [totem for faction_id in FACTION_NAMES for totem in self.buckets[faction_id]]
+
+    @property
+    def top_faction(self):
+        """Faction de la carte visible, ou None si le rack n'a pas de carte."""
+        return self.faction_cards[0].faction_id if self.faction_cards else None
+
+    def peek(self, faction_id):
+        """Prochain totem de la faction à récolter, sans le retirer (None s'il n'y en a plus)."""
+        bucket = self.buckets[faction_id]
+        return bucket[0] if bucket else None
+
+    def count(self, faction_id):
+        """Nombre de totems de la faction encore dans le rack."""
+        return len(self.buckets[faction_id])
+
+    def summary(self):
+        """
+        Contenu pour l'affichage : tuple de (faction, couleur, nombre) par suite de
+        totems identiques, en cache jusqu'à la prochaine modification.
+        """
+        if self._summary is None:
+            runs = []
+            for faction_id in FACTION_NAMES:
+                for totem in self.buckets[faction_id]:
+                    if runs and runs[-1][0] == faction_id and runs[-1][1] == totem.couleur:
+                        runs[-1][2] += 1
+                    else:
+                        runs.append([faction_id, totem.couleur, 1])
+            self._summary = tuple(tuple(run) for run in runs)
+        return self._summary
+
+    def _changed(self, delta=0):
+        self._total += delta
+        self.version += 1
+        self._summary = None
+
+    def take(self, faction_id):
+        """Retire et renvoie le plus ancien totem de la faction (None s'il n'y en a plus)."""
+        bucket = self.buckets[faction_id]
+        if not bucket:
+            return None
+        totem = bucket.popleft()
+        if self.journal:
+            self.journal.record_inverse(Rack._undo_take, self, faction_id, totem)
+        self._changed(-1)
+        return totem
+
+    def put(self, totem):
+        """Dépose un totem à la fin de la file de sa faction."""
+        self.buckets[totem.faction_id].append(totem)
+        if self.journal:
+            self.journal.record_inverse(Rack._undo_put, self, totem.faction_id, totem)
+        self._changed(1)
+
+    def cycle(self):
+        """Passe la carte visible sous le paquet et renvoie la nouvelle faction visible."""
+        self.faction_cards.rotate(-1)
+        if self.journal:
+            self.journal.record_inverse(Rack._undo_cycle, self, None, None)
+        self._changed()
+        return self.top_faction
+
+    # Inverses pour le journal d'annulation : (rack, clé, valeur)
+
+    def _undo_take(self, faction_id, totem):
+        self.buckets[faction_id].appendleft(totem)
+        self._changed(1)
+
+    def _undo_put(self, faction_id, _totem):
+        self.buckets[faction_id].pop()
+        self._changed(-1)
+
+    def _undo_cycle(self, _key, _value):
+        self.faction_cards.rotate(1)
+        self._changed()
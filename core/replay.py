@@ -0,0 +1,174 @@
+# core/replay.py
+"""
+Journal des actions d'une partie et rejeu headless.
+
+Une partie créée avec une graine (Game(seed=...)) est entièrement déterminée
+par cette graine et la suite de ses actions réussies. ActionLog enregistre ces
+actions au fil de l'eau (déplacements, Récolter, Déposer, Influencer, Observer,
+fin de la révélation Observer, fin de tour, départ d'un joueur) ; Replayer les réexécute sans
+affichage et garde des points de reprise (instantanés binaires) pour se placer
+au début de n'importe quel tour sans repartir du tour 1.
+
+Format de fichier (JSON Lines) : une ligne d'en-tête {"version", "seed", "num_players"},
+puis une action par ligne sous forme de liste [type, arguments...].
+"""
+import json
+
+from config import SYSTEM_COLORS, STATE_GAME_OVER
+from core.game_entities import Totem
+from core.game_state import Game
+from core.snapshot import load_game, save_game
+from core.timers import SimulatedClock
+
+LOG_VERSION = 1
+
+
+def _truncate_log(log, length, _unused):
+    """Inverse d'un enregistrement pour le journal d'annulation (fork/undo)."""
+    del log.entries[length:]
+
+
+class ActionLog:
+    """Journal en ajout seul des actions réussies d'une partie."""
+
+    def __init__(self, seed, entries=None, num_players=1):
+        self.seed = seed
+        self.num_players = num_players
+        self.entries = entries if entries is not None else []
+
+    @classmethod
+    def attach(cls, game):
+        """Crée un journal pour une partie créée avec une graine et l'y branche."""
+        if game.seed is None:
+            raise ValueError("Game must be created with a seed to be replayable.")
+        game.action_log = cls(game.seed, num_players=game.num_players)
+        return game.action_log
+
+    def record(self, game, kind, *args):
+        """Ajoute une action ; elle disparaîtra si la partie annule (undo) ce coup."""
+        game.journal.record_inverse(_truncate_log, self, len(self.entries), None)
+        self.entries.append((kind,) + args)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as log_file:
+            log_file.write(json.dumps({"version": LOG_VERSION, "seed": self.seed,
+                                       "num_players": self.num_players}) + "\n")
+            for entry in self.entries:
+                log_file.write(json.dumps(entry) + "\n")
+        return path
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding="utf-8") as log_file:
+            header = json.loads(log_file.readline())
+            if header.get("version") != LOG_VERSION:
+                raise ValueError(f"Unsupported action log version {header.get('version')}.")
+            entries = [tuple(json.loads(line)) for line in log_file if line.strip()]
+        return cls(header["seed"], entries, header.get("num_players", 1))
+
+
+def apply_action(game, entry):
+    """Rejoue une entrée du journal sur la partie ; renvoie False si elle est refusée."""
+    kind, *args = entry
+    if kind == "move":
+        return game.move_ship(*args)
+    if kind == "recolter":
+        return game.play_recolter()
+    if kind == "deposer":
+        faction_id, color_index = args
+        return game.play_deposer(Totem(faction_id, SYSTEM_COLORS[color_index]))
+    if kind == "influencer":
+        return game.play_influencer()
+    if kind == "observer":
+        game.observe_system(tuple(args))
+        return game.observer_system is not None
+    if kind == "observer_expired":
+        game.expire_observer()
+        return True
+    if kind == "end_turn":
+        game.end_turn()
+        return True
+    if kind == "leave":
+        player_id, status = args
+        return game.remove_player(game.players[player_id], status)
+    raise ValueError(f"Unknown action '{kind}' in log.")
+
+
+class Replayer:
+    """
+    Réexécute un ActionLog sans affichage. Un instantané est conservé au début
+    de chaque tour multiple de checkpoint_interval, ce qui borne le coût de seek().
+    """
+
+    def __init__(self, log, checkpoint_interval=5, subscribers=()):
+        self.log = log
+        self.checkpoint_interval = checkpoint_interval
+        self.subscribers = subscribers  # Abonnés au flux d'événements de la partie rejouée
+        self.checkpoints = {}  # tour -> (index de la prochaine entrée, instantané)
+        # Horloge simulée : le rejeu suit le journal (observer_expired), jamais l'heure réelle
+        self.game = self._subscribe(Game(num_players=log.num_players, headless=True, seed=log.seed,
+                                         clock=SimulatedClock()))
+        self.game.setup_game()
+        self.position = 0  # Index de la prochaine entrée à rejouer
+        self.turn_start = 0  # Index de la première entrée du tour de table courant
+        self._checkpoint()
+
+    def _subscribe(self, game):
+        for subscriber in self.subscribers:
+            game.events.subscribe(subscriber)
+        return game
+
+    @property
+    def turn(self):
+        return self.game.turn_count
+
+    def _checkpoint(self):
+        turn = self.game.turn_count
+        if turn % self.checkpoint_interval == 0 or turn == 1:
+            self.checkpoints.setdefault(turn, (self.position, save_game(self.game)))
+
+    def step(self):
+        """Rejoue l'entrée suivante ; renvoie False à la fin du journal."""
+        if self.position >= len(self.log.entries):
+            return False
+        entry = self.log.entries[self.position]
+        self.position += 1
+        turn = self.game.turn_count
+        if not apply_action(self.game, entry):
+            raise RuntimeError(f"Action {entry!r} (#{self.position - 1}) rejected during replay.")
+        if self.game.turn_count != turn:
+            # Nouveau tour de table
+            self.turn_start = self.position
+            if self.game.game_state != STATE_GAME_OVER:
+                self._checkpoint()
+        return True
+
+    def run(self):
+        """Rejoue tout le journal et renvoie la partie dans son état final."""
+        while self.step():
+            pass
+        return self.game
+
+    def seek(self, turn):
+        """
+        Place la partie au début du tour donné (avant toute action de ce tour)
+        et la renvoie. Repart du point de reprise le plus proche si besoin.
+        """
+        current = self.game.turn_count
+        checkpoint_turn = self._nearest_checkpoint(turn)
+        if (turn < current or checkpoint_turn > current or
+                (turn == current and self.position != self.turn_start)):
+            self.position, data = self.checkpoints[checkpoint_turn]
+            self.turn_start = self.position
+            self.game = self._subscribe(load_game(data, clock=SimulatedClock()))
+        while self.game.turn_count < turn and self.step():
+            pass
+        if self.game.turn_count != turn:
+            raise ValueError(f"Turn {turn} is not reached by this log (last turn {self.game.turn_count}).")
+        return self.game
+
+    def _nearest_checkpoint(self, turn):
+        return max((t for t in self.checkpoints if t <= turn), default=1)
@@ -0,0 +1,574 @@
+# core/server.py
+"""
+Serveur de parties asyncio : un seul processus héberge de nombreuses parties
+simultanées avec le moteur headless de core.game_state, sans pygame ni fenêtre.
+
+Protocole : JSON Lines sur TCP local ou socket Unix. Chaque requête porte un
+"id" repris dans sa réponse ; le serveur envoie aussi des messages "push" non
+sollicités (arrivée d'un joueur, actions des autres joueurs, arrêt du serveur).
+
+  {"id": 1, "op": "create", "players": 2, "seed": 42} -> {"id": 1, "ok": true, "game": 1, "seat": 0, ...}
+  {"id": 2, "op": "join", "game": 1}                  -> {"id": 2, "ok": true, "game": 1, "seat": 1, ...}
+  {"id": 3, "op": "act", "action": ["move", 1, 0]}    -> {"id": 3, "ok": true, "accepted": true, "events": [...], ...}
+  {"id": 4, "op": "state"}                            -> {"id": 4, "ok": true, "players": [...], ...}
+  {"id": 5, "op": "spectate", "game": 1}              -> {"id": 5, "ok": true, "keyframe": ..., "backlog": [...]}
+  {"id": 6, "op": "keyframe"}                         -> image clé et paquets suivants (resynchronisation)
+  {"id": 7, "op": "stats"}                            -> compteurs du serveur
+
+Avec "sync": "deltas" dans create/join (et toujours pour les spectateurs), le
+client reçoit une image clé puis, à chaque action, un paquet de deltas binaires
+(core.sync, encodé en base64) au lieu de la liste des événements en JSON.
+
+Les actions reprennent le format du journal de rejeu (core.replay), plus
+["abandon"]. Chaque partie a sa propre tâche et sa file de commandes bornée :
+une erreur dans une partie ne touche pas les autres, et un client qui envoie
+plus vite que sa partie ne joue est mis en attente. Un client n'a qu'un nombre
+borné de requêtes sans réponse avant que le serveur cesse de le lire ; celui qui
+ne lit plus les messages qu'on lui pousse est déconnecté.
+"""
+import asyncio
+import base64
+import itertools
+import json
+import os
+import random
+import time
+
+from config import (FACTION_NAMES, SYSTEM_COLORS, MAX_PLAYERS, STATE_GAME_OVER, PLAYER_ACTIVE, SERVER_HOST,
+                    SERVER_MAX_GAMES, SERVER_GAME_QUEUE, SERVER_MAX_INFLIGHT, SERVER_SEND_QUEUE,
+                    SERVER_SHUTDOWN_TIMEOUT)
+from core.events import event_record
+from core.game_state import Game
+from core.replay import apply_action
+from core.sync import DeltaEncoder
+
+MAX_LINE = 64 * 1024  # Taille maximale d'une requête
+
+# Arguments attendus par action : entier (coordonnée ou direction), faction ou index de couleur
+_ACTION_ARGS = {
+    "move": (int, int),
+    "recolter": (),
+    "deposer": (str, int),
+    "influencer": (),
+    "observer": (int, int),
+    "end_turn": (),
+    "abandon": (),
+}
+
+_TICK = object()  # Commande interne : échéance du moteur (fin de révélation Observer)
+
+
+class ProtocolError(Exception):
+    """Requête refusée : l'erreur est renvoyée au client sans couper la connexion."""
+
+
+def _encode(message):
+    return (json.dumps(message, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _b64(data):
+    return base64.b64encode(data).decode("ascii")
+
+
+def _sync_mode(request):
+    sync = request.get("sync", "events")
+    if sync not in ("events", "deltas"):
+        raise ProtocolError(f"Unknown sync mode {sync!r}.")
+    return sync
+
+
+def _check_action(action):
+    """Valide une action reçue ; renvoie le tuple correspondant ou lève ProtocolError."""
+    if not isinstance(action, list) or not action or action[0] not in _ACTION_ARGS:
+        raise ProtocolError(f"Unknown action {action!r}.")
+    kind, *args = action
+    types = _ACTION_ARGS[kind]
+    if len(args) != len(types) or not all(type(arg) is expected for arg, expected in zip(args, types)):
+        raise ProtocolError(f"Invalid arguments for action '{kind}'.")
+    if kind == "move" and max(abs(args[0]), abs(args[1])) != 1:
+        raise ProtocolError("Invalid step for action 'move' (one cell in one of 8 directions).")
+    if kind == "deposer" and (args[0] not in FACTION_NAMES or not 0 <= args[1] < len(SYSTEM_COLORS)):
+        raise ProtocolError("Invalid totem for action 'deposer'.")
+    return tuple(action)
+
+
+class GameHost:
+    """Une partie hébergée : sa tâche traite ses commandes une à une, dans l'ordre d'arrivée."""
+
+    def __init__(self, server, game_id, num_players, seed):
+        self.server = server
+        self.id = game_id
+        self.game = Game(num_players=num_players, headless=True, seed=seed)
+        self.game.setup_game()
+        self._events = []
+        self.game.events.subscribe(self._events.append)
+        self.sync = DeltaEncoder(self.game)
+        self.seats = [None] * num_players  # Connexion assise à chaque siège
+        self.spectators = []
+        self.joined = 0  # Sièges attribués depuis la création (un siège libéré n'est pas réattribué)
+        self.queue = asyncio.Queue(SERVER_GAME_QUEUE)
+        self.stopping = False
+        self.task = asyncio.create_task(self.run())
+
+    @property
+    def started(self):
+        return self.joined == len(self.seats)
+
+    def status(self):
+        """Champs d'état joints à chaque réponse et message poussé."""
+        game = self.game
+        return {"turn": game.turn_count, "current": game.scheduler.current, "state": game.game_state,
+                "started": self.started, "winner": game.winner.id if game.winner is not None else None}
+
+    def sit(self, connection):
+        """Attribue le prochain siège libre à la connexion ; renvoie son numéro."""
+        if self.stopping or self.task.done():
+            raise ProtocolError(f"Game {self.id} is closed.")
+        if self.started:
+            raise ProtocolError(f"Game {self.id} is full.")
+        seat = self.joined
+        self.joined += 1
+        self.seats[seat] = connection
+        connection.host, connection.seat = self, seat
+        self._broadcast({"push": "joined", "game": self.id, "seat": seat, **self.status()}, exclude=connection)
+        return seat
+
+    def watch(self, connection):
+        """Ajoute un spectateur : il ne reçoit que des paquets de deltas."""
+        if self.stopping or self.task.done():
+            raise ProtocolError(f"Game {self.id} is closed.")
+        connection.host, connection.seat, connection.deltas = self, None, True
+        self.spectators.append(connection)
+
+    def catch_up(self):
+        """Champs de réponse permettant à un client de construire sa réplique (core.sync.DeltaApplier)."""
+        (sequence, snapshot), backlog = self.sync.catch_up()
+        return {"sequence": sequence, "keyframe": _b64(snapshot), "backlog": [_b64(packet) for packet in backlog]}
+
+    def stop(self):
+        """Demande l'arrêt : les commandes déjà en file sont traitées d'abord."""
+        self.stopping = True
+        try:
+            self.queue.put_nowait(None)
+        except asyncio.QueueFull:
+            pass  # La boucle s'arrêtera d'elle-même une fois la file vidée
+
+    async def _next_command(self):
+        timeout = self.game.time_until_deadline()
+        if timeout is None:
+            return await self.queue.get()
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return _TICK
+
+    async def run(self):
+        crashed = False
+        command = None
+        try:
+            while not (self.stopping and self.queue.empty()):
+                command = None
+                command = await self._next_command()
+                if command is None:
+                    break
+                if command is _TICK:
+                    self.game.update()
+                    self._publish()
+                    continue
+                connection, request = command
+                if request is None:
+                    if self._leave(connection):
+                        break
+                    continue
+                try:
+                    self._handle(connection, request)
+                except ProtocolError as exc:
+                    connection.reply(request, error=str(exc))
+        except Exception as exc:
+            # Isolation : seule cette partie est fermée, le serveur continue
+            crashed = True
+            self.server.log(f"Game {self.id} crashed: {exc!r}")
+            if command not in (None, _TICK) and command[1] is not None:
+                command[0].reply(command[1], error=f"Game {self.id} crashed.")
+        finally:
+            self._close(crashed)
+
+    def _handle(self, connection, request):
+        op = request.get("op")
+        game = self.game
+        if op == "state":
+            connection.reply(request, **self.describe())
+            return
+        if op == "keyframe":
+            connection.reply(request, **self.catch_up(), **self.status())
+            return
+        if connection.seat is None:
+            raise ProtocolError("Spectators cannot act.")
+        action = _check_action(request.get("action"))
+        if not self.started:
+            raise ProtocolError("Waiting for players.")
+        if game.game_state == STATE_GAME_OVER:
+            raise ProtocolError("Game is over.")
+        self.server.stats["actions"] += 1
+        if action[0] == "abandon":
+            accepted = game.abandon(game.players[connection.seat])
+        elif connection.seat != game.scheduler.current:
+            raise ProtocolError("Not your turn.")
+        elif action[0] == "observer":
+            # Le journal de rejeu ne contient que des observations valides ; ici on applique la règle
+            accepted = game.play_observer(tuple(action[1:]))
+        else:
+            accepted = apply_action(game, action)
+        self._publish(connection, request, accepted)
+
+    def describe(self):
+        """État complet de la partie (requête "state")."""
+        game = self.game
+        players = [{"seat": player.id, "color": SYSTEM_COLORS.index(player.couleur), "status": player.status,
+                    "position": list(player.vaisseau.position), "score": player.score,
+                    "totems": [[totem.faction_id, SYSTEM_COLORS.index(totem.couleur)] for totem in player.totems]}
+                   for player in game.players]
+        return {"game": self.id, "seed": game.seed, "players": players, **self.status()}
+
+    def _recipients(self):
+        for connection in self.seats:
+            if connection is not None:
+                yield connection
+        yield from self.spectators
+
+    def _publish(self, connection=None, request=None, accepted=None):
+        """
+        Répond à la requête traitée (s'il y en a une) et diffuse aux autres clients
+        ce qu'elle a changé : événements JSON ou paquet de deltas selon le client.
+        Les événements ne sont sérialisés que si un client les demande ; les messages
+        de deltas ne répètent pas l'état de la partie, que le client tient de sa réplique.
+        """
+        packet = self.sync.flush()
+        raw_events = self._events[:]
+        self._events.clear()
+        status = self.status()
+        events = delta = None
+        if connection is not None:
+            if connection.deltas:
+                delta = _b64(packet) if packet else None
+                connection.reply(request, accepted=accepted, delta=delta)
+            else:
+                events = [event_record(event) for event in raw_events]
+                connection.reply(request, accepted=accepted, events=events, **status)
+        if not raw_events:
+            return
+        events_line = delta_line = None
+        for recipient in self._recipients():
+            if recipient is connection:
+                continue
+            if recipient.deltas:
+                if packet is None:
+                    continue
+                if delta_line is None:
+                    if delta is None:
+                        delta = _b64(packet)
+                    delta_line = _encode({"push": "delta", "game": self.id, "delta": delta})
+                recipient.push_line(delta_line)
+            else:
+                if events_line is None:
+                    if events is None:
+                        events = [event_record(event) for event in raw_events]
+                    events_line = _encode({"push": "events", "game": self.id, "events": events, **status})
+                recipient.push_line(events_line)
+
+    def _broadcast(self, message, exclude=None):
+        line = _encode(message)
+        for connection in self._recipients():
+            if connection is not exclude:
+                connection.push_line(line)
+
+    def _leave(self, connection):
+        """
+        Départ d'une connexion : son joueur abandonne si la partie est en cours.
+        Renvoie True s'il ne reste plus personne à la table.
+        """
+        seat = connection.seat
+        connection.host = connection.seat = None
+        connection.close()
+        if seat is None:
+            self.spectators.remove(connection)
+            return False
+        self.seats[seat] = None
+        player = self.game.players[seat]
+        if player.status == PLAYER_ACTIVE and self.game.abandon(player):
+            self._publish()
+        return all(connection is None for connection in self.seats)
+
+    def _close(self, crashed):
+        self.stopping = True
+        # Les requêtes restées en file reçoivent une réponse (et libèrent leur place "en cours")
+        while not self.queue.empty():
+            command = self.queue.get_nowait()
+            if command not in (None, _TICK) and command[1] is not None:
+                command[0].reply(command[1], error=f"Game {self.id} is closed.")
+        if crashed or self.spectators:
+            self._broadcast({"push": "game_closed", "game": self.id, "reason": "error" if crashed else "ended"})
+            for connection in list(self._recipients()):
+                connection.host = connection.seat = None
+        self.server._game_closed(self)
+
+
+class ClientConnection:
+    """Une connexion cliente : lecture des requêtes et envoi tamponné des réponses."""
+
+    def __init__(self, server, reader, writer):
+        self.server = server
+        self.reader = reader
+        self.writer = writer
+        self.host = None
+        self.seat = None  # None pour un spectateur
+        self.deltas = False  # Synchronisation par paquets de deltas plutôt que par événements JSON
+        self.closing = False
+        # Lignes à envoyer : (octets, est une réponse). Les réponses sont bornées par inflight,
+        # les messages poussés par SERVER_SEND_QUEUE.
+        self.outbox = asyncio.Queue()
+        self.inflight = asyncio.Semaphore(SERVER_MAX_INFLIGHT)
+        self._read_task = None
+
+    async def serve(self):
+        self._read_task = asyncio.create_task(self._read_loop())
+        try:
+            await self._write_loop()
+        finally:
+            self._read_task.cancel()
+            try:
+                await self._read_task
+            except asyncio.CancelledError:
+                pass
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+
+    async def _read_loop(self):
+        try:
+            while True:
+                line = await self.reader.readline()
+                if not line:
+                    break
+                await self.inflight.acquire()
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    self.reply({}, error="Invalid JSON.")
+                    continue
+                if not isinstance(request, dict):
+                    self.reply({}, error="Request must be a JSON object.")
+                    continue
+                try:
+                    await self._dispatch(request)
+                except ProtocolError as exc:
+                    self.reply(request, error=str(exc))
+        except (ConnectionError, ValueError):
+            pass  # Connexion coupée ou ligne trop longue
+        if self.server.closing:
+            return  # L'arrêt du serveur ferme lui-même les connexions
+        host = self.host
+        if host is not None and not host.task.done():
+            await host.queue.put((self, None))  # La partie traite d'abord les requêtes en file
+        else:
+            self.close()
+
+    async def _dispatch(self, request):
+        op = request.get("op")
+        if op in ("act", "state", "keyframe"):
+            if self.host is None:
+                raise ProtocolError("Not in a game.")
+            await self.host.queue.put((self, request))
+        elif op == "create":
+            if self.host is not None:
+                raise ProtocolError("Already in a game.")
+            players, seed = request.get("players", 1), request.get("seed")
+            if type(players) is not int or not 1 <= players <= MAX_PLAYERS:
+                raise ProtocolError(f"players must be between 1 and {MAX_PLAYERS}.")
+            if seed is not None and type(seed) is not int:
+                raise ProtocolError("seed must be an integer.")
+            _sync_mode(request)
+            host = self.server.create_game(players, seed)
+            self._join(request, host)
+        elif op in ("join", "spectate"):
+            if self.host is not None:
+                raise ProtocolError("Already in a game.")
+            host = self.server.games.get(request.get("game"))
+            if host is None:
+                raise ProtocolError(f"Unknown game {request.get('game')!r}.")
+            self._join(request, host, spectate=op == "spectate")
+        elif op == "stats":
+            self.reply(request, **self.server.snapshot_stats())
+        else:
+            raise ProtocolError(f"Unknown op {op!r}.")
+
+    def _join(self, request, host, spectate=False):
+        deltas = _sync_mode(request) == "deltas"
+        if spectate:
+            host.watch(self)
+        else:
+            host.sit(self)
+            self.deltas = deltas
+        fields = host.catch_up() if self.deltas else {}
+        self.reply(request, game=host.id, seat=self.seat, players=len(host.seats), seed=host.game.seed,
+                   **fields, **host.status())
+
+    async def _write_loop(self):
+        writer = self.writer
+        outbox = self.outbox
+        while True:
+            batch = [await outbox.get()]
+            while not outbox.empty():
+                batch.append(outbox.get_nowait())
+            if writer.transport.is_closing():
+                return  # Connexion coupée (client lent ou parti)
+            replies = 0
+            for item in batch:
+                if item is None:
+                    try:
+                        await writer.drain()
+                    except ConnectionError:
+                        pass
+                    return
+                writer.write(item[0])
+                replies += item[1]
+            try:
+                await writer.drain()
+            except ConnectionError:
+                return
+            for _ in range(replies):
+                self.inflight.release()
+
+    def reply(self, request, **fields):
+        """Réponse à une requête (toujours mise en file : leur nombre est borné par inflight)."""
+        if self.closing:
+            return
+        message = {"id": request.get("id"), "ok": "error" not in fields}
+        message.update(fields)
+        self.outbox.put_nowait((_encode(message), True))
+
+    def push_line(self, line):
+        """Message non sollicité ; un client qui ne lit plus est déconnecté."""
+        if self.closing:
+            return
+        if self.outbox.qsize() >= SERVER_SEND_QUEUE:
+            self.server.stats["slow_disconnects"] += 1
+            self.abort()
+            return
+        self.outbox.put_nowait((line, False))
+
+    def push(self, kind, **fields):
+        self.push_line(_encode({"push": kind, **fields}))
+
+    def close(self):
+        """Ferme la connexion après l'envoi des messages déjà en file."""
+        if not self.closing:
+            self.closing = True
+            self.outbox.put_nowait(None)
+
+    def abort(self):
+        """Coupe immédiatement la connexion (client lent)."""
+        self.close()
+        self.writer.transport.abort()
+
+
+class GameServer:
+    """Héberge les parties et accepte les connexions (TCP local ou socket Unix)."""
+
+    def __init__(self, max_games=SERVER_MAX_GAMES, log=print):
+        self.max_games = max_games
+        self.log = log
+        self.games = {}
+        self.connections = {}  # ClientConnection -> tâche qui la sert
+        self.closing = False
+        self.stats = {"games_created": 0, "games_closed": 0, "connections": 0, "actions": 0,
+                      "slow_disconnects": 0}
+        self._game_ids = itertools.count(1)
+        self._server = None
+        self._path = None
+        self._started_at = None
+
+    async def start(self, host=SERVER_HOST, port=0, path=None):
+        """Commence à écouter ; path (socket Unix) prime sur host/port. Renvoie le serveur."""
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self._accept, path, limit=MAX_LINE)
+            self._path = path
+        else:
+            self._server = await asyncio.start_server(self._accept, host, port, limit=MAX_LINE)
+        self._started_at = time.perf_counter()
+        return self
+
+    @property
+    def address(self):
+        """Adresse d'écoute effective : (hôte, port) ou chemin du socket Unix."""
+        return self._server.sockets[0].getsockname()
+
+    async def _accept(self, reader, writer):
+        if self.closing:
+            writer.close()
+            return
+        connection = ClientConnection(self, reader, writer)
+        self.connections[connection] = asyncio.current_task()
+        self.stats["connections"] += 1
+        try:
+            await connection.serve()
+        finally:
+            del self.connections[connection]
+
+    def create_game(self, num_players, seed=None):
+        if self.closing:
+            raise ProtocolError("Server is shutting down.")
+        if len(self.games) >= self.max_games:
+            raise ProtocolError("Too many games.")
+        if seed is None:
+            seed = random.getrandbits(63)
+        host = GameHost(self, next(self._game_ids), num_players, seed)
+        self.games[host.id] = host
+        self.stats["games_created"] += 1
+        return host
+
+    def _game_closed(self, host):
+        if self.games.pop(host.id, None) is not None:
+            self.stats["games_closed"] += 1
+
+    def snapshot_stats(self):
+        elapsed = time.perf_counter() - self._started_at if self._started_at else 0.0
+        return {**self.stats, "games_active": len(self.games), "connections_active": len(self.connections),
+                "uptime": elapsed}
+
+    async def shutdown(self, timeout=SERVER_SHUTDOWN_TIMEOUT):
+        """
+        Arrêt propre : plus de nouvelles connexions ni requêtes, les parties traitent
+        les commandes déjà reçues (dans la limite de timeout), puis chaque client
+        reçoit un message "shutdown" avant la fermeture de sa connexion.
+        """
+        if self.closing:
+            return
+        self.closing = True
+        self._server.close()
+        for connection in self.connections:
+            if connection._read_task is not None:
+                connection._read_task.cancel()
+        hosts = list(self.games.values())
+        for host in hosts:
+            host.stop()
+        if hosts:
+            _, pending = await asyncio.wait([host.task for host in hosts], timeout=timeout)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        for connection in self.connections:
+            connection.push("shutdown")
+            connection.close()
+        tasks = list(self.connections.values())
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=timeout)
+            for connection, task in list(self.connections.items()):
+                if task in pending:
+                    connection.writer.transport.abort()
+            await asyncio.gather(*pending, return_exceptions=True)
+        await self._server.wait_closed()
+        if self._path is not None and os.path.exists(self._path):
+            os.unlink(self._path)
@@ -0,0 +1,62 @@
+# core/simulation.py
+"""
+Exécution headless de parties complètes : aucune police, surface ni affichage.
+"""
+import random
+
+from config import STATE_GAME_OVER
+from core.events import ConsoleSubscriber
+from core.game_state import Game
+from core.policies import POLICIES
+from core.timers import SimulatedClock
+from utils import get_color_name
+
+
+def game_rng(seed, index):
+    """
+    Flux aléatoire indépendant pour la partie n° index d'une série de graine seed.
+    Ne dépend ni du processus ni de l'ordre d'exécution : une série est reproductible
+    quel que soit le nombre de workers.
+    """
+    return random.Random(f"{seed}-{index}")
+
+
+def play_game(policy, rng=None, subscribers=(), num_players=1):
+    """
+    Joue une partie complète et renvoie son résultat, vu du joueur du siège 0.
+    policy : politique unique (solo) ou liste d'une politique par siège (table de bots).
+    subscribers : abonnés au flux d'événements de la partie (aucun par défaut).
+    """
+    policies = policy if isinstance(policy, (list, tuple)) else [policy] * num_players
+    game = Game(num_players=len(policies), headless=True, rng=rng, clock=SimulatedClock())
+    for subscriber in subscribers:
+        game.events.subscribe(subscriber)
+    game.setup_game()
+    while game.game_state != STATE_GAME_OVER:
+        policies[game.scheduler.current].play_turn(game)
+        game.end_turn()
+    player = game.players[0]
+    return {
+        "origin": get_color_name(player.origin_system_color),
+        "won": game.winner is player,
+        "winner": game.winner.id if game.winner is not None else None,
+        "turns": game.turn_count - 1,
+        "score": player.score + player.calculate_score(),
+    }
+
+
+def play_seeded_game(policy_name, seed, index, subscribers=(), num_players=1):
+    """Joue la partie n° index de la série seed ; chaque politique tire son propre flux."""
+    rng = game_rng(seed, index)
+    policies = [POLICIES[policy_name](random.Random(rng.getrandbits(64))) for _ in range(num_players)]
+    return play_game(policies, rng, subscribers)
+
+
+def run_batch(num_games, policy_name="greedy", seed=None, quiet=True, num_players=1):
+    """Joue num_games parties successives et renvoie la liste de leurs résultats."""
+    if num_games < 0:
+        raise ValueError("num_games must not be negative.")
+    if seed is None:
+        seed = random.getrandbits(64)
+    subscribers = () if quiet else (ConsoleSubscriber(),)
+    return [play_seeded_game(policy_name, seed, index, subscribers, num_players) for index in range(num_games)]
@@ -0,0 +1,224 @@
+# core/snapshot.py
+"""
+Instantané binaire versionné d'une partie (sauvegarde / chargement rapides).
+
+Le format n'utilise que des champs de largeur fixe (struct), sans pickle :
+un en-tête, puis 3 octets par système, les racks (un octet par totem et par
+carte, dans leur ordre) et chaque joueur. Une partie standard tient en
+quelques centaines d'octets.
+
+Un totem ou une carte est codé sur un octet : index de faction (3 bits de poids
+fort) et index de couleur (3 bits de poids faible). Le générateur aléatoire
+n'est pas sauvegardé : il ne sert qu'à la mise en place.
+
+Format version 3 (petit-boutiste) :
+  en-tête       HEADER (voir ci-dessous)
+  systèmes      n x (x, y, drapeaux) ; drapeaux = capitale<<7 | origine<<6 | révélé<<5 | couleur
+  racks         pour chaque couleur de SYSTEM_COLORS : nb totems, totems, nb cartes, cartes
+  joueurs       pour chaque siège : PLAYER, nb totems, totems, systèmes vus
+                (seen_mask sur ceil(n / 8) octets, bit i = système i)
+"""
+import math
+import struct
+
+from config import (BOARD_SIZE_X, BOARD_SIZE_Y, FACTION_NAMES, MAX_PLAYERS, SYSTEM_COLORS, STATE_RUNNING, STATE_PLAYER_TURN,
+                    STATE_WAITING_INPUT, STATE_MOVING, STATE_GAME_OVER, PLAYER_ACTIVE, PLAYER_ABANDONED,
+                    PLAYER_ELIMINATED, OBSERVER_REVEAL_SECONDS)
+from core.game_board import SystemePlanetaireCapitale, SystemePlanetairePlanete
+from core.game_entities import Totem, FactionCard, Vaisseau
+from core.game_state import Game, Player
+from core.rack import Rack
+
+MAGIC = b"SPXS"
+VERSION = 3
+
+# magic, version, taille x, taille y, tour, état, nombre de joueurs, siège courant,
+# siège du vainqueur (0xFF si aucun), durée écoulée de la révélation Observer (NaN si
+# aucune), index du système observé (0xFF si aucun), nombre de systèmes
+HEADER = struct.Struct("<4sBBBHBBBBfBB")
+# couleur, statut, vaisseau x, vaisseau y, points de mouvement, score, drapeaux du tour
+PLAYER = struct.Struct("<BBBBbiB")
+
+GAME_STATES = (STATE_RUNNING, STATE_PLAYER_TURN, STATE_WAITING_INPUT, STATE_MOVING, STATE_GAME_OVER)
+PLAYER_STATUSES = (PLAYER_ACTIVE, PLAYER_ABANDONED, PLAYER_ELIMINATED)
+# Drapeaux du tour d'un joueur, dans l'ordre des bits
+FLAG_FIELDS = Player.TURN_STATE_FIELDS
+NO_INDEX = 0xFF
+
+_COLOR_INDEX = {color: index for index, color in enumerate(SYSTEM_COLORS)}
+_FACTION_INDEX = {faction: index for index, faction in enumerate(FACTION_NAMES)}
+
+
+class SnapshotError(ValueError):
+    """Instantané illisible : signature, version, longueur ou index invalide."""
+
+
+# Tables de codage : octet <-> (faction, couleur) ; les totems étant internés, Totem -> octet
+_CODE_PAIRS = {_FACTION_INDEX[faction] << 3 | _COLOR_INDEX[color]: (faction, color)
+               for faction in FACTION_NAMES for color in SYSTEM_COLORS}
+_TOTEMS_BY_CODE = {code: Totem(*pair) for code, pair in _CODE_PAIRS.items()}
+_TOTEM_CODES = {totem: code for code, totem in _TOTEMS_BY_CODE.items()}
+_PAIR_CODES = {pair: code for code, pair in _CODE_PAIRS.items()}
+
+
+def _read_codes(data, offset):
+    """Lit un compteur d'un octet suivi d'autant d'octets ; renvoie (octets, nouvel offset)."""
+    if offset >= len(data):
+        raise SnapshotError("Truncated snapshot.")
+    end = offset + 1 + data[offset]
+    if end > len(data):
+        raise SnapshotError("Truncated snapshot.")
+    return data[offset + 1:end], end
+
+
+def save_game(game):
+    """Encode l'état complet de la partie en bytes."""
+    board = game.game_board
+    systems = board.systems
+
+    if game.observer_start_time is None:
+        observer_elapsed = math.nan
+    else:
+        observer_elapsed = game.timers.clock.now() - game.observer_start_time
+    observer_index = systems.index(game.observer_system) if game.observer_system is not None else NO_INDEX
+
+    winner_seat = game.winner.id if game.winner is not None else NO_INDEX
+    mask_size = (len(systems) + 7) // 8
+
+    out = bytearray(HEADER.pack(
+        MAGIC, VERSION, board.size_x, board.size_y, game.turn_count,
+        GAME_STATES.index(game.game_state), len(game.players), game.scheduler.current,
+        winner_seat, observer_elapsed, observer_index, len(systems)))
+
+    for system in systems:
+        packed = _COLOR_INDEX[system.couleur]
+        if system.est_capitale:
+            packed |= 0x80
+        if getattr(system, 'is_player_origin', False):
+            packed |= 0x40
+        if system.revealed:
+            packed |= 0x20
+        out += bytes((system.position[0], system.position[1], packed))
+
+    for color in SYSTEM_COLORS:
+        rack = game.system_racks[color]
+        totems = rack.totems
+        out.append(len(totems))
+        out += bytes(_TOTEM_CODES[totem] for totem in totems)
+        cards = rack.faction_cards
+        out.append(len(cards))
+        out += bytes(_PAIR_CODES[card.faction_id, card.system_color] for card in cards)
+
+    for player in game.players:
+        flags = 0
+        for bit, name in enumerate(FLAG_FIELDS):
+            if getattr(player, name):
+                flags |= 1 << bit
+        ship = player.vaisseau
+        out += PLAYER.pack(_COLOR_INDEX[player.couleur], PLAYER_STATUSES.index(player.status),
+                           ship.position[0], ship.position[1], ship.movement_points_remaining,
+                           player.score, flags)
+        out.append(len(player.totems))
+        out += bytes(_TOTEM_CODES[totem] for totem in player.totems)
+        out += player.seen_mask.to_bytes(mask_size, "little")
+    return bytes(out)
+
+
+def load_game(data, headless=True, rng=None, clock=None):
+    """
+    Reconstruit une partie à partir d'un instantané produit par save_game(), sur
+    l'horloge clock (RealClock par défut) ; une révélation Observer en cours y est
+    reprogrammée pour le temps qu'il lui restait.
+    Lève SnapshotError si les données sont invalides.
+    """
+    if len(data) < HEADER.size:
+        raise SnapshotError("Snapshot too short.")
+    (magic, version, size_x, size_y, turn_count, state_index, num_players, current_seat,
+     winner_seat, observer_elapsed, observer_index, num_systems) = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise SnapshotError("Not a SpaceExplore snapshot.")
+    if version != VERSION:
+        raise SnapshotError(f"Unsupported snapshot version {version} (expected {VERSION}).")
+    if (BOARD_SIZE_X, BOARD_SIZE_Y) != (size_x, size_y):
+        raise SnapshotError(f"Snapshot board is {size_x}x{size_y}, expected {BOARD_SIZE_X}x{BOARD_SIZE_Y}.")
+    # Index de l'en-tête : chacun doit désigner une entrée de sa table
+    if state_index >= len(GAME_STATES):
+        raise SnapshotError(f"Invalid game state index {state_index}.")
+    if not 1 <= num_players <= MAX_PLAYERS or current_seat >= num_players:
+        raise SnapshotError(f"Invalid seats ({num_players} players, current seat {current_seat}).")
+    if winner_seat != NO_INDEX and winner_seat >= num_players:
+        raise SnapshotError(f"Invalid winner seat {winner_seat}.")
+    if observer_index != NO_INDEX and observer_index >= num_systems:
+        raise SnapshotError(f"Invalid observed system index {observer_index}.")
+
+    systems_offset = HEADER.size
+    offset = systems_offset + 3 * num_systems
+    if len(data) < offset:
+        raise SnapshotError("Truncated snapshot.")
+    try:
+        racks = {}
+        for color in SYSTEM_COLORS:
+            totem_codes, offset = _read_codes(data, offset)
+            card_codes, offset = _read_codes(data, offset)
+            racks[color] = Rack(color, [_TOTEMS_BY_CODE[code] for code in totem_codes],
+                                [FactionCard(*_CODE_PAIRS[code]) for code in card_codes])
+        players = []
+        mask_size = (num_systems + 7) // 8
+        for _ in range(num_players):
+            if offset + PLAYER.size > len(data):
+                raise SnapshotError("Truncated snapshot.")
+            fields = PLAYER.unpack_from(data, offset)
+            if fields[0] >= len(SYSTEM_COLORS) or fields[1] >= len(PLAYER_STATUSES):
+                raise SnapshotError("Invalid player colour or status.")
+            inventory_codes, offset = _read_codes(data, offset + PLAYER.size)
+            if offset + mask_size > len(data):
+                raise SnapshotError("Truncated snapshot.")
+            seen_mask = int.from_bytes(data[offset:offset + mask_size], "little")
+            offset += mask_size
+            players.append((fields, [_TOTEMS_BY_CODE[code] for code in inventory_codes], seen_mask))
+    except KeyError:
+        raise SnapshotError("Invalid totem or card code.") from None
+    if offset != len(data):
+        raise SnapshotError(f"Unexpected trailing data ({len(data) - offset} bytes).")
+
+    game = Game(num_players=num_players, headless=headless, rng=rng, racks=racks, clock=clock)
+    board = game.game_board
+    for offset in range(systems_offset, systems_offset + 3 * num_systems, 3):
+        x, y, packed = data[offset:offset + 3]
+        if (packed & 7) >= len(SYSTEM_COLORS) or not board.is_position_valid((x, y)):
+            raise SnapshotError("Invalid system colour or position.")
+        color = SYSTEM_COLORS[packed & 7]
+        if packed & 0x80:
+            system = SystemePlanetaireCapitale(color)
+            system.is_player_origin = bool(packed & 0x40)
+        else:
+            system = SystemePlanetairePlanete(color)
+        system.revealed = bool(packed & 0x20)
+        board.place_system(system, (x, y))
+
+    for seat, ((color_index, status_index, ship_x, ship_y, movement_points, score, flags),
+               inventory, seen_mask) in enumerate(players):
+        player = Player(seat, SYSTEM_COLORS[color_index], journal=game.journal, events=game.events)
+        for totem in inventory:
+            player.add_totem(totem)
+        origin = board.capitals.get(player.couleur)
+        player.origin_system_pos = origin.position if origin is not None else None
+        player.seen_mask = seen_mask
+        player.status = PLAYER_STATUSES[status_index]
+        player.score = score
+        player.vaisseau = Vaisseau((ship_x, ship_y), player.couleur)
+        player.vaisseau.movement_points_remaining = movement_points
+        for bit, name in enumerate(FLAG_FIELDS):
+            setattr(player, name, bool(flags & (1 << bit)))
+        game.players.append(player)
+    game.scheduler.restore(current_seat, [player.status == PLAYER_ACTIVE for player in game.players])
+
+    game.turn_count = turn_count
+    game.game_state = GAME_STATES[state_index]
+    game.winner = game.players[winner_seat] if winner_seat != NO_INDEX else None
+    game.observer_system = board.systems[observer_index] if observer_index != NO_INDEX else None
+    if game.observer_system is not None and not math.isnan(observer_elapsed):
+        game.start_observer_timer(max(0.0, OBSERVER_REVEAL_SECONDS - observer_elapsed))
+    if game.game_state == STATE_PLAYER_TURN:
+        game.start_turn_timer()  # Le tour repris dispose à nouveau de toute sa limite de temps
+    return game
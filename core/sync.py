@@ -0,0 +1,291 @@
+# core/sync.py
+"""
+Synchronisation d'état par deltas pour les clients distants et les spectateurs.
+
+DeltaEncoder s'abonne au flux d'événements d'une partie et traduit chaque
+événement qui modifie l'état en un delta binaire de quelques octets (siège,
+index de système, code de totem, index de couleur) : ni la taille d'un delta
+ni son coût d'encodage ne dépendent de la taille du plateau. DeltaApplier
+reconstruit un état identique côté client à partir d'une image clé (instantané
+core.snapshot) et des paquets de deltas qui la suivent.
+
+Un paquet regroupe les deltas d'une action : numéro de séquence (uint32) puis
+les deltas concaténés, chacun préfixé par son code d'opération. Une image clé
+est reprise tous les SYNC_KEYFRAME_TURNS tours ; les paquets émis depuis sont
+conservés pour qu'un client arrivé en cours de partie rattrape l'état courant.
+
+Le mode de sélection Observer (observer_mode) est un état d'interface locale :
+il n'est pas synchronisé.
+"""
+import struct
+
+from config import SYSTEM_COLORS, STATE_GAME_OVER, STATE_PLAYER_TURN, SYNC_KEYFRAME_TURNS
+from core.events import (ShipMoved, SystemRevealed, SystemHidden, TotemHarvested, TotemDeposited, RackInfluenced,
+                         TurnStarted, TurnEnded, PlayerLeft, GameOver)
+from core.game_state import Player
+from core.snapshot import (NO_INDEX, PLAYER_STATUSES, load_game, save_game, _COLOR_INDEX, _TOTEM_CODES,
+                           _TOTEMS_BY_CODE)
+from core.timers import SimulatedClock
+
+PACKET_HEADER = struct.Struct("<I")  # Numéro de séquence
+
+# Codes d'opération et charge utile (après l'octet du code)
+OP_SHIP_MOVED = 1  # siège, x, y, points restants, entrée dans un système
+OP_SYSTEM_REVEALED = 2  # index du système, révélation temporaire (Observer)
+OP_SYSTEM_HIDDEN = 3  # index du système
+OP_TOTEM_HARVESTED = 4  # siège, code du totem, couleur du rack
+OP_TOTEM_DEPOSITED = 5  # siège, code du totem, couleur du rack
+OP_RACK_CYCLED = 6  # couleur du rack (carte du dessus passée dessous)
+OP_TURN_STARTED = 7  # tour, siège
+OP_TURN_ENDED = 8  # siège, score
+OP_PLAYER_LEFT = 9  # siège, statut
+OP_GAME_OVER = 10  # siège du vainqueur (NO_INDEX si aucun)
+
+DELTAS = {
+    OP_SHIP_MOVED: struct.Struct("<BBBBbB"),
+    OP_SYSTEM_REVEALED: struct.Struct("<BBB"),
+    OP_SYSTEM_HIDDEN: struct.Struct("<BB"),
+    OP_TOTEM_HARVESTED: struct.Struct("<BBBB"),
+    OP_TOTEM_DEPOSITED: struct.Struct("<BBBB"),
+    OP_RACK_CYCLED: struct.Struct("<BB"),
+    OP_TURN_STARTED: struct.Struct("<BHB"),
+    OP_TURN_ENDED: struct.Struct("<BBi"),
+    OP_PLAYER_LEFT: struct.Struct("<BBB"),
+    OP_GAME_OVER: struct.Struct("<BB"),
+}
+
+
+class SyncError(ValueError):
+    """Paquet illisible, ou perdu : le client doit repartir d'une image clé."""
+
+
+def _truncate_buffer(encoder, length, _unused):
+    """Inverse d'un delta pour le journal d'annulation (fork/undo)."""
+    del encoder._buffer[length:]
+
+
+class DeltaEncoder:
+    """
+    Abonné au flux d'événements d'une partie qui accumule les deltas de l'action
+    en cours ; flush() les emballe en un paquet numéroté.
+    """
+
+    def __init__(self, game, keyframe_turns=SYNC_KEYFRAME_TURNS):
+        self.game = game
+        self.keyframe_turns = keyframe_turns
+        self.sequence = 0  # Numéro du dernier paquet émis
+        self._system_index = {id(system): index for index, system in enumerate(game.game_board.systems)}
+        self._buffer = bytearray()
+        self._take_keyframe()
+        game.events.subscribe(self)
+
+    def _take_keyframe(self):
+        self.keyframe = (self.sequence, save_game(self.game))
+        self._keyframe_turn = self.game.turn_count
+        self.backlog = []  # Paquets émis depuis l'image clé
+
+    def _system_at(self, position):
+        return self._system_index[id(self.game.game_board.get_system_at(position))]
+
+    def _append(self, op, *values):
+        self._buffer += DELTAS[op].pack(op, *values)
+
+    def __call__(self, event):
+        encode = _ENCODERS.get(type(event))
+        if encode is not None:
+            # Deltas retirés si la partie annule (undo) l'action avant flush()
+            self.game.journal.record_inverse(_truncate_buffer, self, len(self._buffer), None)
+            encode(self, event)
+
+    def _ship_moved(self, event):
+        x, y = event.position
+        self._append(OP_SHIP_MOVED, self.game.scheduler.current, x, y, event.points_left, event.entered_system)
+
+    def _system_revealed(self, event):
+        self._append(OP_SYSTEM_REVEALED, self._system_at(event.position), event.temporary)
+
+    def _system_hidden(self, event):
+        self._append(OP_SYSTEM_HIDDEN, self._system_at(event.position))
+
+    def _totem_harvested(self, event):
+        self._append(OP_TOTEM_HARVESTED, self.game.scheduler.current, _TOTEM_CODES[event.totem],
+                     _COLOR_INDEX[event.rack_color])
+
+    def _totem_deposited(self, event):
+        self._append(OP_TOTEM_DEPOSITED, self.game.scheduler.current, _TOTEM_CODES[event.totem],
+                     _COLOR_INDEX[event.rack_color])
+
+    def _rack_influenced(self, event):
+        self._append(OP_RACK_CYCLED, _COLOR_INDEX[event.rack_color])
+
+    def _turn_started(self, event):
+        self._append(OP_TURN_STARTED, event.turn, self.game.scheduler.current)
+
+    def _turn_ended(self, event):
+        self._append(OP_TURN_ENDED, self.game.scheduler.current, event.score)
+
+    def _player_left(self, event):
+        self._append(OP_PLAYER_LEFT, event.player_id, PLAYER_STATUSES.index(event.status))
+
+    def _game_over(self, event):
+        winner = self.game.winner
+        self._append(OP_GAME_OVER, winner.id if winner is not None else NO_INDEX)
+
+    def flush(self):
+        """
+        Renvoie le paquet des deltas accumulés depuis le dernier appel (None s'il n'y
+        en a aucun) et reprend une image clé en début de tour tous les keyframe_turns tours.
+        """
+        if not self._buffer:
+            return None
+        self.sequence += 1
+        packet = PACKET_HEADER.pack(self.sequence) + self._buffer
+        self._buffer = bytearray()
+        game = self.game
+        if game.turn_count - self._keyframe_turn >= self.keyframe_turns and game.game_state != STATE_GAME_OVER:
+            self._take_keyframe()
+        else:
+            self.backlog.append(packet)
+        return packet
+
+    def catch_up(self):
+        """(image clé, paquets suivants) : de quoi amener un nouveau client à l'état courant."""
+        return self.keyframe, list(self.backlog)
+
+
+_ENCODERS = {
+    ShipMoved: DeltaEncoder._ship_moved,
+    SystemRevealed: DeltaEncoder._system_revealed,
+    SystemHidden: DeltaEncoder._system_hidden,
+    TotemHarvested: DeltaEncoder._totem_harvested,
+    TotemDeposited: DeltaEncoder._totem_deposited,
+    RackInfluenced: DeltaEncoder._rack_influenced,
+    TurnStarted: DeltaEncoder._turn_started,
+    TurnEnded: DeltaEncoder._turn_ended,
+    PlayerLeft: DeltaEncoder._player_left,
+    GameOver: DeltaEncoder._game_over,
+}
+
+
+class DeltaApplier:
+    """Réplique côté client : une partie headless tenue à jour par les paquets reçus."""
+
+    def __init__(self, keyframe, packets=()):
+        self.sequence, data = keyframe
+        # Horloge simulée : les échéances (fin d'Observer, limite de tour) arrivent par les deltas du serveur
+        self.game = load_game(data, clock=SimulatedClock())
+        for packet in packets:
+            self.apply(packet)
+
+    def apply(self, packet):
+        """
+        Applique un paquet. Renvoie False pour un paquet déjà appliqué ; lève
+        SyncError si un paquet manque (repartir alors d'une image clé).
+        """
+        if len(packet) < PACKET_HEADER.size:
+            raise SyncError("Truncated packet.")
+        (sequence,) = PACKET_HEADER.unpack_from(packet)
+        if sequence <= self.sequence:
+            return False
+        if sequence != self.sequence + 1:
+            raise SyncError(f"Missing packets {self.sequence + 1}..{sequence - 1}.")
+        offset = PACKET_HEADER.size
+        while offset < len(packet):
+            delta = DELTAS.get(packet[offset])
+            if delta is None:
+                raise SyncError(f"Unknown delta opcode {packet[offset]}.")
+            if offset + delta.size > len(packet):
+                raise SyncError("Truncated packet.")
+            op, *values = delta.unpack_from(packet, offset)
+            _APPLIERS[op](self.game, *values)
+            offset += delta.size
+        self.sequence = sequence
+        return True
+
+
+def _apply_ship_moved(game, seat, x, y, points_left, entered_system):
+    player = game.players[seat]
+    ship = player.vaisseau
+    ship.position = (x, y)
+    ship.movement_points_remaining = points_left
+    if entered_system:
+        ship.movement_points_remaining = 0
+        player.movement_used = True
+        # Système vu en y entrant, qu'il ait été révélé par ce déplacement ou avant
+        player.seen_mask |= 1 << game.game_board.get_system_at((x, y)).index
+
+
+def _apply_system_revealed(game, index, temporary):
+    system = game.game_board.systems[index]
+    system.revealed = True
+    if temporary:
+        game.get_player().seen_mask |= 1 << index
+        game.observer_system = system
+        game.observer_start_time = game.timers.clock.now()
+        game.action_observer_used = True
+        game.observer_mode = False
+
+
+def _apply_system_hidden(game, index):
+    game.game_board.systems[index].revealed = False
+    game.observer_system = None
+    game.observer_start_time = None
+
+
+def _apply_totem_harvested(game, seat, code, color_index):
+    totem = _TOTEMS_BY_CODE[code]
+    game.system_racks[SYSTEM_COLORS[color_index]].take(totem.faction_id)
+    game.players[seat].add_totem(totem)
+    game.players[seat].action_recolter_used = True
+
+
+def _apply_totem_deposited(game, seat, code, color_index):
+    totem = _TOTEMS_BY_CODE[code]
+    game.players[seat].remove_totem(totem)
+    game.system_racks[SYSTEM_COLORS[color_index]].put(totem)
+    game.players[seat].action_deposer_used = True
+
+
+def _apply_rack_cycled(game, color_index):
+    game.system_racks[SYSTEM_COLORS[color_index]].cycle()
+    game.action_influencer_used = True
+
+
+def _apply_turn_started(game, turn, seat):
+    game.scheduler.current = seat
+    game.turn_count = turn
+    player = game.players[seat]
+    player.vaisseau.reset_movement_points()
+    for name in Player.TURN_STATE_FIELDS:
+        setattr(player, name, False)
+    game.observer_system = None
+    game.observer_start_time = None
+    game.game_state = STATE_PLAYER_TURN
+
+
+def _apply_turn_ended(game, seat, score):
+    game.players[seat].score = score
+
+
+def _apply_player_left(game, seat, status_index):
+    game.players[seat].status = PLAYER_STATUSES[status_index]
+    game.scheduler.remove(seat)
+
+
+def _apply_game_over(game, winner_seat):
+    game.game_state = STATE_GAME_OVER
+    game.winner = game.players[winner_seat] if winner_seat != NO_INDEX else None
+
+
+_APPLIERS = {
+    OP_SHIP_MOVED: _apply_ship_moved,
+    OP_SYSTEM_REVEALED: _apply_system_revealed,
+    OP_SYSTEM_HIDDEN: _apply_system_hidden,
+    OP_TOTEM_HARVESTED: _apply_totem_harvested,
+    OP_TOTEM_DEPOSITED: _apply_totem_deposited,
+    OP_RACK_CYCLED: _apply_rack_cycled,
+    OP_TURN_STARTED: _apply_turn_started,
+    OP_TURN_ENDED: _apply_turn_ended,
+    OP_PLAYER_LEFT: _apply_player_left,
+    OP_GAME_OVER: _apply_game_over,
+}
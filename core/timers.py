@@ -0,0 +1,108 @@
+# core/timers.py
+"""
+Échéancier des effets temporisés d'une partie (révélation Observer, limite de
+temps par tour, ...) : un tas binaire d'échéances, insertion et expiration en
+O(log n), annulation paresseuse en O(1).
+
+L'heure vient d'une horloge interchangeable : RealClock (time.monotonic) pour
+le jeu et le serveur, SimulatedClock pour les parties headless et les rejeux,
+qui avancent le temps d'un coup (advance) au lieu d'attendre.
+"""
+import heapq
+import itertools
+import time
+
+
+class RealClock:
+    """Horloge murale monotone."""
+
+    def now(self):
+        return time.monotonic()
+
+
+class SimulatedClock:
+    """Horloge manuelle : le temps n'avance que par advance()/set()."""
+
+    def __init__(self, start=0.0):
+        self.time = start
+
+    def now(self):
+        return self.time
+
+    def advance(self, seconds):
+        self.time += seconds
+
+    def set(self, instant):
+        self.time = instant
+
+
+class Timer:
+    """Échéance programmée ; cancel() la désarme sans la retirer du tas."""
+
+    __slots__ = ('deadline', 'callback', 'args', 'cancelled')
+
+    def __init__(self, deadline, callback, args):
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class TimerScheduler:
+    """Tas d'échéances ; les rappels sont exécutés par run_due() ou advance()."""
+
+    def __init__(self, clock=None):
+        self.clock = clock if clock is not None else RealClock()
+        self._heap = []  # (échéance, numéro d'ordre, Timer) ; à échéance égale, ordre de programmation
+        self._order = itertools.count()
+
+    def __len__(self):
+        """Nombre d'échéances programmées non annulées."""
+        return sum(not timer.cancelled for _, _, timer in self._heap)
+
+    def schedule(self, delay, callback, *args):
+        """Programme callback(*args) dans delay secondes ; renvoie le Timer."""
+        timer = Timer(self.clock.now() + delay, callback, args)
+        heapq.heappush(self._heap, (timer.deadline, next(self._order), timer))
+        return timer
+
+    def next_deadline(self):
+        """Instant (horloge de l'échéancier) de la prochaine échéance, ou None."""
+        heap = self._heap
+        while heap and heap[0][2].cancelled:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def run_due(self):
+        """
+        Exécute dans l'ordre les rappels arrivés à échéance (y compris ceux qu'ils
+        programment pour maintenant) et renvoie leur nombre.
+        """
+        heap = self._heap
+        now = self.clock.now()
+        fired = 0
+        while heap and heap[0][0] <= now:
+            _, _, timer = heapq.heappop(heap)
+            if not timer.cancelled:
+                timer.callback(*timer.args)
+                fired += 1
+        return fired
+
+    def advance(self, seconds):
+        """
+        Avance une SimulatedClock de seconds en exécutant chaque échéance à son
+        instant exact (l'horloge lue par un rappel est celle de son échéance).
+        """
+        target = self.clock.now() + seconds
+        fired = 0
+        while True:
+            deadline = self.next_deadline()
+            if deadline is None or deadline > target:
+                break
+            self.clock.set(max(deadline, self.clock.now()))
+            fired += self.run_due()
+        self.clock.set(target)
+        return fired
@@ -0,0 +1,68 @@
+# core/turns.py
+"""
+Ordonnancement des tours en partie à plusieurs joueurs.
+
+Les sièges actifs forment une liste circulaire doublement chaînée (tableaux
+next/prev indexés par siège) : passer au joueur suivant et retirer un joueur
+éliminé ou ayant abandonné coûtent O(1), quel que soit le nombre de joueurs.
+Un nouveau tour de table commence quand l'ordre des sièges boucle.
+"""
+
+
+class TurnScheduler:
+    """Ordre de jeu des joueurs actifs ; toutes les opérations sont en O(1)."""
+
+    def __init__(self, num_seats, journal=None):
+        self.next = [(seat + 1) % num_seats for seat in range(num_seats)]
+        self.prev = [(seat - 1) % num_seats for seat in range(num_seats)]
+        self.active = [True] * num_seats
+        self.active_count = num_seats
+        self.current = 0
+        self.journal = journal  # UndoJournal de la partie : avance et retraits sont annulables
+
+    def advance(self):
+        """
+        Passe au prochain siège actif et le renvoie avec un booléen indiquant
+        si un nouveau tour de table commence.
+        """
+        if self.journal:
+            self.journal.record_attr(self, 'current')
+        previous = self.current
+        self.current = self.next[previous]
+        # Le siège courant peut avoir été retiré : next[] garde son successeur
+        return self.current, self.current <= previous
+
+    def remove(self, seat):
+        """Retire un siège de l'ordre de jeu (abandon ou élimination)."""
+        if not self.active[seat]:
+            return
+        journal = self.journal
+        before, after = self.prev[seat], self.next[seat]
+        if journal:
+            journal.record_item(self.next, before)
+            journal.record_item(self.prev, after)
+            journal.record_item(self.active, seat)
+            journal.record_attr(self, 'active_count')
+        self.next[before] = after
+        self.prev[after] = before
+        self.active[seat] = False
+        self.active_count -= 1
+        current = self.current
+        if current != seat and not self.active[current] and self.next[current] == seat:
+            # Le siège courant, déjà retiré, pointait vers celui-ci
+            if journal:
+                journal.record_item(self.next, current)
+            self.next[current] = after
+
+    def restore(self, current, active):
+        """Reconstruit l'ordre à partir du siège courant et des drapeaux d'activité (rechargement)."""
+        seats = [seat for seat, is_active in enumerate(active) if is_active]
+        self.active = list(active)
+        self.active_count = len(seats)
+        for index, seat in enumerate(seats):
+            self.next[seat] = seats[(index + 1) % len(seats)]
+            self.prev[seat] = seats[index - 1]
+        self.current = current
+        if not self.active[current] and seats:
+            # Siège courant retiré : son successeur est le prochain siège actif
+            self.next[current] = next((s for s in seats if s > current), seats[0])
@@ -0,0 +1,91 @@
+# core/undo.py
+"""
+Journal d'annulation pour l'exploration (recherche) sur une partie.
+
+Game.fork() ouvre un point de sauvegarde ; chaque mutation faite ensuite
+par les actions est journalisée (ancienne valeur d'un attribut ou d'une entrée),
+et Game.undo() rejoue le journal à l'envers jusqu'au point de sauvegarde.
+Les listes de l'inventaire sont copiées à l'écriture : la première modification
+d'une liste après un fork la remplace par une copie, et le journal garde la liste
+d'origine intacte. Les racks (core.rack) journalisent l'inverse de chaque
+opération. Fork et annulation coûtent O(modifications).
+"""
+import operator
+
+
+class UndoJournal:
+    """Pile de points de sauvegarde et journal des anciennes valeurs."""
+
+    def __init__(self):
+        self.entries = []  # (setter ou inverse, cible, clé, ancienne valeur)
+        self.savepoints = []  # (taille du journal, listes possédées du niveau parent)
+        self._owned = {}  # id -> liste copiée depuis le dernier point de sauvegarde
+
+    @property
+    def active(self):
+        return bool(self.savepoints)
+
+    def record_attr(self, obj, name):
+        """Mémorise la valeur actuelle de obj.name avant sa modification."""
+        if self.savepoints:
+            self.entries.append((setattr, obj, name, getattr(obj, name)))
+
+    def record_item(self, mapping, key):
+        """Mémorise la valeur actuelle de mapping[key] avant sa modification."""
+        if self.savepoints:
+            self.entries.append((operator.setitem, mapping, key, mapping[key]))
+
+    def record_inverse(self, inverse, target, key, value):
+        """Mémorise l'appel inverse(target, key, value) qui annulera une modification."""
+        if self.savepoints:
+            self.entries.append((inverse, target, key, value))
+
+    def writable_item(self, mapping, key):
+        """Renvoie mapping[key] (une liste) modifiable sans altérer l'état sauvegardé."""
+        current = mapping[key]
+        if not self.savepoints or id(current) in self._owned:
+            return current
+        self.entries.append((operator.setitem, mapping, key, current))
+        copy = current[:]
+        mapping[key] = copy
+        self._owned[id(copy)] = copy
+        return copy
+
+    def writable_attr(self, obj, name):
+        """Renvoie obj.name (une liste) modifiable sans altérer l'état sauvegardé."""
+        current = getattr(obj, name)
+        if not self.savepoints or id(current) in self._owned:
+            return current
+        self.entries.append((setattr, obj, name, current))
+        copy = current[:]
+        setattr(obj, name, copy)
+        self._owned[id(copy)] = copy
+        return copy
+
+    def fork(self):
+        """Ouvre un point de sauvegarde et renvoie la profondeur atteinte."""
+        self.savepoints.append((len(self.entries), self._owned))
+        self._owned = {}
+        return len(self.savepoints)
+
+    def undo(self):
+        """Annule toutes les modifications depuis le dernier point de sauvegarde."""
+        if not self.savepoints:
+            raise RuntimeError("undo() called without a matching fork().")
+        mark, owned = self.savepoints.pop()
+        entries = self.entries
+        while len(entries) > mark:
+            setter, target, key, old_value = entries.pop()
+            setter(target, key, old_value)
+        self._owned = owned
+
+    def commit(self):
+        """Ferme le dernier point de sauvegarde en conservant ses modifications."""
+        if not self.savepoints:
+            raise RuntimeError("commit() called without a matching fork().")
+        _, owned = self.savepoints.pop()
+        owned.update(self._owned)
+        self._owned = owned
+        if not self.savepoints:
+            self.entries.clear()
+            self._owned = {}
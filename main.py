@@ -3,9 +3,38 @@
 Main entry point for the Space Explore game.
 Initializes Pygame, creates the Game object, and runs the main game loop.
 """
+import math
+import random
+import time
 import pygame
-from config import SCREEN_WIDTH, SCREEN_HEIGHT, BLACK, STATE_GAME_OVER
+from config import (SCREEN_WIDTH, SCREEN_HEIGHT, STATE_GAME_OVER, FPS, IDLE_MAIN_LOOP,
+                    BOARD_OFFSET_X, BOARD_OFFSET_Y, VIEWPORT_HEIGHT, PROFILER_ENABLED, PROFILER_WINDOW)
+from core.events import ConsoleSubscriber
 from core.game_state import Game
+from core.profiler import FrameProfiler
+from core.replay import ActionLog
+from ui.renderer import DirtyRectRenderer
+
+
+def wait_for_events(game):
+    """
+    Bloque jusqu'au prochain événement ou jusqu'à la prochaine échéance du jeu
+    (ex. fin de la révélation Observer) et renvoie les événements reçus.
+    """
+    timeout = game.time_until_deadline()
+    if timeout is None:
+        event = pygame.event.wait()
+    else:
+        event = pygame.event.wait(max(1, math.ceil(timeout * 1000)))
+    if event.type == pygame.NOEVENT:
+        return []
+    return [event] + pygame.event.get()
+
+
+# Phases affichées par l'overlay du profileur (F3)
+OVERLAY_PHASES = ("frame", "events", "update", "board", "ships", "ui",
+                  "find_path", "get_system_at", "check_game_over")
+OVERLAY_POSITION = (BOARD_OFFSET_X, BOARD_OFFSET_Y + VIEWPORT_HEIGHT + 10)  # Sous la grille
 
 
 def main():
@@ -20,7 +49,12 @@ def main():
 
     # Création de l'instance du jeu
     num_human_players = 1  # Mode solo
-    game = Game(num_players=num_human_players)
+    # Graine et journal d'actions : la partie peut être rejouée (F9 enregistre le journal)
+    seed = random.getrandbits(63)
+    game = Game(num_players=num_human_players, seed=seed)
+    action_log = ActionLog.attach(game)
+    game.events.subscribe(ConsoleSubscriber())
+    print(f"Game seed: {seed}")
     try:
         game.setup_game()
     except RuntimeError as e:
@@ -28,31 +62,84 @@ def main():
         pygame.quit()
         return
 
+    profiler = FrameProfiler(window=PROFILER_WINDOW, enabled=PROFILER_ENABLED)
+    profiler.instrument_game(game)
+    show_overlay = False
+    capturing = False  # Capture de trace Chrome en cours (F12 pour démarrer, F12 pour écrire)
+
+    renderer = DirtyRectRenderer(game, screen, profiler)
+    if IDLE_MAIN_LOOP:
+        # Seuls ces événements réveillent la boucle (souris : zoom et défilement de la caméra) ;
+        # MOUSEMOTION n'est autorisé que pendant un glisser de la caméra
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+                                  pygame.MOUSEWHEEL, pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED])
+    followed_position = None  # Position du vaisseau courant suivie par la caméra
+
     # Boucle principale du jeu
     running = True
     while running:
-        # Gestion des événements
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            # Pass input events to the game logic if the game is running
-            if game.game_state != STATE_GAME_OVER:
-                game.handle_input(event)
+        # Gestion des événements : attente bloquante en mode idle, sondage sinon
+        events = wait_for_events(game) if IDLE_MAIN_LOOP else pygame.event.get()
+        profiler.begin_frame()  # L'attente bloquante n'est pas comptée dans l'image
+        with profiler.section("events"):
+            for event in events:
+                if event.type == pygame.QUIT:
+                    running = False
+                elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    renderer.invalidate()
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    show_overlay = not show_overlay
+                    if not show_overlay:
+                        renderer.invalidate()  # Effacer l'overlay au prochain rendu
+                    # Le profileur ne mesure (et n'enveloppe les règles) que s'il est affiché ou capturé
+                    profiler.set_enabled(PROFILER_ENABLED or show_overlay or capturing)
+                    continue
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_F12:
+                    if capturing:
+                        path = profiler.dump_chrome_trace(time.strftime("trace-%Y%m%d-%H%M%S.json"))
+                        print(f"Profiler trace written to {path}")
+                    else:
+                        profiler.trace.clear()
+                        print("Profiler capture started (F12 again to write the trace)")
+                    capturing = not capturing
+                    profiler.set_enabled(PROFILER_ENABLED or show_overlay or capturing)
+                    continue
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_F9:
+                    path = action_log.save(time.strftime("replay-%Y%m%d-%H%M%S.jsonl"))
+                    print(f"Action log written to {path}")
+                    continue
+                elif game.camera.handle_event(event):
+                    if IDLE_MAIN_LOOP and event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+                        # Début ou fin d'un glisser : les mouvements de souris ne réveillent la boucle que pendant
+                        if game.camera.dragging:
+                            pygame.event.set_allowed(pygame.MOUSEMOTION)
+                        else:
+                            pygame.event.set_blocked(pygame.MOUSEMOTION)
+                    continue
+                # Pass input events to the game logic if the game is running
+                if game.game_state != STATE_GAME_OVER:
+                    game.handle_input(event)
+            # La caméra suit le vaisseau courant quand il bouge (pas quand la vue défile)
+            ship_position = game.get_player().vaisseau.position
+            if ship_position != followed_position:
+                game.camera.keep_visible(ship_position)
+                followed_position = ship_position
 
         # Mise à jour de la logique du jeu
-        game.update()
-
-        # Effacer l'écran
-        screen.fill(BLACK)
-
-        # Dessiner le jeu complet
-        game.draw(screen)
+        with profiler.section("update"):
+            game.update()
 
-        # Mettre à jour l'affichage
-        pygame.display.flip()
+        # Dessiner uniquement ce qui a changé et mettre à jour ces zones
+        dirty_rects = renderer.render()
+        if show_overlay:
+            dirty_rects.append(profiler.draw_overlay(screen, game.font_small, game.text_cache,
+                                                     OVERLAY_POSITION, OVERLAY_PHASES))
+        pygame.display.update(dirty_rects)
+        profiler.end_frame()
 
         # Limitation de la fréquence d'images
-        clock.tick(30)  # 30 FPS
+        clock.tick(FPS)
 
     pygame.quit()
 
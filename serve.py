@@ -0,0 +1,87 @@
+# serve.py
+"""
+Serveur de parties headless : un seul processus asyncio héberge de nombreuses
+parties simultanées (protocole JSON Lines, voir core/server.py).
+
+    python serve.py                           # TCP sur 127.0.0.1:8765
+    python serve.py --unix /tmp/spacexplore.sock
+    python serve.py --load 1000 --players 2   # Serveur local + générateur de charge
+    python serve.py --load 1000 --connect     # Générateur de charge contre un serveur déjà lancé
+    python serve.py --load 200 --sync deltas --spectators 4
+"""
+import argparse
+import asyncio
+import os
+import signal
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from config import SERVER_HOST, SERVER_PORT
+from core.loadgen import run_load
+from core.server import GameServer
+
+
+def _describe_address(address):
+    return address if isinstance(address, str) else f"{address[0]}:{address[1]}"
+
+
+async def serve(host, port, path):
+    """Sert jusqu'à SIGINT/SIGTERM, puis s'arrête proprement."""
+    server = await GameServer().start(host, port, path)
+    print(f"Serving on {_describe_address(server.address)} (Ctrl+C to stop)")
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, stop.set)
+        except NotImplementedError:
+            pass  # Windows : Ctrl+C interrompt asyncio.run() directement
+    await stop.wait()
+    print("Shutting down...")
+    await server.shutdown()
+    stats = server.snapshot_stats()
+    print(f"Hosted {stats['games_created']} games, {stats['actions']} actions, "
+          f"{stats['connections']} connections in {stats['uptime']:.0f}s")
+
+
+async def load(args):
+    """Générateur de charge, contre un serveur lancé dans ce processus sauf avec --connect."""
+    server = None
+    host, port, path = args.host, args.port, args.unix
+    if not args.connect:
+        server = await GameServer().start(host, port or 0, path)
+        if path is None:
+            host, port = server.address[:2]
+    try:
+        report = await run_load(args.load, args.players, args.concurrency, args.seed,
+                                host, port or SERVER_PORT, path, args.sync, args.spectators)
+    finally:
+        if server is not None:
+            await server.shutdown()
+    print(report.describe())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Space Explore game server")
+    parser.add_argument("--host", default=SERVER_HOST)
+    parser.add_argument("--port", type=int, default=None, help=f"Port TCP (défaut {SERVER_PORT})")
+    parser.add_argument("--unix", metavar="PATH", help="Socket Unix au lieu de TCP")
+    parser.add_argument("--load", type=int, metavar="GAMES", help="Jouer GAMES parties de charge et afficher le débit")
+    parser.add_argument("--players", type=int, default=1, help="Avec --load : sièges par partie")
+    parser.add_argument("--concurrency", type=int, default=None,
+                        help="Avec --load : parties simultanées au maximum (défaut : toutes)")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="Avec --load : graine de la première partie")
+    parser.add_argument("--sync", choices=("events", "deltas"), default="events",
+                        help="Avec --load : événements JSON ou paquets de deltas pour les joueurs")
+    parser.add_argument("--spectators", type=int, default=0, help="Avec --load : spectateurs par partie (deltas)")
+    parser.add_argument("--connect", action="store_true", help="Avec --load : utiliser un serveur déjà lancé")
+    args = parser.parse_args(argv)
+
+    if args.load:
+        asyncio.run(load(args))
+    else:
+        asyncio.run(serve(args.host, args.port or SERVER_PORT, args.unix))
+
+
+if __name__ == "__main__":
+    main()
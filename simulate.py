@@ -0,0 +1,119 @@
+# simulate.py
+"""
+Point d'entrée headless : joue N parties complètes avec une politique
+automatique, aussi vite que le permet le CPU, et affiche le débit.
+
+    python simulate.py --games 1000 --policy greedy --seed 42
+    python simulate.py --games 100000 --workers all   # Monte Carlo sur tous les cœurs
+    python simulate.py --replay replay.jsonl --turn 12 -v   # Rejoue un journal (F9 en jeu)
+"""
+import argparse
+import os
+import random
+import time
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from config import MAX_PLAYERS
+from core.montecarlo import run_monte_carlo
+from core.events import ConsoleSubscriber
+from core.policies import POLICIES
+from core.replay import ActionLog, Replayer
+from core.simulation import run_batch
+
+
+def positive_int(text):
+    """Type argparse : entier >= 1."""
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1 (got {value})")
+    return value
+
+
+def worker_count(text):
+    """Type argparse : nombre de processus (>= 1), ou "all" pour tous les cœurs (None)."""
+    return None if text == "all" else positive_int(text)
+
+
+def player_count(text):
+    """Type argparse : nombre de joueurs par table, de 1 à MAX_PLAYERS."""
+    value = int(text)
+    if not 1 <= value <= MAX_PLAYERS:
+        raise argparse.ArgumentTypeError(f"must be between 1 and {MAX_PLAYERS} (got {value})")
+    return value
+
+
+def print_monte_carlo(stats):
+    """Affiche les statistiques agrégées par couleur d'origine."""
+    summary = stats.summary()
+    print(f"{'Origin':<8} {'Games':>7} {'Win%':>6} {'Turns p50/p90':>14} {'Score mean':>11} "
+          f"{'std':>7} {'p10/p50/p90':>20}")
+    rows = list(summary["by_origin"].items()) + [("ALL", summary["overall"])]
+    for origin, row in rows:
+        turns = f"{row['turns_p50']}/{row['turns_p90']}" if row["turns_p50"] is not None else "-"
+        scores = f"{row['score_p10']:.0f}/{row['score_p50']:.0f}/{row['score_p90']:.0f}"
+        print(f"{origin:<8} {row['games']:>7} {row['win_rate']:>6.1%} {turns:>14} "
+              f"{row['score_mean']:>11.0f} {row['score_std']:>7.0f} {scores:>20}")
+
+
+def replay_log(path, turn=None, verbose=False):
+    """Rejoue un journal d'actions sans affichage, jusqu'au début de turn ou jusqu'au bout."""
+    log = ActionLog.load(path)
+    replayer = Replayer(log, subscribers=(ConsoleSubscriber(),) if verbose else ())
+    start = time.perf_counter()
+    game = replayer.seek(turn) if turn is not None else replayer.run()
+    elapsed = time.perf_counter() - start
+    player = game.get_player()
+    print(f"Replayed {replayer.position}/{len(log)} actions (seed {log.seed}) in {elapsed * 1000:.1f} ms")
+    print(f"Turn {game.turn_count}, state {game.game_state}, ship at {player.vaisseau.position}, "
+          f"score {player.score}, totems {player.totems}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Space Explore headless batch runner")
+    parser.add_argument("-n", "--games", type=positive_int, default=100, help="Nombre de parties à jouer")
+    parser.add_argument("-p", "--policy", choices=sorted(POLICIES), default="greedy")
+    parser.add_argument("-s", "--seed", type=int, default=None)
+    parser.add_argument("--players", type=player_count, default=1,
+                        help=f"Joueurs par table (bots, 1 à {MAX_PLAYERS})")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Conserver les messages du moteur")
+    parser.add_argument("-w", "--workers", type=worker_count, default=1,
+                        help="Processus Monte Carlo (all = tous les cœurs, 1 = séquentiel)")
+    parser.add_argument("--chunk-size", type=positive_int, default=256, help="Parties par paquet envoyé aux workers")
+    parser.add_argument("--replay", metavar="LOG", help="Rejouer un journal d'actions au lieu de jouer")
+    parser.add_argument("--turn", type=int, default=None, help="Avec --replay : s'arrêter au début de ce tour")
+    args = parser.parse_args(argv)
+
+    if args.replay:
+        replay_log(args.replay, args.turn, args.verbose)
+        return
+
+    if args.seed is None:
+        # Graine tirée une fois pour les deux modes, affichée pour pouvoir rejouer la série
+        args.seed = random.getrandbits(32)
+    print(f"Seed: {args.seed}")
+
+    start = time.perf_counter()
+    if args.workers != 1:
+        stats = run_monte_carlo(args.games, args.policy, seed=args.seed,
+                                workers=args.workers, chunk_size=args.chunk_size,
+                                num_players=args.players)
+        elapsed = time.perf_counter() - start
+        print(f"Played {args.games} games in {elapsed:.2f}s ({args.games / elapsed:.1f} games/sec)")
+        print_monte_carlo(stats)
+        return
+
+    results = run_batch(args.games, args.policy, seed=args.seed, quiet=not args.verbose,
+                        num_players=args.players)
+    elapsed = time.perf_counter() - start
+
+    wins = [r for r in results if r["won"]]
+    print(f"Played {len(results)} games in {elapsed:.2f}s ({len(results) / elapsed:.1f} games/sec)")
+    print(f"Win rate: {len(wins) / len(results):.1%}")
+    if wins:
+        print(f"Mean turns to victory: {sum(r['turns'] for r in wins) / len(wins):.1f}")
+    print(f"Mean final score: {sum(r['score'] for r in results) / len(results):.0f}")
+
+
+if __name__ == "__main__":
+    main()
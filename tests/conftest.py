@@ -0,0 +1,25 @@
+"""
+Configuration commune des tests : pilote vidéo SDL factice (CI sans écran)
+et marqueur « benchmark » pour la suite de performance, désélectionnée d'un
+lancement sans -m ; la CI l'exécute à part (pytest -m benchmark), ou
+SPACEEXPLORE_BENCH=1 pour tout exécuter.
+"""
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "benchmark: mesure de débit comparée aux références (sélection : -m benchmark)")
+
+
+def pytest_collection_modifyitems(config, items):
+    # Une expression -m explicite décide seule de la sélection
+    if config.getoption("markexpr") or os.environ.get("SPACEEXPLORE_BENCH") == "1":
+        return
+    deselected = [item for item in items if item.get_closest_marker("benchmark")]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = [item for item in items if not item.get_closest_marker("benchmark")]
@@ -0,0 +1,101 @@
+"""
+Parité entre le moteur vectorisé (core.batch_engine) et le moteur objet (core.game_state).
+"""
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from core.batch_engine import (BatchEngine, summarize_game, ACTION_NONE, ACTION_MOVE, ACTION_HARVEST,
+                               ACTION_DEPOSIT, ACTION_INFLUENCE, ACTION_END_TURN)
+from config import FACTION_NAMES, SYSTEM_COLORS
+from core.game_entities import Totem
+from core.game_state import Game
+from core.policies import DIRECTIONS
+
+
+def _make_games(count, seed):
+    games = []
+    for index in range(count):
+        game = Game(headless=True, rng=random.Random(f"{seed}-{index}"))
+        game.setup_game()
+        games.append(game)
+    return games
+
+
+def _apply_to_object(game, action, arg):
+    if action == ACTION_MOVE:
+        return game.move_ship(*DIRECTIONS[arg])
+    if action == ACTION_HARVEST:
+        return game.play_recolter()
+    if action == ACTION_DEPOSIT:
+        totems = game.get_player().totems
+        if arg >= len(totems):
+            return False
+        return game.play_deposer(totems[arg])
+    if action == ACTION_INFLUENCE:
+        return game.play_influencer()
+    if action == ACTION_END_TURN:
+        game.end_turn()
+        return True
+    return False
+
+
+def test_initial_state_matches():
+    games = _make_games(8, seed=1)
+    engine = BatchEngine.from_games(games)
+    for k, game in enumerate(games):
+        assert engine.game_summary(k) == summarize_game(game)
+
+
+@pytest.mark.parametrize("seed", [2, 3])
+def test_random_play_matches_object_engine(seed):
+    games = _make_games(16, seed)
+    engine = BatchEngine.from_games(games)
+    rng = np.random.default_rng(seed)
+    codes = [ACTION_NONE, ACTION_MOVE, ACTION_HARVEST, ACTION_DEPOSIT, ACTION_INFLUENCE, ACTION_END_TURN]
+    weights = [0.05, 0.55, 0.12, 0.08, 0.08, 0.12]
+    for _ in range(600):
+        actions = rng.choice(codes, size=len(games), p=weights)
+        args = np.where(actions == ACTION_MOVE, rng.integers(0, len(DIRECTIONS), len(games)),
+                        rng.integers(0, 4, len(games)))
+        success = engine.step(actions, args)
+        for k, game in enumerate(games):
+            if summarize_game(game)["game_over"]:
+                assert not success[k]
+                continue
+            assert success[k] == _apply_to_object(game, actions[k], args[k])
+            assert engine.game_summary(k) == summarize_game(game)
+
+
+def test_vectorized_score_and_victory_match_player():
+    games = _make_games(32, seed=4)
+    rng = random.Random(4)
+    for game in games:
+        # Inventaire arbitraire pour couvrir les quatre conditions de victoire
+        for _ in range(rng.randint(0, 9)):
+            game.get_player().add_totem(Totem(rng.choice(FACTION_NAMES), rng.choice(SYSTEM_COLORS)))
+    engine = BatchEngine.from_games(games)
+    scores = engine.bonus_scores()
+    victories = engine.victory_conditions()
+    for k, game in enumerate(games):
+        assert scores[k] == game.get_player().calculate_score()
+        assert victories[k] == game.get_player().check_victory_conditions()
+    assert victories.any() and not victories.all()
+
+
+def test_end_turn_on_origin_with_winning_set_ends_game():
+    games = _make_games(2, seed=5)
+    for game in games:
+        player = game.get_player()
+        for faction_id in FACTION_NAMES:
+            player.add_totem(Totem(faction_id, player.couleur))
+    games[0].get_player().vaisseau.position = games[0].player_origin_system_pos
+    engine = BatchEngine.from_games(games)
+    engine.step(np.full(2, ACTION_END_TURN))
+    for game in games:
+        game.end_turn()
+    for k, game in enumerate(games):
+        assert engine.game_summary(k) == summarize_game(game)
+    assert engine.won.tolist() == [True, games[1].winner is not None]
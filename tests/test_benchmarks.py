@@ -0,0 +1,247 @@
+"""
+Benchmarks des chemins critiques : placement des systèmes, index d'occupation,
+recherche de chemin, score/victoire, matrice des tours entre systèmes et
+planification d'itinéraire, rendu d'une image complète et d'un grand plateau à
+travers la caméra.
+
+Chaque benchmark mesure un débit (opérations par seconde, meilleur de plusieurs
+répétitions) et le divise par celui d'une boucle de calibrage mesurée dans le
+même processus : benchmarks_baseline.json enregistre ces débits relatifs, qui ne
+dépendent pas de la vitesse de la machine. Le test échoue si le débit relatif
+descend sous (1 - seuil) x référence.
+
+Désélectionnés d'un lancement sans -m (durée) ; la CI (.github/workflows/tests.yml)
+les exécute à part : python -m pytest -m benchmark tests
+
+Variables d'environnement :
+  SPACEEXPLORE_BENCH=1              inclut les benchmarks dans un lancement sans -m
+  SPACEEXPLORE_BENCH_UPDATE=1       réécrit les références avec les mesures courantes
+  SPACEEXPLORE_BENCH_THRESHOLD=0.3  baisse de débit relatif tolérée (fraction de la référence)
+  SPACEEXPLORE_BENCH_RESULTS=path   écrit aussi les mesures de la session dans ce fichier JSON
+"""
+import json
+import os
+import pathlib
+import random
+import time
+
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from config import (BOARD_SIZE_X, BOARD_SIZE_Y, FACTION_NAMES, NUM_PLANET_SYSTEMS, SCREEN_HEIGHT,
+                    SCREEN_WIDTH, SYSTEM_COLORS)
+from core.game_board import GameBoard, SystemePlanetaireCapitale, SystemePlanetairePlanete
+from core.game_entities import Totem
+from core.game_state import Game, Player
+from core.planner import RoutePlanner
+from ui.camera import Camera
+
+pytestmark = pytest.mark.benchmark
+
+BASELINE_PATH = pathlib.Path(__file__).with_name("benchmarks_baseline.json")
+DEFAULT_THRESHOLD = 0.3
+MIN_TIME = 0.2  # Durée minimale d'une répétition (secondes)
+REPEATS = 3
+
+
+def measure_throughput(operation, min_time=MIN_TIME, repeats=REPEATS):
+    """Débit (appels/s) de operation(), meilleur de repeats mesures d'au moins min_time secondes."""
+    # Calibrage : doubler le nombre d'appels jusqu'à dépasser min_time / 10
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            operation()
+        if time.perf_counter() - start >= min_time / 10:
+            break
+        loops *= 2
+    best = 0.0
+    for _ in range(repeats):
+        calls = 0
+        start = time.perf_counter()
+        while True:
+            for _ in range(loops):
+                operation()
+            calls += loops
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                break
+        best = max(best, calls / elapsed)
+    return best
+
+
+def _calibration_loop():
+    """Charge de référence en Python pur (arithmétique, dict, liste), proche du code du moteur."""
+    table = {}
+    cells = []
+    for i in range(2000):
+        key = i & 63
+        table[key] = table.get(key, 0) + i * 7 % 13
+        cells.append((key, i >> 6))
+    return sum(table.values()) + len(cells)
+
+
+def _load_baselines():
+    if BASELINE_PATH.exists():
+        return json.loads(BASELINE_PATH.read_text(encoding="utf-8"))
+    return {}
+
+
+@pytest.fixture(scope="module")
+def bench_results():
+    """Collecte les mesures du module et les enregistre à la fin si demandé."""
+    results = {}
+    yield results
+    if os.environ.get("SPACEEXPLORE_BENCH_UPDATE") == "1":
+        baselines = _load_baselines()
+        baselines.update(results)
+        BASELINE_PATH.write_text(json.dumps(dict(sorted(baselines.items())), indent=2) + "\n",
+                                 encoding="utf-8")
+    results_path = os.environ.get("SPACEEXPLORE_BENCH_RESULTS")
+    if results_path:
+        pathlib.Path(results_path).write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+
+
+@pytest.fixture(scope="module")
+def calibration():
+    """Débit de la boucle de calibrage sur cette machine, dans ce processus."""
+    return measure_throughput(_calibration_loop, repeats=2 * REPEATS)
+
+
+@pytest.fixture
+def check_throughput(bench_results, calibration):
+    """Mesure operation sous le nom name et compare son débit relatif à la référence."""
+    def check(name, operation):
+        ops = measure_throughput(operation)
+        relative = ops / calibration
+        bench_results[name] = round(relative, 6)
+        if os.environ.get("SPACEEXPLORE_BENCH_UPDATE") == "1":
+            return relative
+        baseline = _load_baselines().get(name)
+        if baseline is None:
+            pytest.skip(f"{name}: {relative:.4g} x calibration, no baseline (run with SPACEEXPLORE_BENCH_UPDATE=1)")
+        threshold = float(os.environ.get("SPACEEXPLORE_BENCH_THRESHOLD", DEFAULT_THRESHOLD))
+        floor = baseline * (1 - threshold)
+        assert relative >= floor, (f"{name}: {relative:.4g} x calibration ({ops:.0f} ops/s), below {floor:.4g} "
+                                   f"(baseline {baseline:.4g}, threshold {threshold:.0%})")
+        return relative
+    return check
+
+
+def _systems(rng):
+    capitals = [SystemePlanetaireCapitale(color) for color in SYSTEM_COLORS]
+    planets = [SystemePlanetairePlanete(rng.choice(SYSTEM_COLORS)) for _ in range(NUM_PLANET_SYSTEMS)]
+    return capitals, planets
+
+
+def _headless_game(seed=0):
+    game = Game(headless=True, rng=random.Random(seed))
+    game.setup_game()
+    return game
+
+
+@pytest.mark.parametrize("size", [BOARD_SIZE_X, 2 * BOARD_SIZE_X, 4 * BOARD_SIZE_X])
+def test_place_initial_systems(check_throughput, size):
+    rng = random.Random(0)
+    board = GameBoard(size, size, headless=True)
+    capitals, planets = _systems(rng)
+    check_throughput(f"place_initial_systems[{size}]",
+                     lambda: board.place_initial_systems(capitals, planets, rng=rng))
+
+
+def test_get_system_at(check_throughput):
+    board = _headless_game().game_board
+    cells = [(x, y) for x in range(BOARD_SIZE_X) for y in range(BOARD_SIZE_Y)]
+
+    def scan_board():
+        for cell in cells:
+            board.get_system_at(cell)
+
+    # Une opération = un balayage complet du plateau
+    check_throughput("get_system_at[board_scan]", scan_board)
+
+
+@pytest.mark.parametrize("distance", [1, 4, 12, 27])
+def test_find_path(check_throughput, distance):
+    game = _headless_game()
+    # Départ depuis un coin libre : toutes les distances jusqu'au bord opposé existent
+    corners = [(0, 0), (BOARD_SIZE_X - 1, 0), (0, BOARD_SIZE_Y - 1), (BOARD_SIZE_X - 1, BOARD_SIZE_Y - 1)]
+    start = next(corner for corner in corners if game.game_board.get_system_at(corner) is None)
+    targets = [(x, y) for x in range(BOARD_SIZE_X) for y in range(BOARD_SIZE_Y)
+               if max(abs(x - start[0]), abs(y - start[1])) == distance]
+    assert targets, "aucune case à cette distance"
+
+    def cold_queries():
+        # Cache vidé : chaque appel recalcule le champ de distance depuis start
+        game.pathfinder._fields.clear()
+        for target in targets:
+            game.find_path(start, target, distance)
+
+    check_throughput(f"find_path[cold,d={distance}]", cold_queries)
+
+    game.find_path(start, targets[0], distance)
+    check_throughput(f"find_path[warm,d={distance}]",
+                     lambda: [game.find_path(start, target, distance) for target in targets])
+
+
+def test_score_and_victory(check_throughput):
+    rng = random.Random(0)
+    player = Player(0, SYSTEM_COLORS[0])
+    for _ in range(9):
+        player.add_totem(Totem(rng.choice(FACTION_NAMES), rng.choice(SYSTEM_COLORS)))
+
+    def evaluate():
+        player.calculate_score()
+        player.check_victory_conditions()
+
+    check_throughput("calculate_score+check_victory_conditions", evaluate)
+
+
+def test_travel_turns(check_throughput):
+    board = _headless_game().game_board
+    check_throughput("travel_turns[matrix]", board._compute_travel_turns)
+
+
+def test_plan_route(check_throughput):
+    game = _headless_game()
+    for system in game.game_board.systems:
+        system.revealed = True  # Plateau entièrement connu : tous les systèmes sont candidats
+    planner = RoutePlanner(game)
+
+    def cold_plan():
+        # Cache vidé : chaque appel refait la recherche (pas depuis le vaisseau compris)
+        planner._cache.clear()
+        planner._steps.clear()
+        planner.plan()
+
+    check_throughput("plan_route[cold]", cold_plan)
+
+
+def test_full_frame_draw(check_throughput):
+    pygame.init()
+    try:
+        game = Game(rng=random.Random(0))
+        game.setup_game()
+        surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        check_throughput("game_draw[full_frame]", lambda: game.draw(surface))
+    finally:
+        pygame.quit()
+
+
+@pytest.mark.parametrize("view", ["zoom1", "fit"])
+def test_large_board_draw(check_throughput, view):
+    # Plateau de 400x400 cases, un système toutes les 5 cases (6400 systèmes)
+    size = 400
+    board = GameBoard(size, size, headless=True)
+    for x in range(0, size - 1, 5):
+        for y in range(0, size - 1, 5):
+            board.place_system(SystemePlanetairePlanete(SYSTEM_COLORS[(x + y) % len(SYSTEM_COLORS)]), (x, y))
+    camera = Camera((size, size))
+    if view == "fit":
+        camera.fit()  # Niveau de détail minimal : systèmes en points, sans grille
+    else:
+        camera.center_on((size // 2, size // 2))
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    surface.set_clip(camera.clip_rect)
+    check_throughput(f"board_draw[{size}x{size},{view}]", lambda: board.draw(surface, camera))
@@ -0,0 +1,145 @@
+"""
+Caméra du plateau (ui.camera) : disposition par défaut, sélection à la souris
+à travers le zoom et le défilement, culling des systèmes et niveaux de détail.
+"""
+import random
+
+import pygame
+import pytest
+
+from config import BLACK, BOARD_OFFSET_X, BOARD_OFFSET_Y, CELL_SIZE, SCREEN_HEIGHT, SCREEN_WIDTH
+from core.game_board import GameBoard, SystemePlanetairePlanete
+from core.game_state import Game
+from core.policies import DIRECTIONS
+from ui.camera import Camera
+from ui.renderer import DirtyRectRenderer
+
+BIG_BOARD = 400
+
+
+def _big_board(step=5):
+    """Plateau de BIG_BOARD cases de côté, un système toutes les step cases."""
+    board = GameBoard(BIG_BOARD, BIG_BOARD, headless=True)
+    for x in range(0, BIG_BOARD - 1, step):
+        for y in range(0, BIG_BOARD - 1, step):
+            board.place_system(SystemePlanetairePlanete(BLACK), (x, y))
+    return board
+
+
+def test_default_camera_matches_fixed_layout():
+    camera = Camera((28, 28))
+    assert camera.to_screen(0, 0) == (BOARD_OFFSET_X, BOARD_OFFSET_Y)
+    assert camera.rect((3, 4)) == pygame.Rect(BOARD_OFFSET_X + 3 * CELL_SIZE, BOARD_OFFSET_Y + 4 * CELL_SIZE,
+                                              CELL_SIZE, CELL_SIZE)
+    assert camera.visible_range() == (0, 0, 28, 28)
+    assert camera.screen_to_grid((BOARD_OFFSET_X + 28 * CELL_SIZE, BOARD_OFFSET_Y)) is None
+    assert camera.screen_to_grid((BOARD_OFFSET_X - 1, BOARD_OFFSET_Y)) is None
+
+
+@pytest.mark.parametrize("zoom", [0.05, 0.37, 1.0, 2.5])
+def test_picking_round_trip_through_zoom_and_pan(zoom):
+    camera = Camera((BIG_BOARD, BIG_BOARD))
+    camera.set_zoom(zoom)
+    camera.pan(1234.5, 987.25)
+    rng = random.Random(0)
+    x0, y0, x1, y1 = camera.visible_range()
+    for _ in range(200):
+        cell = (rng.randrange(x0, x1), rng.randrange(y0, y1))
+        rect = camera.rect(cell)
+        if camera.viewport.contains(rect):
+            assert camera.screen_to_grid(rect.topleft) == cell
+            assert camera.screen_to_grid((rect.right - 1, rect.bottom - 1)) == cell
+
+
+def test_zoom_keeps_the_anchor_point_fixed():
+    camera = Camera((BIG_BOARD, BIG_BOARD))
+    camera.center_on((200, 200))
+    anchor = (camera.viewport.x + 100, camera.viewport.y + 300)
+    cell = camera.screen_to_grid(anchor)
+    for steps in (3, -2, 1):
+        assert camera.zoom_by(steps, anchor)
+        assert camera.screen_to_grid(anchor) == cell
+
+
+def test_view_stays_on_the_board():
+    camera = Camera((BIG_BOARD, BIG_BOARD))
+    version = camera.version
+    assert not camera.pan(-50, -50)  # Déjà contre le coin haut gauche
+    assert camera.version == version
+    camera.pan(10 ** 6, 10 ** 6)
+    x0, y0, x1, y1 = camera.visible_range()
+    assert (x1, y1) == (BIG_BOARD, BIG_BOARD)
+    camera.fit()
+    assert camera.visible_range() == (0, 0, BIG_BOARD, BIG_BOARD)
+
+
+def test_right_drag_pans_only_while_dragging():
+    camera = Camera((BIG_BOARD, BIG_BOARD))
+    camera.center_on((200, 200))
+    inside = camera.viewport.center
+    motion = pygame.event.Event(pygame.MOUSEMOTION, pos=inside, rel=(-40, -30), buttons=(0, 0, 1))
+    scroll = (camera.scroll_x, camera.scroll_y)
+    assert camera.handle_event(motion) and (camera.scroll_x, camera.scroll_y) == scroll
+    assert camera.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=3, pos=inside))
+    assert camera.dragging
+    camera.handle_event(motion)
+    assert (camera.scroll_x, camera.scroll_y) == (scroll[0] + 40, scroll[1] + 30)
+    assert camera.handle_event(pygame.event.Event(pygame.MOUSEBUTTONUP, button=3, pos=inside))
+    assert not camera.dragging
+
+
+@pytest.mark.parametrize("zoom,center", [(1.0, (0, 0)), (1.0, (203, 117)), (0.3, (399, 399)), (0.05, (200, 200))])
+def test_systems_in_view_matches_a_full_scan(zoom, center):
+    board = _big_board()
+    camera = Camera((BIG_BOARD, BIG_BOARD))
+    camera.set_zoom(zoom)
+    camera.center_on(center)
+    visible = [system for system in board.systems if camera.clip_rect.colliderect(system.get_rect(camera))]
+    assert sorted(board.systems_in_view(camera), key=id) == sorted(visible, key=id)
+
+
+def test_low_zoom_drops_grid_lines_and_keeps_systems_visible():
+    board = _big_board()
+    camera = Camera((BIG_BOARD, BIG_BOARD))
+    camera.fit()
+    assert not camera.show_grid and not camera.detailed
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    board.draw_grid(surface, camera)
+    assert not any(pygame.image.tobytes(surface, "RGB"))
+    board.draw_systems(surface, camera)
+    for system in random.Random(0).sample(board.systems, 50):
+        assert surface.get_at(camera.to_screen(*system.position))[:3] != BLACK
+    positions = [system.position for system in board.systems]
+    assert camera.rects(positions, (2, 2)) == [camera.rect(position, (2, 2)) for position in positions]
+
+
+def test_observer_click_goes_through_the_camera():
+    game = Game(headless=True, seed=3)
+    game.setup_game()
+    hidden = next(system for system in game.game_board.systems if not system.revealed)
+    game.camera.set_zoom(2.0)
+    game.camera.center_on(hidden.position)
+    game.observer_mode = True
+    game.handle_mouse_click(game.camera.rect(hidden.position).center)
+    assert game.observer_system is hidden and hidden.revealed
+
+
+def test_renderer_matches_full_draw_after_pan_and_zoom():
+    pygame.font.init()
+    game = Game(seed=5)
+    game.setup_game()
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    reference = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    renderer = DirtyRectRenderer(game, screen)
+    rng = random.Random(5)
+    for step in range(60):
+        if step % 15 == 0:
+            game.camera.zoom_by(rng.choice((-3, 2, 4)), game.camera.viewport.center)
+            game.camera.pan(rng.uniform(-200, 200), rng.uniform(-200, 200))
+        game.move_ship(*rng.choice(DIRECTIONS))
+        if step % 7 == 6:
+            game.end_turn()
+        renderer.render()
+        reference.fill(BLACK)
+        game.draw(reference)
+        assert pygame.image.tobytes(screen, "RGB") == pygame.image.tobytes(reference, "RGB")
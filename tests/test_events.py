@@ -0,0 +1,77 @@
+"""
+Flux d'événements (core.events) : émission paresseuse, abonnements, tampon
+circulaire et enregistrements JSON Lines.
+"""
+import io
+import json
+
+from config import RED, YELLOW
+from core.events import (ActionRejected, EventBus, FileSubscriber, Notice, RingBufferSubscriber, ShipMoved,
+                         SystemRevealed, event_record)
+from core.game_entities import Totem
+
+
+def test_emit_does_not_build_events_without_subscribers():
+    bus = EventBus()
+    built = []
+
+    def event_type(*values):
+        built.append(values)
+        return Notice(*values)
+
+    bus.emit(event_type, "ignored")
+    assert built == []
+    received = bus.subscribe(RingBufferSubscriber())
+    bus.emit(event_type, "kept")
+    assert built == [("kept",)] and [event.text for event in received.events] == ["kept"]
+
+
+def test_subscribe_and_unsubscribe():
+    bus = EventBus()
+    first, second = [], []
+    bus.subscribe(first.append)
+    bus.subscribe(second.append)
+    bus.emit(Notice, "both")
+    bus.unsubscribe(first.append)
+    bus.emit(Notice, "second only")
+    assert [event.text for event in first] == ["both"]
+    assert [event.text for event in second] == ["both", "second only"]
+
+
+def test_ring_buffer_keeps_the_latest_events():
+    bus = EventBus()
+    ring = bus.subscribe(RingBufferSubscriber(capacity=3))
+    for index in range(5):
+        bus.emit(Notice, "message {}", index)
+    assert [event.text for event in ring.events] == ["message 2", "message 3", "message 4"]
+
+
+def test_json_lines_records():
+    stream = io.StringIO()
+    bus = EventBus()
+    bus.subscribe(FileSubscriber(stream))
+    bus.emit(SystemRevealed, (4, 7), YELLOW, True, False)
+    bus.emit(ShipMoved, (10, 20, 30), 2, False)  # Triplet d'entiers qui n'est pas une couleur
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert lines == [
+        {"event": "revealed", "position": [4, 7], "couleur": "YELLOW", "est_capitale": True, "temporary": False},
+        {"event": "moved", "position": [10, 20, 30], "points_left": 2, "entered_system": False},
+    ]
+    record = event_record(Notice(Totem("A", RED)))
+    assert record == {"event": "notice", "text": repr(Totem("A", RED))}
+
+
+def test_messages_are_formatted_only_when_built():
+    bus = EventBus()
+
+    class Loud:
+        def __format__(self, spec):
+            raise AssertionError("formaté sans abonné")
+
+    bus.emit(Notice, "value {}", Loud())
+    bus.emit(ActionRejected, "move", "value {}", Loud())
+    ring = bus.subscribe(RingBufferSubscriber())
+    bus.emit(ActionRejected, "recolter", "No totems of faction {} available in rack {}.", "A", YELLOW)
+    assert ring.events[0].reason == f"No totems of faction A available in rack {YELLOW}."
+    assert event_record(ring.events[0]) == {"event": "rejected", "action": "recolter",
+                                            "reason": ring.events[0].reason}
@@ -0,0 +1,72 @@
+"""
+Plateau (core.game_board) : index d'occupation des cases et placement des
+systèmes par seaux (règle de distance minimale).
+"""
+import itertools
+import random
+
+import pytest
+
+from config import MIN_SYSTEM_DISTANCE, NUM_PLANET_SYSTEMS, SYSTEM_COLORS, SYSTEM_SIZE
+from core.game_board import GameBoard, PlacementError, SystemePlanetaireCapitale, SystemePlanetairePlanete
+
+
+def _systems(rng, planets=NUM_PLANET_SYSTEMS):
+    capitals = [SystemePlanetaireCapitale(color) for color in SYSTEM_COLORS]
+    return capitals, [SystemePlanetairePlanete(rng.choice(SYSTEM_COLORS)) for _ in range(planets)]
+
+
+def _scan(board, position):
+    """Recherche linéaire de référence : le système dont le carré couvre la case."""
+    x, y = position
+    for system in board.systems:
+        sx, sy = system.position
+        if sx <= x < sx + SYSTEM_SIZE and sy <= y < sy + SYSTEM_SIZE:
+            return system
+    return None
+
+
+def test_occupancy_index_matches_a_linear_scan():
+    rng = random.Random(0)
+    board = GameBoard(28, 28, headless=True)
+    board.place_initial_systems(*_systems(rng), rng=rng)
+    cells = [(x, y) for x in range(-1, 29) for y in range(-1, 29)]
+    assert all(board.get_system_at(cell) is _scan(board, cell) for cell in cells)
+    occupied = {cell for cell in cells if _scan(board, cell) is not None}
+    assert board.get_all_system_positions() == occupied
+    # Système posé en bord de plateau : ses cases hors plateau ne sont pas indexées
+    edge = SystemePlanetairePlanete(SYSTEM_COLORS[0])
+    board.place_system(edge, (27, 27))
+    assert board.get_system_at((27, 27)) is edge and board.get_system_at((28, 28)) is None
+    version = board.layout_version
+    board.clear_systems()
+    assert board.layout_version > version
+    assert not board.get_all_system_positions()
+    assert all(board.get_system_at(cell) is None for cell in cells)
+
+
+@pytest.mark.parametrize("size, planets", [(28, NUM_PLANET_SYSTEMS), (56, 40), (112, 150)])
+def test_placement_respects_distance_and_margins(size, planets):
+    for seed in range(5):
+        rng = random.Random(seed)
+        board = GameBoard(size, size, headless=True)
+        board.place_initial_systems(*_systems(rng, planets), rng=rng)
+        assert len(board.systems) == len(SYSTEM_COLORS) + planets
+        for system in board.systems:
+            x, y = system.position
+            assert 2 <= x < size - SYSTEM_SIZE and 2 <= y < size - SYSTEM_SIZE
+        for first, second in itertools.combinations(board.systems, 2):
+            (ax, ay), (bx, by) = first.position, second.position
+            assert max(abs(ax - bx), abs(ay - by)) >= MIN_SYSTEM_DISTANCE
+
+
+def test_placement_error_when_the_board_is_too_small():
+    rng = random.Random(0)
+    board = GameBoard(12, 12, headless=True)
+    capitals, planets = _systems(rng)
+    with pytest.raises(PlacementError) as raised:
+        board.place_initial_systems(capitals, planets, rng=rng)
+    error = raised.value
+    assert error.placed_count == len(board.systems) > 0
+    assert error.placed_count + len(error.unplaced) == len(capitals) + len(planets)
+    assert not any(system in board.systems for system in error.unplaced)
@@ -0,0 +1,43 @@
+"""
+Entités (core.game_entities) : totems internés partagés par pickle et copie,
+entités compactes à __slots__.
+"""
+import copy
+import itertools
+import pickle
+
+import pytest
+
+from config import FACTION_NAMES, SYSTEM_COLORS, YELLOW
+from core.game_entities import FactionCard, Totem, Vaisseau
+
+
+def test_totems_are_interned():
+    assert Totem("A", YELLOW) is Totem("A", YELLOW)
+    totems = {Totem(faction, color) for faction, color in itertools.product(FACTION_NAMES, SYSTEM_COLORS)}
+    assert len(totems) == len(FACTION_NAMES) * len(SYSTEM_COLORS)
+    with pytest.raises(ValueError):
+        Totem("?", YELLOW)
+
+
+def test_interning_survives_pickle_and_copy():
+    totem = Totem("A", YELLOW)
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        assert pickle.loads(pickle.dumps(totem, protocol)) is totem
+    assert copy.copy(totem) is totem and copy.deepcopy(totem) is totem
+    # Dans un conteneur, chaque occurrence retrouve l'instance partagée
+    racks = {color: [Totem(faction, color) for faction in FACTION_NAMES] for color in SYSTEM_COLORS}
+    for restored in (pickle.loads(pickle.dumps(racks)), copy.deepcopy(racks)):
+        assert all(a is b for color in SYSTEM_COLORS for a, b in zip(restored[color], racks[color]))
+
+
+def test_entities_have_no_instance_dict():
+    card = FactionCard("B", YELLOW)
+    ship = Vaisseau((3, 4), YELLOW)
+    for entity in (Totem("A", YELLOW), card, ship):
+        assert not hasattr(entity, "__dict__")
+        with pytest.raises(AttributeError):
+            entity.extra = 1
+    restored = pickle.loads(pickle.dumps(card))
+    assert (restored.faction_id, restored.system_color) == ("B", YELLOW)
+    assert repr(restored) == repr(card)
@@ -0,0 +1,72 @@
+"""
+Boucle principale en attente bloquante (main.wait_for_events) : sans échéance
+elle attend un événement sans délai, sinon elle se réveille à la prochaine
+échéance du jeu (révélation Observer, limite de temps du tour).
+"""
+import pygame
+import pytest
+
+import main
+from config import OBSERVER_REVEAL_SECONDS
+from core.game_state import Game
+from core.timers import SimulatedClock
+
+
+@pytest.fixture
+def event_queue(monkeypatch):
+    """Remplace la file d'événements pygame : enregistre les délais d'attente demandés."""
+    queue = {"timeouts": [], "next": None, "pending": []}
+
+    def wait(*timeout):
+        queue["timeouts"].append(timeout[0] if timeout else None)
+        event, queue["next"] = queue["next"], None
+        return event or pygame.event.Event(pygame.NOEVENT)
+
+    def get():
+        pending, queue["pending"] = queue["pending"], []
+        return pending
+    monkeypatch.setattr(main.pygame.event, "wait", wait)
+    monkeypatch.setattr(main.pygame.event, "get", get)
+    return queue
+
+
+def _game(turn_time_limit=None):
+    game = Game(headless=True, seed=0, clock=SimulatedClock(), turn_time_limit=turn_time_limit)
+    game.setup_game()
+    return game
+
+
+def test_waits_without_timeout_when_nothing_is_scheduled(event_queue):
+    game = _game()
+    assert game.time_until_deadline() is None
+    key = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)
+    queued = pygame.event.Event(pygame.KEYUP, key=pygame.K_SPACE)
+    event_queue["next"], event_queue["pending"] = key, [queued]
+    assert main.wait_for_events(game) == [key, queued]
+    assert event_queue["timeouts"] == [None]
+
+
+def test_wakes_up_at_the_observer_deadline(event_queue):
+    game = _game()
+    hidden = game.game_board.systems_in(game.game_board.hidden_mask())[0]
+    assert game.play_observer(hidden.position)
+    assert main.wait_for_events(game) == []  # Délai écoulé sans événement
+    game.timers.clock.advance(OBSERVER_REVEAL_SECONDS - 0.2504)
+    main.wait_for_events(game)
+    # Arrondi au-dessus : le réveil n'a jamais lieu avant l'échéance
+    assert event_queue["timeouts"] == [OBSERVER_REVEAL_SECONDS * 1000, 251]
+
+    game.timers.clock.advance(1.0)  # Échéance dépassée, traitée seulement par update()
+    assert game.time_until_deadline() == 0.0
+    main.wait_for_events(game)
+    assert event_queue["timeouts"][-1] == 1  # pygame.event.wait(0) attendrait sans limite
+    game.update()
+    assert not hidden.revealed and game.time_until_deadline() is None
+
+
+def test_turn_time_limit_is_a_deadline(event_queue):
+    game = _game(turn_time_limit=30)
+    main.wait_for_events(game)
+    game.timers.clock.advance(10)
+    main.wait_for_events(game)
+    assert event_queue["timeouts"] == [30000, 20000]
@@ -0,0 +1,38 @@
+"""
+Pilote Monte Carlo (core.montecarlo) : séries reproductibles quel que soit le
+nombre de workers, flux aléatoires par partie stables.
+"""
+import pytest
+
+from core.montecarlo import MonteCarloStats, run_monte_carlo
+from core.simulation import game_rng, run_batch
+
+
+def test_game_rng_is_stable():
+    draws = [game_rng(42, index).getrandbits(64) for index in range(3)]
+    assert draws == [game_rng(42, index).getrandbits(64) for index in range(3)]
+    assert len(set(draws)) == 3
+    assert game_rng(43, 0).getrandbits(64) != draws[0]
+
+
+def test_parallel_run_matches_sequential_run():
+    sequential = run_monte_carlo(12, "greedy", seed=5, workers=1, chunk_size=4).summary()
+    parallel = run_monte_carlo(12, "greedy", seed=5, workers=2, chunk_size=4).summary()
+    assert parallel == sequential
+    assert sequential["overall"]["games"] == 12
+    # Même série que la boucle séquentielle de simulate.py (run_batch)
+    batch = MonteCarloStats()
+    for result in run_batch(12, "greedy", seed=5):
+        batch.add(result["origin"], result["won"], result["turns"], result["score"])
+    assert batch.summary() == sequential
+
+
+@pytest.mark.parametrize("options", [{"chunk_size": 0}, {"workers": 0}, {"workers": -2}])
+def test_invalid_pool_options_are_rejected(options):
+    with pytest.raises(ValueError):
+        run_monte_carlo(4, "greedy", seed=1, **options)
+
+
+def test_negative_batch_size_is_rejected():
+    with pytest.raises(ValueError):
+        run_batch(-1)
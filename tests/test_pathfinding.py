@@ -0,0 +1,97 @@
+"""
+Recherche de chemins (core.pathfinding) : champs de distance comparés à un BFS
+de référence et cache du PathFinder invalidé par GameBoard.layout_version.
+"""
+import collections
+import random
+
+from config import NUM_PLANET_SYSTEMS, SYSTEM_COLORS
+from core.game_board import GameBoard, SystemePlanetaireCapitale, SystemePlanetairePlanete
+from core.pathfinding import PathFinder
+
+
+def _board(seed, size=28):
+    rng = random.Random(seed)
+    board = GameBoard(size, size, headless=True)
+    capitals = [SystemePlanetaireCapitale(color) for color in SYSTEM_COLORS]
+    planets = [SystemePlanetairePlanete(rng.choice(SYSTEM_COLORS)) for _ in range(NUM_PLANET_SYSTEMS)]
+    board.place_initial_systems(capitals, planets, rng=rng)
+    return board
+
+
+def _bfs(board, start):
+    """BFS de référence en 8-connexité, sans pas interne au système de départ."""
+    start_system = board.get_system_at(start)
+    distances = {start: 0}
+    queue = collections.deque([start])
+    while queue:
+        x, y = queue.popleft()
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                cell = (x + dx, y + dy)
+                if cell in distances or not board.is_position_valid(cell):
+                    continue
+                if start_system is not None and board.get_system_at(cell) is start_system:
+                    continue
+                distances[cell] = distances[(x, y)] + 1
+                queue.append(cell)
+    return distances
+
+
+def _check_against_bfs(board, finder, rng, starts=8):
+    cells = [(x, y) for x in range(board.size_x) for y in range(board.size_y)]
+    for start in rng.sample(cells, starts):
+        expected = _bfs(board, start)
+        for end in rng.sample(cells, 40):
+            path = finder.find_path(start, end, max_dist=board.size_x * board.size_y)
+            if end not in expected:
+                assert path is None
+                continue
+            assert path[0] == start and path[-1] == end
+            assert len(path) - 1 == expected[end]
+            assert all(max(abs(a[0] - b[0]), abs(a[1] - b[1])) == 1 for a, b in zip(path, path[1:]))
+            # Limite de distance : refus au-delà, même chemin en deçà
+            if expected[end] > 0:
+                assert finder.find_path(start, end, expected[end] - 1) is None
+            assert finder.find_path(start, end, expected[end]) == path
+
+
+def test_paths_match_a_reference_bfs():
+    rng = random.Random(0)
+    for seed in range(4):
+        board = _board(seed)
+        _check_against_bfs(board, PathFinder(board), rng)
+
+
+def test_layout_change_invalidates_cached_fields():
+    rng = random.Random(1)
+    board = _board(seed=5)
+    finder = PathFinder(board)
+    start = next((x, y) for x in range(board.size_x) for y in range(board.size_y)
+                 if board.get_system_at((x, y)) is None)
+    field = finder.field(start)
+    assert finder.field(start) is field  # En cache tant que la disposition est la même
+
+    version = board.layout_version
+    capitals = [system for system in board.systems if system.est_capitale]
+    planets = [system for system in board.systems if not system.est_capitale]
+    board.place_initial_systems(capitals, planets, rng=random.Random(42))
+    assert board.layout_version != version
+    assert finder.field(start) is not field
+    _check_against_bfs(board, finder, rng)
+
+    # Plateau vidé : toutes les cases sont à distance de Tchebychev du départ
+    board.clear_systems()
+    empty = finder.field(start)
+    assert all(empty.distance_to((x, y)) == max(abs(x - start[0]), abs(y - start[1]))
+               for x in range(board.size_x) for y in range(board.size_y))
+
+
+def test_cache_keeps_the_most_recent_fields():
+    board = _board(seed=2)
+    finder = PathFinder(board, max_fields=2)
+    a, b = finder.field((0, 0)), finder.field((1, 0))
+    assert finder.field((0, 0)) is a  # (0, 0) redevient le plus récent
+    c = finder.field((2, 0))  # Évince (1, 0)
+    assert finder.field((0, 0)) is a and finder.field((2, 0)) is c
+    assert finder.field((1, 0)) is not b
@@ -0,0 +1,151 @@
+"""
+Planificateur d'itinéraires (core.planner) : matrice des tours entre systèmes,
+conditions de victoire en masques de paires, route optimale comparée à une
+recherche exhaustive, cache des routes et politique "planner".
+"""
+import itertools
+import math
+import random
+
+from config import FACTION_NAMES, MOVEMENT_POINTS_PER_TURN, STATE_GAME_OVER, SYSTEM_COLORS, SYSTEM_SIZE
+from core.batch_engine import summarize_game
+from core.game_entities import Totem
+from core.game_state import Game, Player
+from core.pathfinding import SystemBitboard, SystemStepField
+from core.planner import RoutePlanner, harvest_preview, is_winning, pair_bit, visits_needed
+from core.policies import DIRECTIONS, POLICIES
+
+
+def _game(seed=0):
+    game = Game(headless=True, seed=seed)
+    game.setup_game()
+    return game
+
+
+def _cells(board, system):
+    sx, sy = system.position
+    return [(x, y) for x in range(sx, min(sx + SYSTEM_SIZE, board.size_x))
+            for y in range(sy, min(sy + SYSTEM_SIZE, board.size_y))]
+
+
+def _turns(steps):
+    return math.inf if steps is None else -(-steps // MOVEMENT_POINTS_PER_TURN)
+
+
+def test_bitboard_steps_match_the_step_field():
+    rng = random.Random(3)
+    for seed in range(10):
+        board = _game(seed).game_board
+        bitboard = SystemBitboard(board)
+        for _ in range(20):
+            cell = (rng.randrange(board.size_x), rng.randrange(board.size_y))
+            assert bitboard.steps_from([cell], board.get_system_at(cell)) == SystemStepField(board, [cell]).steps
+        for system in board.systems:
+            cells = _cells(board, system)
+            assert bitboard.steps_from(cells, system) == SystemStepField(board, cells).steps
+
+
+def test_travel_turns_is_the_closure_of_direct_legs():
+    board = _game(seed=2).game_board
+    travel = board.travel_turns()
+    assert board.travel_turns() is travel  # En cache jusqu'au prochain placement
+    direct = [[_turns(steps) for steps in SystemStepField(board, _cells(board, system)).steps]
+              for system in board.systems]
+    count = len(board.systems)
+    for i, j in itertools.product(range(count), repeat=2):
+        if i == j:
+            assert travel[i][j] == 0
+            continue
+        assert travel[i][j] <= direct[i][j]
+        # Plus court chemin en escales : une suite de trajets directs l'atteint
+        assert any(travel[i][k] + direct[k][j] == travel[i][j] for k in range(count) if k != j)
+        assert all(travel[i][j] <= travel[i][k] + travel[k][j] for k in range(count))
+    capitals = [system for system in board.systems if system.est_capitale]
+    planets = [system for system in board.systems if not system.est_capitale]
+    board.place_initial_systems(capitals, planets, rng=random.Random(9))
+    assert board.travel_turns() is not travel
+
+
+def test_pair_masks_agree_with_victory_conditions():
+    rng = random.Random(0)
+    all_pairs = [pair_bit(Totem(faction, color)) for faction in FACTION_NAMES for color in SYSTEM_COLORS]
+    for _ in range(500):
+        player = Player(0, SYSTEM_COLORS[0])
+        for _ in range(rng.randrange(1, 8)):
+            player.add_totem(Totem(rng.choice(FACTION_NAMES), rng.choice(SYSTEM_COLORS)))
+        pairs = 0
+        for totem in player.totems:
+            pairs |= pair_bit(totem)
+        assert is_winning(pairs) == player.check_victory_conditions()
+        # Minorant : moins de visits_needed paires ajoutées ne gagnent jamais
+        needed = visits_needed(pairs)
+        if needed > 1:
+            for added in itertools.combinations(rng.sample(all_pairs, 10), needed - 1):
+                assert not is_winning(pairs | sum(added))
+
+
+def test_route_is_optimal_under_the_cost_model():
+    for seed in range(6):
+        game = _game(seed)
+        board = game.game_board
+        player = game.get_player()
+        for system in board.systems:
+            system.revealed = True
+        first = harvest_preview(game.system_racks[board.systems[0].couleur], board.systems[0].est_capitale)
+        player.add_totem(first)
+        # Tour déjà joué : récoltes à partir du tour suivant, sans mouvement restant
+        player.movement_used = player.action_recolter_used = True
+        route = RoutePlanner(game, work_budget=10 ** 9, max_systems=len(board.systems)).plan(player)
+
+        travel = board.travel_turns()
+        origin = board.capitals[player.origin_system_color]
+        ship_steps = SystemStepField(board, [player.vaisseau.position]).steps
+        arrival = [_turns(steps) for steps in ship_steps]
+        arrival[board.get_system_at(player.vaisseau.position).index] = 0
+        arrival = [min(arrival[k] + travel[k][j] for k in range(len(arrival))) for j in range(len(arrival))]
+        gains = {}
+        for system in board.systems:
+            totem = harvest_preview(game.system_racks[system.couleur], system.est_capitale)
+            if totem is not None and totem not in player.totems:
+                gains[system] = pair_bit(totem)
+        owned = pair_bit(first)
+
+        def best_from(last, turn, pairs):
+            """Toutes les suites de visites apportant chacune une paire nouvelle, arrêtées à la victoire."""
+            if is_winning(pairs):
+                return turn + travel[last.index][origin.index] + 1
+            return min((best_from(system, turn + travel[last.index][system.index], pairs | gain)
+                        for system, gain in gains.items() if not pairs & gain), default=math.inf)
+
+        best = min(best_from(system, max(arrival[system.index], 1), owned | gain) for system, gain in gains.items())
+        assert route.complete and route.turns == best
+        pairs = owned
+        for system in route.visits:
+            pairs |= gains[system]
+        assert is_winning(pairs) and route.destination is origin
+
+
+def test_routes_are_cached_until_the_situation_changes():
+    game = _game(seed=1)
+    for system in game.game_board.systems:
+        system.revealed = True
+    route = game.planner.plan()
+    assert route is not None and route.next_system is route.visits[0]
+    assert game.planner.plan() is route
+    assert any(game.move_ship(dx, dy) for dx, dy in DIRECTIONS)
+    assert game.planner.plan() is not route
+
+
+def test_planner_policy_wins_and_is_reproducible():
+    summaries = []
+    for _ in range(2):
+        game = _game(seed=4)
+        policy = POLICIES["planner"](random.Random(4))
+        for _ in range(200):
+            if game.game_state == STATE_GAME_OVER:
+                break
+            policy.play_turn(game)
+            game.end_turn()
+        assert game.game_state == STATE_GAME_OVER and game.winner is not None
+        summaries.append(summarize_game(game))
+    assert summaries[0] == summaries[1]
@@ -0,0 +1,45 @@
+"""
+Profileur par image (core.profiler) : sans coût lorsqu'il est désactivé,
+instrumentation posée et retirée à la demande, export Chrome trace.
+"""
+from core.game_state import Game
+from core.profiler import NULL_SECTION, FrameProfiler
+
+
+def _game():
+    game = Game(headless=True, seed=0)
+    game.setup_game()
+    return game
+
+
+def test_disabled_profiler_leaves_rules_untouched():
+    game = _game()
+    profiler = FrameProfiler(enabled=False)
+    profiler.instrument_game(game)
+    assert "find_path" not in vars(game) and "get_system_at" not in vars(game.game_board)
+    assert profiler.section("events") is NULL_SECTION
+    game.game_board.get_system_at((0, 0))
+    assert not profiler.samples
+
+
+def test_enabling_wraps_and_disabling_restores():
+    game = _game()
+    profiler = FrameProfiler(enabled=False)
+    profiler.instrument_game(game)
+    profiler.set_enabled(True)
+    board = game.game_board
+    system = board.systems[0]
+    assert board.get_system_at(system.position) is system
+    profiler.begin_frame()
+    with profiler.section("update"):
+        game.check_game_over()
+    profiler.end_frame()
+    assert {"get_system_at", "check_game_over", "update", "frame"} <= set(profiler.samples)
+    profiler.set_enabled(False)
+    assert "get_system_at" not in vars(board) and "check_game_over" not in vars(game)
+    count = len(profiler.samples["get_system_at"])
+    board.get_system_at(system.position)
+    assert len(profiler.samples["get_system_at"]) == count
+    trace = profiler.chrome_trace()["traceEvents"]
+    assert {event["name"] for event in trace} >= {"get_system_at", "frame"}
+    assert all(event["ph"] == "X" and event["dur"] >= 0 for event in trace)
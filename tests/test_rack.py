@@ -0,0 +1,81 @@
+"""
+Racks indexés (core.rack) : files de totems par faction, anneau des cartes,
+résumé d'affichage en cache et annulation par le journal de la partie.
+"""
+import random
+
+from config import FACTION_NAMES, RED, STATE_GAME_OVER, SYSTEM_COLORS, YELLOW
+from core.batch_engine import summarize_game
+from core.game_entities import FactionCard, Totem
+from core.game_state import Game
+from core.policies import POLICIES
+from core.rack import Rack
+from core.snapshot import load_game, save_game
+from core.undo import UndoJournal
+
+
+def _rack(journal=None):
+    totems = [Totem("A", YELLOW), Totem("B", YELLOW), Totem("A", RED), Totem("A", YELLOW)]
+    cards = [FactionCard("A", YELLOW), FactionCard("B", YELLOW), FactionCard("A", YELLOW)]
+    return Rack(YELLOW, totems, cards, journal=journal)
+
+
+def test_take_put_and_cycle():
+    rack = _rack()
+    assert len(rack) == 4 and rack.count("A") == 3 and rack.count("C") == 0
+    assert rack.top_faction == "A"
+    # File par faction : le plus ancien totem de la faction est récolté en premier
+    assert rack.take("A") is Totem("A", YELLOW)
+    assert rack.take("A") is Totem("A", RED)
+    assert rack.take("C") is None
+    rack.put(Totem("A", RED))
+    assert rack.totems == [Totem("A", YELLOW), Totem("A", RED), Totem("B", YELLOW)]
+    assert [rack.cycle() for _ in range(3)] == ["B", "A", "A"]
+    assert len(rack) == 3
+
+
+def test_summary_is_cached_until_the_rack_changes():
+    rack = _rack()
+    summary = rack.summary()
+    assert summary == (("A", YELLOW, 1), ("A", RED, 1), ("A", YELLOW, 1), ("B", YELLOW, 1))
+    assert rack.summary() is summary
+    rack.cycle()
+    assert rack.summary() is not summary
+    rack.take("A")
+    assert rack.summary() == (("A", RED, 1), ("A", YELLOW, 1), ("B", YELLOW, 1))
+
+
+def test_undo_restores_racks():
+    journal = UndoJournal()
+    rack = _rack(journal)
+    before = (rack.totems, list(rack.faction_cards), len(rack))
+    journal.fork()
+    rack.take("A")
+    rack.put(Totem("C", RED))
+    rack.cycle()
+    rack.take("B")
+    journal.undo()
+    assert (rack.totems, list(rack.faction_cards), len(rack)) == before
+    assert rack.summary() == _rack().summary()
+
+
+def test_game_fork_undo_and_snapshot_keep_racks_consistent():
+    game = Game(headless=True, seed=11)
+    game.setup_game()
+    policy = POLICIES["greedy"](random.Random(11))
+    initial = summarize_game(game)
+    game.fork()
+    for _ in range(30):
+        if game.game_state == STATE_GAME_OVER:
+            break
+        policy.play_turn(game)
+    played = summarize_game(game)
+    assert played["racks"] != initial["racks"]
+    loaded = load_game(save_game(game))
+    assert summarize_game(loaded) == played
+    for color in SYSTEM_COLORS:
+        rack, copy = game.system_racks[color], loaded.system_racks[color]
+        assert [rack.count(f) for f in FACTION_NAMES] == [copy.count(f) for f in FACTION_NAMES]
+        assert rack.summary() == copy.summary()
+    game.undo()
+    assert summarize_game(game) == initial
@@ -0,0 +1,72 @@
+"""
+Rendu par rectangles sales (ui.renderer) : recopier seulement les rectangles
+renvoyés sur l'image précédente donne l'image d'un dessin complet, et une
+image sans changement ne redessine que le panneau d'information.
+"""
+import random
+
+import pygame
+
+from config import BLACK, SCREEN_HEIGHT, SCREEN_WIDTH
+from core.game_state import Game
+from core.policies import DIRECTIONS
+from core.timers import SimulatedClock
+from ui.renderer import DirtyRectRenderer
+
+
+def _setup(seed=0):
+    pygame.font.init()
+    game = Game(seed=seed, clock=SimulatedClock())
+    game.setup_game()
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    return game, screen, DirtyRectRenderer(game, screen)
+
+
+def _present(display, screen, dirty):
+    """Équivalent de pygame.display.update(dirty) : seuls ces rectangles sont recopiés."""
+    for rect in dirty:
+        display.blit(screen, rect, rect)
+
+
+def test_dirty_rects_cover_every_changed_pixel():
+    for seed in range(3):
+        game, screen, renderer = _setup(seed)
+        display = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        reference = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        rng = random.Random(seed)
+        for step in range(80):
+            choice = rng.randrange(6)
+            if choice < 3:
+                game.move_ship(*rng.choice(DIRECTIONS))
+            elif choice == 3:
+                hidden = game.game_board.systems_in(game.game_board.hidden_mask())
+                if hidden:
+                    game.play_observer(rng.choice(hidden).position)  # Révélation temporaire
+            elif choice == 4:
+                game.timers.advance(rng.choice((1.0, 5.0)))  # Fin éventuelle de la révélation
+            else:
+                game.play_recolter()
+                game.end_turn()
+            _present(display, screen, renderer.render())
+            reference.fill(BLACK)
+            game.draw(reference)
+            assert pygame.image.tobytes(display, "RGB") == pygame.image.tobytes(reference, "RGB")
+
+
+def test_idle_frame_only_redraws_the_panel():
+    game, screen, renderer = _setup()
+    assert renderer.render() == [screen.get_rect()]  # Première image : redessin complet
+    assert renderer.render() == [renderer.panel_rect]
+
+    ship = game.get_player().vaisseau
+    before = ship.position
+    assert any(game.move_ship(dx, dy) for dx, dy in DIRECTIONS)
+    camera = game.camera
+    dirty = renderer.render()
+    # Case quittée, case atteinte, panneau
+    assert dirty == [ship.get_rect(camera, before).clip(camera.clip_rect),
+                     ship.get_rect(camera).clip(camera.clip_rect), renderer.panel_rect]
+
+    renderer.invalidate()
+    assert renderer.render() == [screen.get_rect()]
+    assert renderer.render() == [renderer.panel_rect]
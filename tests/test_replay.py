@@ -0,0 +1,72 @@
+"""
+Journal d'actions et rejeu (core.replay) : une partie graine + journal se rejoue
+à l'identique, et seek() retrouve l'état exact du début de chaque tour.
+"""
+import random
+
+import pytest
+
+from config import STATE_GAME_OVER
+from core.batch_engine import summarize_game
+from core.game_state import Game
+from core.policies import POLICIES
+from core.replay import ActionLog, Replayer
+
+
+def _play_logged_game(seed, policy_name="random"):
+    """Joue une partie journalisée ; renvoie (partie, journal, {tour: résumé au début du tour})."""
+    game = Game(headless=True, seed=seed)
+    log = ActionLog.attach(game)
+    game.setup_game()
+    policy = POLICIES[policy_name](random.Random(seed))
+    turn_starts = {}
+    while game.game_state != STATE_GAME_OVER:
+        turn_starts[game.turn_count] = summarize_game(game)
+        # Observer de temps en temps, puis fin de la révélation en cours de tour
+        hidden = [s for s in game.game_board.systems if not s.revealed]
+        if hidden and game.turn_count % 3 == 0:
+            game.observe_system(hidden[0].position)
+        policy.play_turn(game)
+        game.expire_observer()
+        game.end_turn()
+    return game, log, turn_starts
+
+
+@pytest.mark.parametrize("seed,policy_name", [(1, "random"), (2, "random"), (3, "greedy"), (4, "greedy")])
+def test_replay_reproduces_game(seed, policy_name):
+    game, log, _ = _play_logged_game(seed, policy_name)
+    replayed = Replayer(log).run()
+    assert summarize_game(replayed) == summarize_game(game)
+
+
+def test_seek_any_turn(tmp_path):
+    game, log, turn_starts = _play_logged_game(5)
+    log = ActionLog.load(log.save(tmp_path / "game.jsonl"))
+    replayer = Replayer(log, checkpoint_interval=4)
+    replayer.run()
+    turns = list(turn_starts)
+    random.Random(0).shuffle(turns)
+    for turn in turns:
+        assert summarize_game(replayer.seek(turn)) == turn_starts[turn]
+
+
+def test_undo_discards_logged_actions():
+    game = Game(headless=True, seed=7)
+    log = ActionLog.attach(game)
+    game.setup_game()
+    game.end_turn()
+    before = list(log.entries)
+    game.fork()
+    game.move_ship(1, 0) or game.move_ship(-1, 0)
+    game.end_turn()
+    assert len(log) > len(before)
+    game.undo()
+    assert log.entries == before
+
+
+def test_seek_current_turn_rewinds_to_turn_start():
+    game, log, turn_starts = _play_logged_game(6)
+    replayer = Replayer(log)
+    replayer.seek(4)
+    replayer.step()
+    assert summarize_game(replayer.seek(4)) == turn_starts[4]
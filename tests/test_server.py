@@ -0,0 +1,184 @@
+"""
+Serveur de parties asyncio (core.server) : protocole, tours en multijoueur,
+isolation des parties, arrêt propre, synchronisation par deltas et générateur
+de charge (core.loadgen).
+"""
+import asyncio
+
+import pytest
+
+import core.game_state
+from config import STATE_GAME_OVER
+from core.loadgen import GameClient, ServerError, run_load
+from core.server import GameServer
+from core.snapshot import save_game
+
+
+def _run(scenario):
+    """Lance un serveur sur un port éphémère, exécute scenario(server, connect) puis l'arrête."""
+    async def main():
+        server = await GameServer(log=lambda message: None).start(port=0)
+        host, port = server.address[:2]
+        try:
+            return await scenario(server, lambda: GameClient.connect(host, port))
+        finally:
+            await server.shutdown(timeout=1.0)
+    return asyncio.run(main())
+
+
+def test_solo_game_protocol():
+    async def scenario(server, connect):
+        client = await connect()
+        created = await client.request("create", seed=7)
+        assert (created["seat"], created["seed"], created["turn"], created["started"]) == (0, 7, 1, True)
+        reply = await client.act("end_turn")
+        assert reply["accepted"] and reply["turn"] == 2
+        assert [event["event"] for event in reply["events"]] == ["turn_ended", "turn_started"]
+        for bad in (["fly"], ["move", 1], ["move", "1", 0], ["deposer", "Z", 0], "end_turn"):
+            with pytest.raises(ServerError):
+                await client.request("act", action=bad)
+        state = await client.request("state")
+        assert state["players"][0]["score"] == server.games[created["game"]].game.players[0].score
+        await client.close()
+        await asyncio.sleep(0.05)
+        return server.snapshot_stats()
+
+    stats = _run(scenario)
+    assert stats["games_created"] == 1 and stats["games_active"] == 0
+
+
+def test_multi_cell_moves_are_refused():
+    async def scenario(server, connect):
+        client = await connect()
+        game_id = (await client.request("create", seed=7))["game"]
+        ship = server.games[game_id].game.get_player().vaisseau
+        start, points = ship.position, ship.movement_points_remaining
+        for bad in (["move", 9, 0], ["move", 0, 0], ["move", -2, 1]):
+            with pytest.raises(ServerError, match="Invalid step"):
+                await client.request("act", action=bad)
+        # Même garde dans le moteur, pour les rejeux et les politiques
+        assert not server.games[game_id].game.move_ship(9, 0)
+        assert (ship.position, ship.movement_points_remaining) == (start, points)
+        await client.close()
+
+    _run(scenario)
+
+
+def test_multiplayer_turns_and_disconnect():
+    async def scenario(server, connect):
+        first, second, third = await connect(), await connect(), await connect()
+        game_id = (await first.request("create", players=3, seed=3))["game"]
+        await second.request("join", game=game_id)
+        with pytest.raises(ServerError, match="Waiting for players"):
+            await first.act("end_turn")
+        await third.request("join", game=game_id)
+        with pytest.raises(ServerError, match="full"):
+            await (await connect()).request("join", game=game_id)
+        with pytest.raises(ServerError, match="Not your turn"):
+            await second.act("end_turn")
+        reply = await first.act("end_turn")
+        assert reply["current"] == 1
+        await asyncio.sleep(0.05)
+        assert second.status["current"] == 1 and second.pushes[-1]["push"] == "events"
+        # Un joueur qui se déconnecte abandonne ; le dernier en jeu l'emporte
+        await second.close()
+        await first.act("abandon")
+        await asyncio.sleep(0.05)
+        return third.status
+
+    status = _run(scenario)
+    assert status["state"] == STATE_GAME_OVER and status["winner"] == 2
+
+
+def test_observer_expires_on_server_clock(monkeypatch):
+    monkeypatch.setattr(core.game_state, "OBSERVER_REVEAL_SECONDS", 0.05)
+
+    async def scenario(server, connect):
+        client = await connect()
+        created = await client.request("create", seed=11)
+        game = server.games[created["game"]].game
+        hidden = next(system for system in game.game_board.systems if not system.revealed)
+        reply = await client.act("observer", *hidden.position)
+        assert reply["accepted"]
+        assert not (await client.act("observer", *hidden.position))["accepted"]
+        await asyncio.sleep(0.2)
+        return hidden, [event["event"] for push in client.pushes for event in push.get("events", ())]
+
+    hidden, pushed = _run(scenario)
+    assert pushed == ["hidden"] and not hidden.revealed
+
+
+def test_crashing_game_is_isolated():
+    async def scenario(server, connect):
+        broken, healthy = await connect(), await connect()
+        broken_game = (await broken.request("create", seed=1))["game"]
+        await healthy.request("create", seed=2)
+
+        def crash(dx, dy):
+            raise RuntimeError("boom")
+        server.games[broken_game].game.move_ship = crash
+        with pytest.raises(ServerError, match="crashed"):
+            await broken.act("move", 1, 0)
+        assert broken.pushes[-1]["push"] == "game_closed"
+        assert (await healthy.act("end_turn"))["accepted"]
+        return server.snapshot_stats()
+
+    stats = _run(scenario)
+    assert stats["games_active"] == 1
+
+
+def test_shutdown_notifies_clients():
+    async def main():
+        server = await GameServer(log=lambda message: None).start(port=0)
+        host, port = server.address[:2]
+        client = await GameClient.connect(host, port)
+        await client.request("create", seed=5)
+        answered = await asyncio.gather(*(client.act("end_turn") for _ in range(3)))
+        await server.shutdown(timeout=1.0)
+        await client._read_task
+        with pytest.raises(ConnectionError):
+            await client.act("end_turn")
+        return answered, client
+
+    answered, client = asyncio.run(main())
+    assert [reply["turn"] for reply in answered] == [2, 3, 4]
+    assert client.pushes[-1]["push"] == "shutdown" and not client.connected
+
+
+@pytest.mark.parametrize("players", [1, 2])
+def test_load_generator_completes_games(players):
+    async def scenario(server, connect):
+        host, port = server.address[:2]
+        report = await run_load(6, players, concurrency=4, seed=9, host=host, port=port)
+        await asyncio.sleep(0.05)
+        return report, server.snapshot_stats()
+
+    report, stats = _run(scenario)
+    summary = report.summary()
+    assert summary["games"] == summary["games_finished"] == 6
+    assert summary["errors"] == 0 and summary["actions"] > 0
+    assert 1 <= summary["peak_games"] <= 4
+    assert stats["games_created"] == 6 and stats["games_active"] == 0
+
+
+def test_delta_clients_and_spectators_mirror_game():
+    async def scenario(server, connect):
+        player = await connect()
+        created = await player.request("create", seed=21, sync="deltas")
+        game = server.games[created["game"]].game
+        assert created["keyframe"] and player.replica is not None
+        for turn in range(12):
+            await player.act("move", 1, 1)
+            await player.act("recolter")
+            await player.act("end_turn")
+            if turn == 7:
+                spectator = await connect()
+                await spectator.request("spectate", game=created["game"])
+                with pytest.raises(ServerError, match="Spectators"):
+                    await spectator.act("end_turn")
+        await asyncio.sleep(0.05)
+        return [save_game(client.replica.game) for client in (player, spectator)], save_game(game), player.status
+
+    replicas, expected, status = _run(scenario)
+    assert replicas == [expected, expected]
+    assert status["turn"] == 13
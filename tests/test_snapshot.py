@@ -0,0 +1,74 @@
+"""
+Aller-retour des instantanés binaires (core.snapshot) : l'état rechargé est
+identique et la suite de la partie se déroule de la même façon.
+"""
+import copy
+import random
+
+import pytest
+
+from config import STATE_GAME_OVER
+from core.batch_engine import summarize_game
+from core.game_state import Game
+from core.policies import RandomPolicy
+from core.snapshot import SnapshotError, load_game, save_game
+
+
+def _game_after(turns, seed):
+    game = Game(headless=True, rng=random.Random(seed))
+    game.setup_game()
+    policy = RandomPolicy(random.Random(seed))
+    for _ in range(turns):
+        if game.game_state == STATE_GAME_OVER:
+            break
+        policy.play_turn(game)
+        game.end_turn()
+    return game, policy
+
+
+def _finish(game, policy):
+    while game.game_state != STATE_GAME_OVER:
+        policy.play_turn(game)
+        game.end_turn()
+    return summarize_game(game)
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_round_trip(seed):
+    game, policy = _game_after(turns=seed * 3, seed=seed)
+    data = save_game(game)
+    loaded = load_game(data)
+
+    assert len(data) < 512
+    assert save_game(loaded) == data
+    assert summarize_game(loaded) == summarize_game(game)
+    assert loaded.player_origin_system_pos == game.player_origin_system_pos
+    assert [s.position for s in loaded.game_board.systems] == [s.position for s in game.game_board.systems]
+    # La suite de la partie ne dépend que de l'état sauvegardé
+    assert _finish(loaded, copy.deepcopy(policy)) == _finish(game, policy)
+
+
+def test_rejects_invalid_data():
+    game, _ = _game_after(turns=2, seed=0)
+    data = save_game(game)
+    with pytest.raises(SnapshotError):
+        load_game(b"XXXX" + data[4:])
+    with pytest.raises(SnapshotError):
+        load_game(data[:4] + bytes([99]) + data[5:])
+    with pytest.raises(SnapshotError):
+        load_game(data[:-1])
+    with pytest.raises(SnapshotError):
+        load_game(data + b"\0")
+
+
+def test_corrupt_bytes_raise_snapshot_error():
+    game, _ = _game_after(turns=3, seed=1)
+    data = save_game(game)
+    # Chaque octet remplacé tour à tour : chargement valide ou SnapshotError, jamais IndexError
+    for index in range(len(data)):
+        for value in (0x00, 0x07, 0xFE):
+            corrupted = data[:index] + bytes([value]) + data[index + 1:]
+            try:
+                load_game(corrupted)
+            except SnapshotError:
+                pass
@@ -0,0 +1,100 @@
+"""
+Synchronisation par deltas (core.sync) : une réplique construite à partir d'une
+image clé et des paquets de deltas reste identique à la partie d'origine.
+"""
+import random
+
+import pytest
+
+from config import STATE_GAME_OVER
+from core.game_state import Game
+from core.policies import POLICIES
+from core.snapshot import save_game
+from core.sync import DELTAS, DeltaApplier, DeltaEncoder, SyncError
+
+
+def _same_state(replica, game):
+    """Compare les instantanés ; l'horloge de la révélation Observer est propre à chaque machine."""
+    clocks = replica.observer_start_time, game.observer_start_time
+    replica.observer_start_time = game.observer_start_time = None
+    try:
+        return save_game(replica) == save_game(game)
+    finally:
+        replica.observer_start_time, game.observer_start_time = clocks
+
+
+def _play(seed, num_players, on_packet, keyframe_turns=3):
+    """Joue une partie de bots avec Observer, abandons et undo ; passe chaque paquet à on_packet(encoder, packet)."""
+    game = Game(num_players=num_players, headless=True, seed=seed)
+    game.setup_game()
+    encoder = DeltaEncoder(game, keyframe_turns)
+    rng = random.Random(seed)
+    policies = [POLICIES["greedy"](random.Random(rng.getrandbits(64))) for _ in range(num_players)]
+
+    def flush():
+        packet = encoder.flush()
+        if packet is not None:
+            on_packet(encoder, packet)
+
+    while game.game_state != STATE_GAME_OVER:
+        hidden = [system for system in game.game_board.systems if not system.revealed]
+        if hidden and rng.random() < 0.3:
+            game.play_observer(hidden[0].position)
+            flush()
+            game.expire_observer()
+            flush()
+        policies[game.scheduler.current].play_turn(game)
+        if num_players > 2 and rng.random() < 0.02:
+            game.abandon()
+        flush()
+        # Une action annulée avant flush() ne laisse aucun delta
+        game.fork()
+        game.end_turn()
+        game.undo()
+        game.end_turn()
+        flush()
+    return game, encoder
+
+
+@pytest.mark.parametrize("seed,num_players", [(1, 1), (2, 1), (3, 2), (4, 4)])
+def test_replica_tracks_game(seed, num_players):
+    replicas = {}
+    sizes = []
+
+    def on_packet(encoder, packet):
+        sizes.append(len(packet))
+        replica = replicas.get("live")
+        if replica is None:
+            assert encoder.keyframe[0] == 0
+            replica = replicas["live"] = DeltaApplier(encoder.keyframe)
+        replica.apply(packet)
+        assert _same_state(replica.game, encoder.game)
+        if "late" in replicas:
+            replicas["late"].apply(packet)
+        elif encoder.game.turn_count == 8:
+            # Client arrivé en cours de partie : image clé récente + paquets suivants
+            replicas["late"] = DeltaApplier(*encoder.catch_up())
+
+    game, _ = _play(seed, num_players, on_packet)
+    assert _same_state(replicas["late"].game, game)
+    # Un paquet ne dépend pas de la taille du plateau : quelques deltas de taille fixe
+    assert max(sizes) <= 4 + 8 * max(delta.size for delta in DELTAS.values())
+
+
+def test_keyframes_bound_catch_up():
+    backlogs = []
+    _, encoder = _play(5, 2, lambda encoder, packet: backlogs.append(len(encoder.backlog)), keyframe_turns=2)
+    assert encoder.keyframe[0] > 0
+    assert max(backlogs) < 60
+
+
+def test_missing_and_duplicate_packets():
+    packets = []
+    game, encoder = _play(6, 1, lambda encoder, packet: packets.append(packet), keyframe_turns=1000)
+    replica = DeltaApplier(encoder.keyframe)
+    assert replica.apply(packets[0])
+    assert not replica.apply(packets[0])
+    with pytest.raises(SyncError):
+        replica.apply(packets[2])
+    with pytest.raises(SyncError):
+        replica.apply(packets[1][:-1])
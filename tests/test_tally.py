@@ -0,0 +1,98 @@
+"""
+Agrégats d'inventaire (TotemTally) : après toute suite d'ajouts, de retraits,
+d'actions de jeu et d'annulations, ils égalent un recomptage complet.
+"""
+import collections
+import random
+
+from config import FACTION_NAMES, MAX_TOTEMS_PER_PLAYER, SYSTEM_COLORS
+from core.game_entities import Totem
+from core.game_state import Game, Player
+from core.policies import DIRECTIONS, POLICIES
+
+
+def _recount(totems):
+    """Agrégats de référence, recalculés depuis la liste des totems."""
+    factions = collections.Counter(totem.faction_id for totem in totems)
+    colors = collections.Counter(totem.couleur for totem in totems)
+    pairs = collections.Counter((totem.faction_id, totem.couleur) for totem in totems)
+    factions_per_color = {color: len({f for f, c in pairs if c == color}) for color in SYSTEM_COLORS}
+    colors_per_faction = {faction: len({c for f, c in pairs if f == faction}) for faction in FACTION_NAMES}
+    color_groups = sum(1 for count in colors.values() if count >= 3)
+    faction_groups = sum(1 for count in factions.values() if count >= 3)
+    return {
+        "faction_counts": {faction: factions[faction] for faction in FACTION_NAMES},
+        "color_counts": {color: colors[color] for color in SYSTEM_COLORS},
+        "pair_counts": dict(pairs),
+        "factions_per_color": factions_per_color,
+        "colors_per_faction": colors_per_faction,
+        "distinct_factions": len(factions),
+        "distinct_colors": len(colors),
+        "color_groups": color_groups,
+        "faction_groups": faction_groups,
+        "colors_with_three_factions": sum(1 for kinds in factions_per_color.values() if kinds >= 3),
+        "factions_with_three_colors": sum(1 for kinds in colors_per_faction.values() if kinds >= 3),
+        "total_value": sum(totem.valeur for totem in totems),
+        "bonus": 1000 * color_groups + (10.0 * faction_groups if faction_groups else 0),
+        "victory": (len(factions) == len(FACTION_NAMES) or len(colors) == len(SYSTEM_COLORS) or
+                    any(kinds >= 3 for kinds in factions_per_color.values()) or
+                    any(kinds >= 3 for kinds in colors_per_faction.values())),
+    }
+
+
+def _assert_matches_recount(player):
+    tally = player.tally
+    expected = _recount(player.totems)
+    actual = {name: getattr(tally, name) for name in expected if name not in ("bonus", "victory")}
+    actual["bonus"] = tally.bonus()
+    actual["victory"] = player.check_victory_conditions()
+    assert actual == expected
+    assert player.calculate_score() == expected["total_value"] + expected["bonus"]
+
+
+def test_tally_matches_a_recount_after_adds_and_removes():
+    rng = random.Random(0)
+    totems = [Totem(faction, color) for faction in FACTION_NAMES for color in SYSTEM_COLORS]
+    for _ in range(200):
+        player = Player(0, SYSTEM_COLORS[0])
+        for _ in range(rng.randrange(1, 40)):
+            if player.totems and (rng.random() < 0.4 or len(player.totems) == MAX_TOTEMS_PER_PLAYER):
+                player.remove_totem(rng.choice(player.totems))
+            else:
+                # Peu de totems distincts : les doublons et les seuils de 3 sont fréquents
+                player.add_totem(rng.choice(totems[:12]) if rng.random() < 0.5 else rng.choice(totems))
+            _assert_matches_recount(player)
+
+
+def test_tally_matches_a_recount_after_game_actions_and_undo():
+    for seed in range(20):
+        rng = random.Random(seed)
+        game = Game(num_players=1 + seed % 3, headless=True, seed=seed)
+        game.setup_game()
+        policy = POLICIES["greedy"](random.Random(seed))
+        for step in range(150):
+            if step % 25 == 0:
+                if game.journal.active:
+                    game.undo()
+                game.fork()
+            choice = rng.randrange(6)
+            if choice == 0:
+                game.move_ship(*rng.choice(DIRECTIONS))
+            elif choice == 1:
+                game.play_recolter()
+            elif choice == 2:
+                game.play_deposer()
+            elif choice == 3:
+                game.play_influencer()
+            elif choice == 4:
+                game.end_turn()
+            else:
+                # Tour joué par un bot : récoltes et dépôts effectifs, pas seulement des refus
+                policy.play_turn(game)
+                game.end_turn()
+            for player in game.players:
+                _assert_matches_recount(player)
+        if game.journal.active:
+            game.undo()
+        for player in game.players:
+            _assert_matches_recount(player)
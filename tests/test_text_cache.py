@@ -0,0 +1,72 @@
+"""
+Cache de texte (ui.text_cache) : éviction dans l'ordre LRU, surfaces
+partagées tant qu'elles restent en cache, et panneau d'information remis en
+page seulement quand les valeurs affichées changent.
+"""
+import pygame
+
+from config import FACTION_NAMES, SCREEN_HEIGHT, SCREEN_WIDTH, SYSTEM_COLORS, WHITE
+from core.game_state import Game
+from core.policies import DIRECTIONS
+from ui.text_cache import TextCache
+
+
+class CountingFont:
+    """Police factice : compte les rendus et renvoie un objet distinct à chaque appel."""
+
+    def __init__(self):
+        self.calls = []
+
+    def render(self, text, antialias, color):
+        self.calls.append((text, color))
+        return object()
+
+
+def test_evicts_the_least_recently_used_entry():
+    font = CountingFont()
+    cache = TextCache(max_entries=3)
+    a = cache.render(font, "a", WHITE)
+    b = cache.render(font, "b", WHITE)
+    cache.render(font, "c", WHITE)
+    assert cache.render(font, "a", WHITE) is a  # "a" redevient le plus récent ; "b" est le plus ancien
+    cache.render(font, "d", WHITE)  # Évince "b"
+    assert len(cache) == 3
+    assert cache.render(font, "a", WHITE) is a
+    assert cache.render(font, "b", WHITE) is not b  # Rendu à nouveau, évince "c"
+    cache.render(font, "c", WHITE)
+    assert font.calls == [("a", WHITE), ("b", WHITE), ("c", WHITE), ("d", WHITE), ("b", WHITE), ("c", WHITE)]
+    assert (cache.hits, cache.misses) == (2, 6)
+
+
+def test_key_includes_font_and_color():
+    first, second = CountingFont(), CountingFont()
+    cache = TextCache()
+    surfaces = {cache.render(font, "A", color) for font in (first, second) for color in SYSTEM_COLORS[:2]}
+    assert len(surfaces) == 4 and len(cache) == 4
+    cache.preload_glyphs(first, FACTION_NAMES, SYSTEM_COLORS)
+    assert len(first.calls) == len(FACTION_NAMES) * len(SYSTEM_COLORS)  # "A" déjà en cache pour 2 couleurs
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_panel_is_laid_out_only_when_it_changes(monkeypatch):
+    pygame.font.init()
+    game = Game(seed=1)
+    game.setup_game()
+    layouts = []
+    layout_panel = game._layout_panel
+
+    def counting_layout(surface, state):
+        layouts.append(state)
+        layout_panel(surface, state)
+    monkeypatch.setattr(game, "_layout_panel", counting_layout)
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    game.draw_ui(screen)
+    game.draw_ui(screen)
+    assert len(layouts) == 1
+    misses = game.text_cache.misses
+    assert any(game.move_ship(dx, dy) for dx, dy in DIRECTIONS)
+    game.draw_ui(screen)
+    assert len(layouts) == 2 and layouts[0] != layouts[1]
+    # Seules les lignes modifiées (position, points de mouvement, ...) sont rendues à nouveau
+    assert 0 < game.text_cache.misses - misses < 10
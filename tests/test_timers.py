@@ -0,0 +1,111 @@
+"""
+Échéancier des effets temporisés (core.timers) et son usage par la partie :
+révélation Observer, limite de temps par tour, horloge simulée, instantanés.
+"""
+import pytest
+
+from config import OBSERVER_REVEAL_SECONDS, STATE_GAME_OVER
+from core.game_state import Game
+from core.replay import ActionLog, Replayer
+from core.snapshot import load_game, save_game
+from core.timers import SimulatedClock, TimerScheduler
+
+
+def _game(turn_time_limit=None, seed=0):
+    game = Game(headless=True, seed=seed, clock=SimulatedClock(), turn_time_limit=turn_time_limit)
+    game.setup_game()
+    return game
+
+
+def _observe(game):
+    """Observe le premier système caché ; renvoie le système."""
+    hidden = next(system for system in game.game_board.systems if not system.revealed)
+    assert game.play_observer(hidden.position)
+    return hidden
+
+
+def test_scheduler_fires_in_deadline_order():
+    scheduler = TimerScheduler(SimulatedClock())
+    fired = []
+    scheduler.schedule(3, fired.append, "c")
+    scheduler.schedule(1, fired.append, "a")
+    cancelled = scheduler.schedule(2, fired.append, "cancelled")
+    scheduler.schedule(1, fired.append, "b")  # Même échéance : ordre de programmation
+    cancelled.cancel()
+    assert len(scheduler) == 3
+    assert scheduler.next_deadline() == 1
+    assert scheduler.run_due() == 0
+    assert scheduler.advance(2.5) == 2
+    assert fired == ["a", "b"] and scheduler.clock.now() == 2.5
+    assert scheduler.next_deadline() == 3  # L'échéance annulée est ignorée
+    scheduler.advance(10)
+    assert fired == ["a", "b", "c"] and scheduler.next_deadline() is None
+
+
+def test_callbacks_see_their_own_deadline_and_can_reschedule():
+    scheduler = TimerScheduler(SimulatedClock())
+    seen = []
+
+    def tick():
+        seen.append(scheduler.clock.now())
+        if len(seen) < 4:
+            scheduler.schedule(0.5, tick)
+
+    scheduler.schedule(0.5, tick)
+    scheduler.advance(10)
+    assert seen == [0.5, 1.0, 1.5, 2.0]
+
+
+def test_observer_reveal_expires_on_the_simulated_clock():
+    game = _game()
+    system = _observe(game)
+    assert game.time_until_deadline() == OBSERVER_REVEAL_SECONDS
+    game.timers.clock.advance(OBSERVER_REVEAL_SECONDS - 0.5)
+    game.update()
+    assert system.revealed
+    game.timers.advance(0.5)
+    assert not system.revealed and game.observer_system is None
+    assert game.next_deadline() is None
+
+
+def test_stale_observer_timer_does_not_cut_a_later_reveal():
+    game = _game()
+    first = _observe(game)
+    game.end_turn()  # Tour fini pendant la révélation : son échéance reste dans le tas
+    assert game.observer_system is None
+    first.revealed = False
+    game.timers.advance(1.0)
+    second = _observe(game)
+    game.timers.advance(OBSERVER_REVEAL_SECONDS - 0.5)  # Échéance de la première révélation passée
+    assert second.revealed and game.observer_system is second
+    game.timers.advance(0.5)
+    assert not second.revealed
+
+
+def test_turn_time_limit_ends_the_turn_and_replays():
+    game = _game(turn_time_limit=30)
+    log = ActionLog.attach(game)
+    game.move_ship(1, 0)
+    game.timers.advance(29)
+    assert game.turn_count == 1
+    game.timers.advance(1)
+    assert game.turn_count == 2
+    _observe(game)  # Deux effets temporisés simultanés : fin d'Observer puis limite du tour
+    game.timers.advance(30)
+    assert game.turn_count == 3 and game.observer_system is None
+    assert log.entries[-1] == ("end_turn",)
+    replayer = Replayer(log)
+    replayer.run()
+    assert save_game(replayer.game) == save_game(game)
+
+
+def test_snapshot_reschedules_the_remaining_reveal_time():
+    game = _game()
+    system = _observe(game)
+    game.timers.advance(0.5)
+    loaded = load_game(save_game(game), clock=SimulatedClock())
+    observed = loaded.game_board.systems[game.game_board.systems.index(system)]
+    assert loaded.observer_system is observed
+    assert loaded.time_until_deadline() == pytest.approx(OBSERVER_REVEAL_SECONDS - 0.5)
+    loaded.timers.advance(OBSERVER_REVEAL_SECONDS)
+    assert not observed.revealed and loaded.game_state != STATE_GAME_OVER
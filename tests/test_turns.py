@@ -0,0 +1,97 @@
+"""
+Parties à plusieurs joueurs : ordonnanceur circulaire (core.turns), état de tour
+par joueur, abandons et fin de partie.
+"""
+import random
+
+import pytest
+
+from config import PLAYER_ABANDONED, STATE_GAME_OVER
+from core.batch_engine import summarize_game
+from core.game_state import Game
+from core.policies import POLICIES
+from core.replay import ActionLog, Replayer
+from core.snapshot import load_game, save_game
+from core.turns import TurnScheduler
+
+
+def _new_game(num_players, seed=0):
+    game = Game(num_players=num_players, headless=True, seed=seed)
+    game.setup_game()
+    return game
+
+
+def test_scheduler_skips_removed_seats():
+    scheduler = TurnScheduler(5)
+    scheduler.remove(1)
+    scheduler.remove(3)
+    order = [scheduler.advance() for _ in range(6)]
+    assert order == [(2, False), (4, False), (0, True), (2, False), (4, False), (0, True)]
+    # Retrait du siège courant : son successeur joue ensuite, dans le même tour de table
+    scheduler.advance()
+    scheduler.remove(2)
+    assert scheduler.advance() == (4, False)
+    assert scheduler.active_count == 2
+
+
+def test_rounds_and_per_player_flags():
+    game = _new_game(3)
+    assert game.turn_count == 1 and game.get_player().id == 0
+    game.play_recolter()
+    game.movement_used = True
+    game.end_turn()
+    assert game.get_player().id == 1 and game.turn_count == 1
+    assert not game.movement_used and game.players[0].movement_used
+    game.end_turn()
+    game.end_turn()
+    assert game.get_player().id == 0 and game.turn_count == 2
+    assert not game.movement_used
+
+
+def test_game_over_when_all_others_abandon():
+    game = _new_game(4)
+    game.abandon(game.players[2])
+    assert game.get_player().id == 0
+    game.abandon()  # Le joueur courant abandonne : la main passe au siège 1
+    assert game.get_player().id == 1 and game.game_state != STATE_GAME_OVER
+    game.end_turn()
+    assert game.get_player().id == 3
+    game.abandon(game.players[1])
+    assert game.game_state == STATE_GAME_OVER
+    assert game.winner is game.players[3]
+    assert [p.status for p in game.players].count(PLAYER_ABANDONED) == 3
+
+
+def test_undo_restores_turn_order():
+    game = _new_game(3)
+    before = (game.scheduler.current, game.turn_count, list(game.scheduler.next), game.scheduler.active_count)
+    game.fork()
+    game.end_turn()
+    game.abandon()
+    game.end_turn()
+    game.undo()
+    after = (game.scheduler.current, game.turn_count, list(game.scheduler.next), game.scheduler.active_count)
+    assert after == before
+    assert all(p.status != PLAYER_ABANDONED for p in game.players)
+
+
+@pytest.mark.parametrize("num_players", [2, 5, 7])
+def test_bot_table_snapshot_and_replay(num_players):
+    game = Game(num_players=num_players, headless=True, seed=num_players)
+    log = ActionLog.attach(game)
+    game.setup_game()
+    rng = random.Random(num_players)
+    policies = [POLICIES["greedy"](random.Random(rng.getrandbits(64))) for _ in range(num_players)]
+    while game.game_state != STATE_GAME_OVER:
+        if game.turn_count == 6 and game.get_player().id == 1:
+            game.abandon()
+            continue
+        policies[game.scheduler.current].play_turn(game)
+        game.end_turn()
+        if game.turn_count == 4:
+            data = save_game(game)
+            assert save_game(load_game(data)) == data
+    replayed = Replayer(log).run()
+    assert summarize_game(replayed) == summarize_game(game)
+    assert [(p.score, p.status, p.vaisseau.position) for p in replayed.players] == \
+        [(p.score, p.status, p.vaisseau.position) for p in game.players]
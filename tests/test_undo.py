@@ -0,0 +1,85 @@
+"""
+Points de sauvegarde de la partie (Game.fork/undo, core.undo) : toute suite
+d'actions, Observer et échéances comprises, est annulée octet pour octet.
+"""
+import random
+
+from core.game_state import Game
+from core.policies import DIRECTIONS
+from core.snapshot import save_game
+from core.timers import SimulatedClock
+from core.undo import UndoJournal
+
+
+def _game(seed=0, num_players=1, turn_time_limit=None):
+    game = Game(num_players=num_players, headless=True, seed=seed, clock=SimulatedClock(),
+                turn_time_limit=turn_time_limit)
+    game.setup_game()
+    return game
+
+
+def _random_action(game, rng):
+    """Joue une action au hasard, Observer et écoulement du temps compris."""
+    choice = rng.randrange(7)
+    if choice == 0:
+        game.move_ship(*rng.choice(DIRECTIONS))
+    elif choice == 1:
+        game.play_recolter()
+    elif choice == 2:
+        game.play_deposer()
+    elif choice == 3:
+        game.play_influencer()
+    elif choice == 4:
+        hidden = game.game_board.systems_in(game.game_board.hidden_mask())
+        if hidden:
+            game.play_observer(rng.choice(hidden).position)
+    elif choice == 5:
+        game.timers.advance(rng.choice((0.5, 1.0, 3.0)))
+    else:
+        game.end_turn()
+
+
+def test_journal_restores_attributes_items_and_lists():
+    class Box:
+        value = 1
+    journal = UndoJournal()
+    box, mapping = Box(), {"key": [1, 2]}
+    journal.record_attr(box, 'value')  # Sans point de sauvegarde : rien n'est mémorisé
+    assert not journal.entries
+    journal.fork()
+    journal.record_attr(box, 'value')
+    box.value = 2
+    journal.writable_item(mapping, "key").append(3)
+    journal.undo()
+    assert box.value == 1 and mapping == {"key": [1, 2]}
+
+
+def test_observer_is_undone_with_its_timer():
+    game = _game(seed=3)
+    before = save_game(game)
+    hidden = game.game_board.systems_in(game.game_board.hidden_mask())[0]
+    game.fork()
+    assert game.play_observer(hidden.position)
+    game.undo()
+    assert save_game(game) == before
+    assert not hidden.revealed and game.observer_system is None and not game.action_observer_used
+    assert game.next_deadline() is None  # Échéance de la branche annulée
+    # L'action reste jouable, et sa nouvelle échéance n'est pas coupée par l'ancienne
+    assert game.play_observer(hidden.position)
+    game.timers.advance(1.0)
+    assert hidden.revealed
+
+
+def test_random_branches_are_undone_byte_for_byte():
+    for seed in range(30):
+        rng = random.Random(seed)
+        game = _game(seed, num_players=1 + seed % 3, turn_time_limit=5 if seed % 2 else None)
+        for _ in range(rng.randrange(10)):
+            _random_action(game, rng)
+        game.timers.advance(2.5)  # Aucune révélation en cours au point de sauvegarde
+        before = save_game(game)
+        game.fork()
+        for _ in range(rng.randrange(1, 40)):
+            _random_action(game, rng)
+        game.undo()
+        assert save_game(game) == before, seed
@@ -0,0 +1,81 @@
+"""
+Visibilité des systèmes en bitset (GameBoard.revealed_mask), index par couleur
+des capitales et planètes, et brouillard de guerre par joueur (seen_mask).
+"""
+import random
+
+import pygame
+
+from config import BLACK, SCREEN_HEIGHT, SCREEN_WIDTH, SYSTEM_COLORS
+from core.game_state import Game
+from core.policies import DIRECTIONS
+from core.snapshot import load_game, save_game
+from ui.renderer import DirtyRectRenderer
+
+
+def _game(num_players=1, seed=0, fog_of_war=False, headless=True):
+    game = Game(num_players=num_players, headless=headless, seed=seed, fog_of_war=fog_of_war)
+    game.setup_game()
+    return game
+
+
+def test_bitset_follows_revealed_flags_and_undo():
+    game = _game()
+    board = game.game_board
+    assert board.revealed_mask == sum(1 << system.index for system in board.systems if system.revealed)
+    hidden = board.systems_in(board.hidden_mask())
+    assert hidden == [system for system in board.systems if not system.revealed]
+    before = board.revealed_mask
+    game.fork()
+    for system in hidden[:3]:
+        board.reveal_system(system.position)
+    assert board.revealed_mask == before | sum(1 << system.index for system in hidden[:3])
+    game.undo()
+    assert board.revealed_mask == before and not any(system.revealed for system in hidden)
+
+
+def test_color_indexes_match_a_full_scan():
+    board = _game(seed=4).game_board
+    for color in SYSTEM_COLORS:
+        systems = [system for system in board.systems if system.couleur == color]
+        assert board.capitals[color] == next(system for system in systems if system.est_capitale)
+        assert board.planets.get(color, []) == [system for system in systems if not system.est_capitale]
+        assert board.systems_in(board.color_masks[color]) == systems
+        assert board.is_color_revealed(color) == board.capitals[color].revealed
+    assert board.systems_in(board.capitals_mask) == [system for system in board.systems if system.est_capitale]
+
+
+def test_fog_of_war_shows_each_player_only_what_they_saw():
+    game = _game(num_players=2, seed=7, fog_of_war=True)
+    board = game.game_board
+    first, second = game.players
+    # Chacun ne voit que son système de départ, révélé pour tous
+    assert game.view_mask(first) != game.view_mask(second)
+    assert game.view_mask(first) | game.view_mask(second) == board.revealed_mask
+    hidden = board.systems_in(board.hidden_mask())[0]
+    assert game.play_observer(hidden.position)
+    assert game.view_mask(first) >> hidden.index & 1 and not game.view_mask(second) >> hidden.index & 1
+    game.expire_observer()
+    assert not game.view_mask(first) >> hidden.index & 1
+    # Révélé ensuite par un autre joueur : le premier le connaît déjà
+    hidden.revealed = True
+    assert game.view_mask(first) >> hidden.index & 1 and not game.view_mask(second) >> hidden.index & 1
+    loaded = load_game(save_game(game))
+    assert [player.seen_mask for player in loaded.players] == [first.seen_mask, second.seen_mask]
+
+
+def test_renderer_matches_full_draw_under_fog_of_war():
+    pygame.font.init()
+    game = _game(num_players=2, seed=5, fog_of_war=True, headless=False)
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    reference = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    renderer = DirtyRectRenderer(game, screen)
+    rng = random.Random(5)
+    for step in range(80):
+        game.move_ship(*rng.choice(DIRECTIONS))
+        if step % 5 == 4:
+            game.end_turn()  # Changement de joueur : sa vue remplace celle du précédent
+        renderer.render()
+        reference.fill(BLACK)
+        game.draw(reference)
+        assert pygame.image.tobytes(screen, "RGB") == pygame.image.tobytes(reference, "RGB")
@@ -0,0 +1,236 @@
+# ui/camera.py
+"""
+Caméra du plateau : défilement et zoom d'une zone d'affichage (viewport) sur
+la grille. Toutes les conversions grille <-> écran du rendu et de la sélection
+à la souris passent par elle, ce qui permet de ne dessiner que les cases
+visibles et d'afficher des plateaux de plusieurs centaines de cases de côté.
+
+Avec les valeurs par défaut (zoom 1, plateau entièrement visible), la caméra
+reproduit exactement la disposition historique (BOARD_OFFSET_*, CELL_SIZE).
+"""
+import math
+
+import pygame
+
+from config import (BOARD_OFFSET_X, BOARD_OFFSET_Y, CELL_SIZE, VIEWPORT_WIDTH, VIEWPORT_HEIGHT,
+                    CAMERA_ZOOM_MIN, CAMERA_ZOOM_MAX, CAMERA_ZOOM_STEP, CAMERA_PAN_STEP,
+                    LOD_GRID_MIN_CELL, LOD_DETAIL_MIN_CELL)
+
+CLIP_MARGIN = 3  # Le marqueur d'origine déborde de 2 pixels avec un trait de 3 (cf. SystemePlanetaire.get_rect)
+
+# Touches de défilement (avec Maj : les flèches seules déplacent le vaisseau)
+PAN_KEYS = {
+    pygame.K_LEFT: (-1, 0),
+    pygame.K_RIGHT: (1, 0),
+    pygame.K_UP: (0, -1),
+    pygame.K_DOWN: (0, 1),
+}
+ZOOM_KEYS = {
+    pygame.K_PLUS: 1,
+    pygame.K_EQUALS: 1,
+    pygame.K_KP_PLUS: 1,
+    pygame.K_MINUS: -1,
+    pygame.K_KP_MINUS: -1,
+}
+
+
+class Camera:
+    """
+    Transformation grille -> écran : une case (gx, gy) commence au pixel
+    viewport.topleft + (gx, gy) * cell_size - scroll. scroll est le décalage, en
+    pixels à l'échelle courante, du coin haut gauche du plateau par rapport à
+    celui de la zone d'affichage (négatif quand le plateau, plus petit, est centré).
+    """
+
+    def __init__(self, board_size, viewport=None, cell_size=CELL_SIZE):
+        if viewport is None:
+            viewport = (BOARD_OFFSET_X, BOARD_OFFSET_Y, VIEWPORT_WIDTH, VIEWPORT_HEIGHT)
+        self.board_size = board_size
+        self.viewport = pygame.Rect(viewport)
+        # Zone de dessin autorisée : la zone d'affichage plus la bordure de la grille et les contours
+        self.clip_rect = self.viewport.inflate(2 * CLIP_MARGIN, 2 * CLIP_MARGIN)
+        self.base_cell_size = cell_size
+        self.zoom = 1.0
+        self.scroll_x = 0.0
+        self.scroll_y = 0.0
+        self.version = 0  # Incrémenté à chaque défilement ou zoom (redessin complet)
+        self._drag = False
+        self._clamp()
+
+    @property
+    def cell_size(self):
+        """Taille d'une case à l'écran, en pixels (non entière selon le zoom)."""
+        return self.base_cell_size * self.zoom
+
+    @property
+    def dragging(self):
+        """Vrai pendant un glisser avec le bouton droit (défilement à la souris)."""
+        return self._drag
+
+    @property
+    def show_grid(self):
+        """Niveau de détail : lignes de grille seulement si les cases sont assez grandes."""
+        return self.cell_size >= LOD_GRID_MIN_CELL
+
+    @property
+    def detailed(self):
+        """Niveau de détail : contours et marqueurs des systèmes."""
+        return self.cell_size >= LOD_DETAIL_MIN_CELL
+
+    # --- Conversions ---
+
+    def to_screen(self, gx, gy):
+        """Pixel écran du coin haut gauche de la case (gx, gy)."""
+        size = self.cell_size
+        return (self.viewport.x + math.floor(gx * size - self.scroll_x),
+                self.viewport.y + math.floor(gy * size - self.scroll_y))
+
+    def rect(self, position, size=(1, 1)):
+        """
+        Rectangle écran de size cases à partir de position : les bords sont ceux des
+        cases voisines, sans trou ni recouvrement. Au moins un pixel de côté.
+        """
+        x0, y0 = self.to_screen(*position)
+        x1, y1 = self.to_screen(position[0] + size[0], position[1] + size[1])
+        return pygame.Rect(x0, y0, max(1, x1 - x0), max(1, y1 - y0))
+
+    def rects(self, positions, size=(1, 1)):
+        """rect() pour de nombreuses positions (rendu des petits niveaux de zoom)."""
+        floor = math.floor
+        cell = self.cell_size
+        left, top = self.viewport.topleft
+        scroll_x, scroll_y = self.scroll_x, self.scroll_y
+        width, height = size
+        result = []
+        for x, y in positions:
+            x0 = floor(x * cell - scroll_x)
+            y0 = floor(y * cell - scroll_y)
+            result.append(pygame.Rect(left + x0, top + y0,
+                                      max(1, floor((x + width) * cell - scroll_x) - x0),
+                                      max(1, floor((y + height) * cell - scroll_y) - y0)))
+        return result
+
+    def screen_to_grid(self, screen_pos):
+        """Case sous un pixel écran, ou None hors de la zone d'affichage ou du plateau."""
+        if not self.viewport.collidepoint(screen_pos):
+            return None
+        # Inverse exact de to_screen : dernière case dont le premier pixel est <= screen_pos
+        size = self.cell_size
+        grid_x = math.ceil((screen_pos[0] - self.viewport.x + 1 + self.scroll_x) / size) - 1
+        grid_y = math.ceil((screen_pos[1] - self.viewport.y + 1 + self.scroll_y) / size) - 1
+        if 0 <= grid_x < self.board_size[0] and 0 <= grid_y < self.board_size[1]:
+            return grid_x, grid_y
+        return None
+
+    def visible_range(self):
+        """Cases au moins en partie visibles : (x0, y0, x1, y1), bornes hautes exclues."""
+        size = self.cell_size
+        return (max(0, math.floor(self.scroll_x / size)),
+                max(0, math.floor(self.scroll_y / size)),
+                min(self.board_size[0], math.ceil((self.scroll_x + self.viewport.width) / size)),
+                min(self.board_size[1], math.ceil((self.scroll_y + self.viewport.height) / size)))
+
+    # --- Déplacements de la vue ---
+
+    def _clamp(self):
+        """Garde le plateau dans la vue ; un plateau plus petit que la vue est centré."""
+        for axis, board_cells, view in ((0, self.board_size[0], self.viewport.width),
+                                        (1, self.board_size[1], self.viewport.height)):
+            extent = board_cells * self.cell_size
+            name = ('scroll_x', 'scroll_y')[axis]
+            if extent <= view:
+                value = (extent - view) / 2
+            else:
+                value = min(max(getattr(self, name), 0.0), extent - view)
+            setattr(self, name, value)
+
+    def _moved(self, previous):
+        if previous != (self.zoom, self.scroll_x, self.scroll_y):
+            self.version += 1
+            return True
+        return False
+
+    def pan(self, dx, dy):
+        """Fait défiler la vue de (dx, dy) pixels. Renvoie True si elle a bougé."""
+        previous = (self.zoom, self.scroll_x, self.scroll_y)
+        self.scroll_x += dx
+        self.scroll_y += dy
+        self._clamp()
+        return self._moved(previous)
+
+    def set_zoom(self, zoom, anchor=None):
+        """
+        Change le zoom (borné à [CAMERA_ZOOM_MIN, CAMERA_ZOOM_MAX]) en gardant fixe le
+        point du plateau sous anchor (pixel écran, centre de la vue par défaut).
+        """
+        previous = (self.zoom, self.scroll_x, self.scroll_y)
+        ax, ay = anchor if anchor is not None else self.viewport.center
+        ax -= self.viewport.x
+        ay -= self.viewport.y
+        world_x = (ax + self.scroll_x) / self.cell_size
+        world_y = (ay + self.scroll_y) / self.cell_size
+        self.zoom = min(max(zoom, CAMERA_ZOOM_MIN), CAMERA_ZOOM_MAX)
+        self.scroll_x = world_x * self.cell_size - ax
+        self.scroll_y = world_y * self.cell_size - ay
+        self._clamp()
+        return self._moved(previous)
+
+    def zoom_by(self, steps, anchor=None):
+        """Zoome de steps crans de CAMERA_ZOOM_STEP (négatif : dézoome)."""
+        return self.set_zoom(self.zoom * CAMERA_ZOOM_STEP ** steps, anchor)
+
+    def fit(self):
+        """Vue d'ensemble : zoom qui fait tenir tout le plateau dans la vue."""
+        zoom = min(self.viewport.width / (self.board_size[0] * self.base_cell_size),
+                   self.viewport.height / (self.board_size[1] * self.base_cell_size))
+        return self.set_zoom(min(1.0, zoom))
+
+    def center_on(self, position):
+        """Centre la vue sur une case (autant que le permettent les bords du plateau)."""
+        previous = (self.zoom, self.scroll_x, self.scroll_y)
+        size = self.cell_size
+        self.scroll_x = (position[0] + 0.5) * size - self.viewport.width / 2
+        self.scroll_y = (position[1] + 0.5) * size - self.viewport.height / 2
+        self._clamp()
+        return self._moved(previous)
+
+    def keep_visible(self, position):
+        """Recentre la vue sur une case si elle n'y est pas entièrement visible."""
+        if self.viewport.contains(self.rect(position)):
+            return False
+        return self.center_on(position)
+
+    # --- Entrées ---
+
+    def handle_event(self, event):
+        """
+        Molette ou +/- : zoom (sous le curseur pour la molette) ; Maj + flèches ou
+        glisser avec le bouton droit : défilement ; Origine : vue d'ensemble.
+        Renvoie True si l'événement a été consommé par la caméra.
+        """
+        if event.type == pygame.MOUSEWHEEL:
+            mouse = pygame.mouse.get_pos()
+            self.zoom_by(event.y, mouse if self.viewport.collidepoint(mouse) else None)
+            return True
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 3 and self.viewport.collidepoint(event.pos):
+            self._drag = True
+            return True
+        if event.type == pygame.MOUSEBUTTONUP and event.button == 3 and self._drag:
+            self._drag = False
+            return True
+        if event.type == pygame.MOUSEMOTION:
+            if self._drag:
+                self.pan(-event.rel[0], -event.rel[1])
+            return True
+        if event.type == pygame.KEYDOWN:
+            if event.key in PAN_KEYS and event.mod & pygame.KMOD_SHIFT:
+                dx, dy = PAN_KEYS[event.key]
+                self.pan(dx * self.viewport.width * CAMERA_PAN_STEP, dy * self.viewport.height * CAMERA_PAN_STEP)
+                return True
+            if event.key in ZOOM_KEYS:
+                self.zoom_by(ZOOM_KEYS[event.key])
+                return True
+            if event.key == pygame.K_HOME:
+                self.fit()
+                return True
+        return False
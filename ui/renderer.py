@@ -0,0 +1,130 @@
+# ui/renderer.py
+"""
+Rendu par rectangles sales : la grille est pré-rendue une fois sur une couche
+statique, puis chaque image ne redessine que les systèmes dont l'état révélé
+a changé, les cases quittées et atteintes par les vaisseaux, et le panneau
+d'information. Seuls ces rectangles sont transmis à pygame.display.update.
+
+Le plateau est vu à travers la caméra de la partie : seuls les systèmes visibles
+sont suivis et dessinés, et un défilement ou un zoom force un redessin complet.
+"""
+import pygame
+
+from config import BLACK
+from core.profiler import NULL_SECTION
+
+
+class DirtyRectRenderer:
+    """Redessine uniquement ce qui a changé depuis l'image précédente."""
+
+    def __init__(self, game, screen, profiler=None):
+        self.game = game
+        self.screen = screen
+        self.profiler = profiler  # FrameProfiler optionnel : phases board / ships / ui
+        self.board_layer = None  # Fond noir + grille, reconstruit si la disposition change
+        self.panel_rect = None
+        self._layout_version = None
+        self._camera_version = None
+        self._game_state = None
+        self._visible_systems = []  # Systèmes dans la vue lors du dernier redessin complet
+        self._view = 0  # Masque de visibilité (Game.view_mask) lors du dernier dessin
+        self._ship_positions = {}  # Vaisseau -> position lors du dernier dessin
+
+    def invalidate(self):
+        """Force un redessin complet à la prochaine image."""
+        self._layout_version = None
+
+    def _needs_full_redraw(self):
+        return (self.board_layer is None or
+                len(self._ship_positions) != len(self._ships()) or
+                self._layout_version != self.game.game_board.layout_version or
+                self._camera_version != self.game.camera.version or
+                self._game_state != self.game.game_state)
+
+    def _build_static_layer(self):
+        camera = self.game.camera
+        self.board_layer = pygame.Surface(self.screen.get_size())
+        self.board_layer.fill(BLACK)
+        self.board_layer.set_clip(camera.clip_rect)
+        self.game.game_board.draw_grid(self.board_layer, camera)
+        self.board_layer.set_clip(None)
+        panel_x = camera.viewport.right + 1
+        width, height = self.screen.get_size()
+        self.panel_rect = pygame.Rect(panel_x, 0, max(0, width - panel_x), height)
+
+    def _section(self, name):
+        return self.profiler.section(name) if self.profiler else NULL_SECTION
+
+    def _remember_state(self):
+        game = self.game
+        self._layout_version = game.game_board.layout_version
+        self._camera_version = game.camera.version
+        self._game_state = game.game_state
+        self._view = game.view_mask()
+        self._ship_positions = {ship: ship.position for ship in self._ships()}
+
+    def _ships(self):
+        """Vaisseaux des joueurs encore en jeu (retirer un joueur force un redessin complet)."""
+        return [player.vaisseau for player in self.game.active_players() if player.vaisseau]
+
+    def render(self):
+        """Dessine l'image courante et renvoie la liste des rectangles modifiés."""
+        camera = self.game.camera
+        board = self.game.game_board
+        if self._needs_full_redraw():
+            with self._section("board"):
+                self._build_static_layer()
+                self.screen.blit(self.board_layer, (0, 0))
+                self._visible_systems = board.systems_in_view(camera)
+                view = self.game.view_mask()
+                self.screen.set_clip(camera.clip_rect)
+                for system in self._visible_systems:
+                    system.draw(self.screen, board.font, camera, view >> system.index & 1)
+            with self._section("ships"):
+                for ship in self._ships():
+                    ship.draw(self.screen, camera)
+                self.screen.set_clip(None)
+            with self._section("ui"):
+                self.game.draw_ui(self.screen)
+            self._remember_state()
+            return [self.screen.get_rect()]
+
+        ships = self._ships()
+        view = self.game.view_mask()
+        # Bits des systèmes dont l'état affiché a changé ; ceux hors de la vue sont ignorés
+        # (ils n'y entrent qu'avec un redessin complet)
+        changed = view ^ self._view
+        dirty = [system.get_rect(camera) for system in self._visible_systems
+                 if changed >> system.index & 1] if changed else []
+        for ship in ships:
+            previous = self._ship_positions.get(ship)
+            if ship.position != previous:
+                if previous is not None:
+                    dirty.append(ship.get_rect(camera, previous))
+                dirty.append(ship.get_rect(camera))
+        # Rien n'est dessiné hors de la vue
+        dirty = [rect.clip(camera.clip_rect) for rect in dirty]
+        dirty = [rect for rect in dirty if rect]
+
+        # Restaurer le fond puis redessiner ce qui recoupe les zones sales
+        self.screen.set_clip(camera.clip_rect)
+        with self._section("board"):
+            for rect in dirty:
+                self.screen.blit(self.board_layer, rect, rect)
+            if dirty:
+                for system in self._visible_systems:
+                    if system.get_rect(camera).collidelist(dirty) != -1:
+                        system.draw(self.screen, board.font, camera, view >> system.index & 1)
+        with self._section("ships"):
+            for ship in ships:
+                if ship.get_rect(camera).collidelist(dirty) != -1:
+                    ship.draw(self.screen, camera)
+        self.screen.set_clip(None)
+
+        with self._section("ui"):
+            self.screen.blit(self.board_layer, self.panel_rect, self.panel_rect)
+            self.game.draw_ui(self.screen)
+        dirty.append(self.panel_rect)
+
+        self._remember_state()
+        return dirty
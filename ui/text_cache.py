@@ -0,0 +1,44 @@
+# ui/text_cache.py
+"""
+Cache des surfaces de texte rendues, indexé par (police, texte, couleur),
+avec éviction LRU. Les lettres de faction peuvent être pré-rendues pour
+chaque couleur de système.
+"""
+import collections
+
+
+class TextCache:
+    """Rend chaque (police, texte, couleur) une seule fois tant qu'il reste en cache."""
+
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self._surfaces = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color):
+        """Équivalent de font.render(text, True, color), mis en cache."""
+        key = (font, text, color)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        self.misses += 1
+        surface = font.render(text, True, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def preload_glyphs(self, font, letters, colors):
+        """Pré-rend chaque lettre dans chaque couleur (ex. lettres de faction des racks)."""
+        for letter in letters:
+            for color in colors:
+                self.render(font, letter, color)
+
+    def clear(self):
+        self._surfaces.clear()
+
+    def __len__(self):
+        return len(self._surfaces)